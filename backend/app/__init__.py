@@ -5,6 +5,13 @@ from flask import Flask
 from .auth import init_auth
 from .routes import api_bp
 from .services.database import configure_database, db, migrate
+from .services.json_codec import configure_json
+from .services.openapi_spec import configure_openapi_spec
+from .services.operation_status import configure_operation_status
+from .services.product_cache import configure_products_cache
+from .services.product_count import configure_product_count
+from .services.products import configure_products
+from .services.readiness import configure_readiness
 from .services.redis import configure_redis
 
 load_dotenv()
@@ -15,8 +22,14 @@ def create_app(test_config: Mapping[str, object] | None = None) -> Flask:
     if test_config:
         app.config.update(test_config)
 
+    configure_json(app)
     configure_database(app)
     configure_redis(app)
+    configure_product_count(app)
+    configure_products_cache(app)
+    configure_products(app)
+    configure_operation_status(app)
+    configure_readiness(app)
 
     db.init_app(app)
 
@@ -25,6 +38,7 @@ def create_app(test_config: Mapping[str, object] | None = None) -> Flask:
     migrate.init_app(app, db)
     init_auth(app)
     app.register_blueprint(api_bp)
+    configure_openapi_spec(app)
 
     return app
 
@@ -2,7 +2,22 @@ import os
 
 from flask import Flask
 
+from .passwords import PasswordHasher
+from .token_cache import TokenCache
+
 DEFAULT_JWT_EXPIRES_SECONDS = 3600
+DEFAULT_JWT_CACHE_ENABLED = True
+DEFAULT_JWT_CACHE_MAX_SIZE = 1024
+DEFAULT_PASSWORD_HASH_METHOD = "scrypt:32768:8:1"
+DEFAULT_PASSWORD_HASH_POOL_SIZE = 2
+ALLOWED_PASSWORD_HASH_ALGORITHMS = {"scrypt", "pbkdf2"}
+
+
+def _parse_bool(value: str | None, default: bool = False) -> bool:
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    return normalized in {"1", "true", "yes", "on"}
 
 
 def _read_positive_int(value: str | None, default: int) -> int:
@@ -17,6 +32,28 @@ def _read_positive_int(value: str | None, default: int) -> int:
         return default
 
 
+def _read_non_negative_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+        if parsed < 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def _read_password_hash_method(value: str | None) -> str:
+    if value is None:
+        return DEFAULT_PASSWORD_HASH_METHOD
+
+    normalized = value.strip()
+    if normalized.split(":", 1)[0] not in ALLOWED_PASSWORD_HASH_ALGORITHMS:
+        return DEFAULT_PASSWORD_HASH_METHOD
+    return normalized
+
+
 def init_auth(app: Flask) -> None:
     secret = app.config.get("JWT_SECRET_KEY") or os.getenv(
         "JWT_SECRET_KEY",
@@ -29,5 +66,37 @@ def init_auth(app: Flask) -> None:
         DEFAULT_JWT_EXPIRES_SECONDS,
     )
 
+    cache_enabled = _parse_bool(
+        str(app.config.get("JWT_CACHE_ENABLED"))
+        if app.config.get("JWT_CACHE_ENABLED") is not None
+        else os.getenv("JWT_CACHE_ENABLED"),
+        default=DEFAULT_JWT_CACHE_ENABLED,
+    )
+    cache_max_size = _read_positive_int(
+        str(app.config.get("JWT_CACHE_MAX_SIZE"))
+        if app.config.get("JWT_CACHE_MAX_SIZE") is not None
+        else os.getenv("JWT_CACHE_MAX_SIZE"),
+        DEFAULT_JWT_CACHE_MAX_SIZE,
+    )
+
+    password_hash_method = _read_password_hash_method(
+        app.config.get("PASSWORD_HASH_METHOD") or os.getenv("PASSWORD_HASH_METHOD"),
+    )
+    password_hash_pool_size = _read_non_negative_int(
+        str(app.config.get("PASSWORD_HASH_POOL_SIZE"))
+        if app.config.get("PASSWORD_HASH_POOL_SIZE") is not None
+        else os.getenv("PASSWORD_HASH_POOL_SIZE"),
+        DEFAULT_PASSWORD_HASH_POOL_SIZE,
+    )
+
     app.config["JWT_SECRET_KEY"] = secret
     app.config["JWT_EXPIRES_SECONDS"] = expires_in_seconds
+    app.config["JWT_CACHE_ENABLED"] = cache_enabled
+    app.config["JWT_CACHE_MAX_SIZE"] = cache_max_size
+    app.extensions["jwt_token_cache"] = TokenCache(cache_max_size) if cache_enabled else None
+    app.config["PASSWORD_HASH_METHOD"] = password_hash_method
+    app.config["PASSWORD_HASH_POOL_SIZE"] = password_hash_pool_size
+    app.extensions["password_hasher"] = PasswordHasher(
+        password_hash_method,
+        password_hash_pool_size,
+    )
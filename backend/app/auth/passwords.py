@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    def __init__(self, method: str, pool_size: int):
+        self.method = method
+        self.pool_size = pool_size
+        self._method_prefix: str | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.pool_size,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _run(self, func: Callable[..., T], *args: object) -> T:
+        if self.pool_size <= 0:
+            return func(*args)
+        return self._get_executor().submit(func, *args).result()
+
+    def hash(self, raw_password: str) -> str:
+        return self._run(generate_password_hash, raw_password, self.method)
+
+    def verify(self, raw_password: str, password_hash: str) -> bool:
+        return self._run(check_password_hash, password_hash, raw_password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        if self._method_prefix is None:
+            self._method_prefix = self.hash("").split("$", 1)[0]
+        return password_hash.split("$", 1)[0] != self._method_prefix
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -3,10 +3,12 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 import jwt
-from flask import current_app
+from flask import current_app, has_app_context
 from jwt import ExpiredSignatureError, InvalidTokenError
 from werkzeug.security import check_password_hash, generate_password_hash
 
+from .passwords import PasswordHasher
+
 JWT_ALGORITHM = "HS256"
 
 
@@ -14,12 +16,31 @@ class AuthError(Exception):
     pass
 
 
+def _get_password_hasher() -> PasswordHasher | None:
+    if not has_app_context():
+        return None
+    return current_app.extensions.get("password_hasher")
+
+
 def hash_password(raw_password: str) -> str:
-    return generate_password_hash(raw_password)
+    password_hasher = _get_password_hasher()
+    if password_hasher is None:
+        return generate_password_hash(raw_password)
+    return password_hasher.hash(raw_password)
 
 
 def verify_password(raw_password: str, password_hash: str) -> bool:
-    return check_password_hash(password_hash, raw_password)
+    password_hasher = _get_password_hasher()
+    if password_hasher is None:
+        return check_password_hash(password_hash, raw_password)
+    return password_hasher.verify(raw_password, password_hash)
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    password_hasher = _get_password_hasher()
+    if password_hasher is None:
+        return False
+    return password_hasher.needs_rehash(password_hash)
 
 
 def create_access_token(user_id: int, identifier: str) -> str:
@@ -36,6 +57,12 @@ def create_access_token(user_id: int, identifier: str) -> str:
 
 
 def decode_access_token(token: str) -> dict[str, object]:
+    token_cache = current_app.extensions.get("jwt_token_cache")
+    if token_cache is not None:
+        cached_payload = token_cache.get(token)
+        if cached_payload is not None:
+            return cached_payload
+
     secret = current_app.config["JWT_SECRET_KEY"]
     try:
         payload = jwt.decode(token, secret, algorithms=[JWT_ALGORITHM])
@@ -46,4 +73,14 @@ def decode_access_token(token: str) -> dict[str, object]:
 
     if "sub" not in payload:
         raise AuthError("invalid_token")
+
+    if token_cache is not None:
+        token_cache.put(token, payload)
     return payload
+
+
+def get_token_cache_stats() -> dict[str, object]:
+    token_cache = current_app.extensions.get("jwt_token_cache")
+    if token_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **token_cache.stats()}
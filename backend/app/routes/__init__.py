@@ -2,4 +2,4 @@ from flask import Blueprint
 
 api_bp = Blueprint("api", __name__)
 
-from . import auth, docs, health, products
+from . import auth, docs, health, metrics, operations, products
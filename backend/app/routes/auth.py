@@ -1,18 +1,51 @@
 from __future__ import annotations
 
 from flask import current_app, jsonify, request
-from sqlalchemy import func
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from . import api_bp
 from ..auth.decorators import require_auth
-from ..auth.service import create_access_token, hash_password, verify_password
+from ..auth.service import (
+    create_access_token,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
 from ..services.database import db
 from ..models import User
 
 MIN_PASSWORD_LENGTH = 8
 
 
+def _find_identifier_conflict(normalized_email: str, normalized_name: str) -> str | None:
+    emails = db.session.execute(
+        select(func.lower(User.email))
+        .where(
+            or_(
+                func.lower(User.email) == normalized_email,
+                func.lower(User.name) == normalized_name.lower(),
+            )
+        )
+        .limit(2)
+    ).scalars().all()
+    if normalized_email in emails:
+        return "email_already_exists"
+    if emails:
+        return "name_already_exists"
+    return None
+
+
+def _find_user_by_identifier(identifier_lower: str) -> User | None:
+    matches_email = func.lower(User.email) == identifier_lower
+    return (
+        User.query.filter(or_(matches_email, func.lower(User.name) == identifier_lower))
+        .order_by(matches_email.desc())
+        .limit(1)
+        .one_or_none()
+    )
+
+
 def _build_auth_response(user: User, status_code: int):
     access_token = create_access_token(user_id=user.id, identifier=user.name)
     return (
@@ -50,17 +83,9 @@ def register():
     if len(password) < MIN_PASSWORD_LENGTH:
         return jsonify({"error": "password_too_short"}), 400
 
-    existing_email = User.query.filter(
-        func.lower(User.email) == normalized_email
-    ).one_or_none()
-    if existing_email is not None:
-        return jsonify({"error": "email_already_exists"}), 409
-
-    existing_name = User.query.filter(
-        func.lower(User.name) == normalized_name.lower()
-    ).one_or_none()
-    if existing_name is not None:
-        return jsonify({"error": "name_already_exists"}), 409
+    conflict = _find_identifier_conflict(normalized_email, normalized_name)
+    if conflict is not None:
+        return jsonify({"error": conflict}), 409
 
     user = User(
         name=normalized_name,
@@ -72,17 +97,9 @@ def register():
         db.session.commit()
     except IntegrityError:
         db.session.rollback()
-        conflicting_email = User.query.filter(
-            func.lower(User.email) == normalized_email
-        ).one_or_none()
-        if conflicting_email is not None:
-            return jsonify({"error": "email_already_exists"}), 409
-
-        conflicting_name = User.query.filter(
-            func.lower(User.name) == normalized_name.lower()
-        ).one_or_none()
-        if conflicting_name is not None:
-            return jsonify({"error": "name_already_exists"}), 409
+        conflict = _find_identifier_conflict(normalized_email, normalized_name)
+        if conflict is not None:
+            return jsonify({"error": conflict}), 409
 
         return jsonify({"error": "conflict"}), 409
 
@@ -107,17 +124,19 @@ def login():
         return jsonify({"error": "invalid_payload"}), 400
 
     identifier_lower = normalized_identifier.lower()
-    user = User.query.filter(
-        func.lower(User.email) == identifier_lower
-    ).one_or_none()
-    if user is None:
-        user = User.query.filter(
-            func.lower(User.name) == identifier_lower
-        ).one_or_none()
+    user = _find_user_by_identifier(identifier_lower)
 
     if user is None or not verify_password(password, user.password_hash):
         return jsonify({"error": "invalid_credentials"}), 401
 
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        try:
+            db.session.commit()
+        except SQLAlchemyError as exc:
+            db.session.rollback()
+            current_app.logger.warning("Password rehash failed user_id=%s error=%s", user.id, exc)
+
     return _build_auth_response(user, 200)
 
 
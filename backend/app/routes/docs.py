@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from flask import jsonify, render_template_string
+from flask import current_app, render_template_string, request
 
 from . import api_bp
-from ..services.openapi_spec import build_openapi_spec
+from ..services.openapi_spec import OPENAPI_CACHE_MAX_AGE_SECONDS, get_encoded_openapi_spec
 
 SWAGGER_UI_TEMPLATE = r"""
 <!doctype html>
@@ -57,7 +57,24 @@ SWAGGER_UI_TEMPLATE = r"""
 
 @api_bp.route("/openapi.json", methods=["GET"])
 def openapi_json():
-    return jsonify(build_openapi_spec())
+    spec = get_encoded_openapi_spec()
+    use_gzip = request.accept_encodings.quality("gzip") > 0
+    etag = f"{spec.etag}-gzip" if use_gzip else spec.etag
+
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(
+            spec.gzip_body if use_gzip else spec.body,
+            mimetype="application/json",
+        )
+        if use_gzip:
+            response.headers["Content-Encoding"] = "gzip"
+
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = f"public, max-age={OPENAPI_CACHE_MAX_AGE_SECONDS}"
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
 
 
 @api_bp.route("/docs", methods=["GET"])
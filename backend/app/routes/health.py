@@ -1,8 +1,7 @@
 from datetime import datetime, timezone
 
 from . import api_bp
-from ..services.database import check_database
-from ..services.redis import check_redis
+from ..services.readiness import run_readiness_checks
 
 
 def _utc_now() -> str:
@@ -35,8 +34,9 @@ def _sanitize_check_result(result: dict[str, object]) -> dict[str, object]:
 
 @api_bp.route("/ready")
 def ready():
-    database_check = _sanitize_check_result(check_database())
-    redis_check = _sanitize_check_result(check_redis())
+    checks, cached = run_readiness_checks()
+    database_check = _sanitize_check_result(checks["database"])
+    redis_check = _sanitize_check_result(checks["redis"])
 
     ready_to_serve = database_check["ok"] and redis_check["ok"]
     status = "ready" if ready_to_serve else "not_ready"
@@ -49,6 +49,7 @@ def ready():
             "database": database_check,
             "redis": redis_check,
         },
+        "cached": cached,
         "time": _utc_now(),
     }
     return payload, status_code
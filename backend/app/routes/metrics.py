@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from flask import current_app, jsonify
+
+from . import api_bp
+from ..auth.service import get_token_cache_stats
+from ..services.database import get_database_pool_stats
+from ..services.product_cache import get_products_cache_stats, products_cache_enabled
+
+
+@api_bp.route("/metrics", methods=["GET"])
+def metrics():
+    products_cache: dict[str, object] = {"enabled": products_cache_enabled()}
+    try:
+        products_cache.update(get_products_cache_stats())
+    except Exception as exc:
+        current_app.logger.warning("Products cache stats unavailable error=%s", exc)
+        products_cache["error"] = "unavailable"
+
+    return (
+        jsonify(
+            {
+                "products_cache": products_cache,
+                "jwt_cache": get_token_cache_stats(),
+                "database_pool": get_database_pool_stats(),
+            }
+        ),
+        200,
+    )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+
+from flask import Response, current_app, jsonify, request, stream_with_context
+
+from . import api_bp
+from ..auth.decorators import require_auth
+from ..services.operation_status import (
+    MAX_OPERATION_IDS_PER_LOOKUP,
+    get_operation_statuses,
+    iter_operation_events,
+)
+
+
+def _bad_request(error: str):
+    return jsonify({"error": error}), 400
+
+
+def _parse_operation_ids(raw_value: str | None) -> list[str]:
+    if raw_value is None:
+        raise ValueError("ids_is_required")
+
+    operation_ids = list(
+        dict.fromkeys(item.strip() for item in raw_value.split(",") if item.strip())
+    )
+    if not operation_ids:
+        raise ValueError("ids_is_required")
+    if len(operation_ids) > MAX_OPERATION_IDS_PER_LOOKUP:
+        raise ValueError("too_many_operation_ids")
+    return operation_ids
+
+
+def _format_sse(event: str, data: dict[str, object] | None) -> str:
+    if data is None:
+        return f": {event}\n\n"
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@api_bp.route("/operations/<operation_id>", methods=["GET"])
+@require_auth
+def get_operation(operation_id: str):
+    status = get_operation_statuses([operation_id])[operation_id]
+    if status is None:
+        return jsonify({"error": "operation_not_found"}), 404
+    return jsonify(status), 200
+
+
+@api_bp.route("/operations", methods=["GET"])
+@require_auth
+def list_operations():
+    try:
+        operation_ids = _parse_operation_ids(request.args.get("ids"))
+    except ValueError as exc:
+        return _bad_request(str(exc))
+
+    return jsonify({"operations": get_operation_statuses(operation_ids)}), 200
+
+
+@api_bp.route("/operations/events", methods=["GET"])
+@require_auth
+def stream_operation_events():
+    try:
+        operation_ids = _parse_operation_ids(request.args.get("ids"))
+    except ValueError as exc:
+        return _bad_request(str(exc))
+
+    events = iter_operation_events(
+        operation_ids,
+        timeout_seconds=current_app.config["OPERATION_EVENTS_TIMEOUT_SECONDS"],
+        keepalive_seconds=current_app.config["OPERATION_EVENTS_KEEPALIVE_SECONDS"],
+    )
+    return Response(
+        stream_with_context(_format_sse(event, data) for event, data in events),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,13 +1,46 @@
 from __future__ import annotations
 
-from flask import g, jsonify, request
+from flask import current_app, g, jsonify, request, stream_with_context
 
 from . import api_bp
 from ..auth.decorators import require_auth
 from ..models import Product
 from ..services.database import db
-from ..services.products import serialize_product, validate_product_payload
-from ..services.queue import build_product_operation_message, enqueue_product_operation
+from ..services.operation_status import (
+    OPERATION_STATUS_QUEUED,
+    build_operation_status,
+    record_operation_statuses,
+)
+from ..services.product_cache import (
+    build_products_etag,
+    build_products_page_variant,
+    get_cached_products_page,
+    get_products_cache_generation,
+    products_cache_enabled,
+    store_products_page,
+)
+from ..services.product_count import count_products
+from ..services.products import (
+    DEFAULT_PRODUCTS_BULK_CHUNK_SIZE,
+    DEFAULT_PRODUCTS_BULK_MAX_ITEMS,
+    DEFAULT_PRODUCTS_MAX_PAGE_SIZE,
+    DEFAULT_PRODUCTS_STREAM_BATCH_SIZE,
+    decode_product_cursor,
+    encode_product_cursor,
+    select_product_rows,
+    serialize_product_rows,
+    validate_product_payload,
+)
+from ..services.queue import (
+    build_bulk_create_message,
+    build_product_operation_message,
+    enqueue_product_operation,
+    enqueue_product_operations,
+)
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_FORMAT_JSON = "json"
+STREAM_FORMAT_NDJSON = "ndjson"
 
 
 def _bad_request(error: str):
@@ -29,6 +62,122 @@ def _queued_response(operation: str, operation_id: str, product_id: int | None =
     return jsonify(response), 202
 
 
+def _enqueue(message: dict[str, object]) -> None:
+    record_operation_statuses(
+        [
+            build_operation_status(
+                operation_id=str(message["operation_id"]),
+                operation=str(message["operation"]),
+                status=OPERATION_STATUS_QUEUED,
+                product_id=message.get("product_id"),
+            )
+        ]
+    )
+    enqueue_product_operation(message)
+
+
+def _read_bulk_items() -> list[object]:
+    if request.mimetype == NDJSON_MIMETYPE:
+        items = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(current_app.json.loads(line))
+            except ValueError as exc:
+                raise ValueError("invalid_ndjson") from exc
+        return items
+
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, list):
+        raise ValueError("invalid_payload")
+    return payload
+
+
+def _read_config_int(name: str, default: int) -> int:
+    value = current_app.config.get(name)
+    if not isinstance(value, int) or value <= 0:
+        return default
+    return value
+
+
+def _page_response(
+    body: bytes,
+    headers: dict[str, str],
+    cache_status: str | None,
+    etag: str | None,
+):
+    response = current_app.response_class(body, status=200, mimetype="application/json")
+    response.headers.update(headers)
+    response.vary.add("Accept")
+    if cache_status is not None:
+        response.headers["X-Cache"] = cache_status
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _requested_stream_format(limit: int | None) -> str | None:
+    best_match = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+    if best_match == NDJSON_MIMETYPE:
+        return STREAM_FORMAT_NDJSON
+    if limit is None:
+        return STREAM_FORMAT_JSON
+    return None
+
+
+def _iter_products_body(statement, dialect_name: str, stream_format: str, batch_size: int):
+    dumps = current_app.json.dumps
+    ndjson = stream_format == STREAM_FORMAT_NDJSON
+
+    if not ndjson:
+        yield "["
+    first = True
+    result = db.session.execute(statement.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        lines = [dumps(product) for product in serialize_product_rows(partition, dialect_name)]
+        if ndjson:
+            yield "".join(f"{line}\n" for line in lines)
+        else:
+            yield ("" if first else ",") + ",".join(lines)
+        first = False
+    if not ndjson:
+        yield "]"
+
+
+def _stream_response(
+    statement,
+    dialect_name: str,
+    headers: dict[str, str],
+    stream_format: str,
+    etag: str | None,
+):
+    batch_size = _read_config_int("PRODUCTS_STREAM_BATCH_SIZE", DEFAULT_PRODUCTS_STREAM_BATCH_SIZE)
+    mimetype = NDJSON_MIMETYPE if stream_format == STREAM_FORMAT_NDJSON else "application/json"
+    response = current_app.response_class(
+        stream_with_context(
+            _iter_products_body(statement, dialect_name, stream_format, batch_size)
+        ),
+        status=200,
+        mimetype=mimetype,
+    )
+    response.headers.update(headers)
+    response.vary.add("Accept")
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _not_modified(etag: str):
+    response = current_app.response_class(status=304)
+    response.vary.add("Accept")
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
 def _parse_offset(raw_value: str | None) -> int:
     if raw_value is None:
         return 0
@@ -57,29 +206,105 @@ def _parse_limit(raw_value: str | None) -> int | None:
     return parsed
 
 
+def _parse_after_id(raw_after_id: str | None, raw_cursor: str | None) -> int | None:
+    if raw_after_id is not None and raw_cursor is not None:
+        raise ValueError("after_id_and_cursor_are_mutually_exclusive")
+
+    if raw_cursor is not None:
+        return decode_product_cursor(raw_cursor)
+
+    if raw_after_id is None:
+        return None
+
+    try:
+        parsed = int(raw_after_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("after_id_must_be_non_negative_integer") from exc
+
+    if parsed < 0:
+        raise ValueError("after_id_must_be_non_negative_integer")
+    return parsed
+
+
 @api_bp.route("/products", methods=["GET"])
 @require_auth
 def list_products():
     try:
         offset = _parse_offset(request.args.get("offset"))
         limit = _parse_limit(request.args.get("limit"))
+        after_id = _parse_after_id(
+            request.args.get("after_id"),
+            request.args.get("cursor"),
+        )
     except ValueError as exc:
         return _bad_request(str(exc))
 
-    base_query = Product.query.order_by(Product.id.asc())
-    total_count = int(base_query.count())
+    if after_id is not None and request.args.get("offset") is not None:
+        return _bad_request("offset_and_cursor_are_mutually_exclusive")
+
+    stream_format = _requested_stream_format(limit)
+    max_page_size = _read_config_int("PRODUCTS_MAX_PAGE_SIZE", DEFAULT_PRODUCTS_MAX_PAGE_SIZE)
+    if stream_format is None and limit is not None and limit > max_page_size:
+        return _bad_request("limit_exceeds_max_page_size")
 
-    paginated_query = base_query.offset(offset)
+    cache_variant = None
+    cache_generation = None
+    etag = None
+    if products_cache_enabled():
+        cache_variant = build_products_page_variant(offset=offset, after_id=after_id, limit=limit)
+        if stream_format == STREAM_FORMAT_NDJSON:
+            cache_variant = f"{cache_variant}:ndjson"
+        try:
+            if limit is not None and stream_format is None:
+                cache_generation, cached_page = get_cached_products_page(cache_variant)
+            else:
+                cache_generation, cached_page = get_products_cache_generation(), None
+        except Exception as exc:
+            current_app.logger.warning("Products cache unavailable error=%s", exc)
+            cache_variant = None
+        else:
+            etag = build_products_etag(cache_generation, cache_variant)
+            if request.if_none_match.contains_weak(etag):
+                return _not_modified(etag)
+            if cached_page is not None:
+                return _page_response(cached_page.body, cached_page.headers, "hit", etag)
+
+    dialect_name = db.engine.dialect.name
+    statement = select_product_rows(dialect_name).order_by(Product.id.asc())
+    total_count, count_strategy = count_products()
+
+    if after_id is not None:
+        statement = statement.where(Product.id > after_id)
+    else:
+        statement = statement.offset(offset)
     if limit is not None:
-        paginated_query = paginated_query.limit(limit)
+        statement = statement.limit(limit)
 
-    products = paginated_query.all()
-    response = jsonify([serialize_product(product) for product in products])
-    response.headers["X-Total-Count"] = str(total_count)
-    response.headers["X-Offset"] = str(offset)
+    headers = {
+        "X-Total-Count": str(total_count),
+        "X-Total-Count-Strategy": count_strategy,
+    }
+    if after_id is None:
+        headers["X-Offset"] = str(offset)
     if limit is not None:
-        response.headers["X-Limit"] = str(limit)
-    return response, 200
+        headers["X-Limit"] = str(limit)
+
+    if stream_format is not None:
+        return _stream_response(statement, dialect_name, headers, stream_format, etag)
+
+    products = serialize_product_rows(db.session.execute(statement).all(), dialect_name)
+    body = jsonify(products).get_data()
+    if limit is not None and len(products) == limit:
+        headers["X-Next-Cursor"] = encode_product_cursor(int(products[-1]["id"]))
+
+    if cache_variant is None or limit is None:
+        return _page_response(body, headers, None, etag)
+
+    try:
+        store_products_page(str(cache_generation), cache_variant, body, headers)
+    except Exception as exc:
+        current_app.logger.warning("Products cache store failed error=%s", exc)
+    return _page_response(body, headers, "miss", etag)
 
 
 @api_bp.route("/products", methods=["POST"])
@@ -96,10 +321,58 @@ def create_product():
         payload=normalized_payload,
         requested_by=g.current_user_identifier,
     )
-    enqueue_product_operation(message)
+    _enqueue(message)
     return _queued_response("create", str(message["operation_id"]))
 
 
+@api_bp.route("/products/bulk", methods=["POST"])
+@require_auth
+def create_products_bulk():
+    try:
+        items = _read_bulk_items()
+    except ValueError as exc:
+        return _bad_request(str(exc))
+
+    if not items:
+        return _bad_request("items_are_required")
+    if len(items) > _read_config_int("PRODUCTS_BULK_MAX_ITEMS", DEFAULT_PRODUCTS_BULK_MAX_ITEMS):
+        return _bad_request("too_many_items")
+
+    payloads = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            payloads.append(validate_product_payload(item))
+        except ValueError as exc:
+            errors.append({"index": index, "error": str(exc)})
+    if errors:
+        return jsonify({"error": "invalid_items", "items": errors}), 400
+
+    chunk_size = _read_config_int("PRODUCTS_BULK_CHUNK_SIZE", DEFAULT_PRODUCTS_BULK_CHUNK_SIZE)
+    messages = [
+        build_bulk_create_message(
+            payloads=payloads[start : start + chunk_size],
+            requested_by=g.current_user_identifier,
+        )
+        for start in range(0, len(payloads), chunk_size)
+    ]
+    operation_ids = [
+        str(item["operation_id"]) for message in messages for item in message["items"]
+    ]
+    record_operation_statuses(
+        [
+            build_operation_status(
+                operation_id=operation_id,
+                operation="create",
+                status=OPERATION_STATUS_QUEUED,
+            )
+            for operation_id in operation_ids
+        ]
+    )
+    enqueue_product_operations(messages)
+    return jsonify({"status": "queued", "operation": "create", "operation_ids": operation_ids}), 202
+
+
 @api_bp.route("/products/<int:product_id>", methods=["PUT"])
 @require_auth
 def update_product(product_id: int):
@@ -119,7 +392,7 @@ def update_product(product_id: int):
         payload=normalized_payload,
         requested_by=g.current_user_identifier,
     )
-    enqueue_product_operation(message)
+    _enqueue(message)
     return _queued_response("update", str(message["operation_id"]), product.id)
 
 
@@ -135,5 +408,5 @@ def delete_product(product_id: int):
         product_id=product.id,
         requested_by=g.current_user_identifier,
     )
-    enqueue_product_operation(message)
+    _enqueue(message)
     return _queued_response("delete", str(message["operation_id"]), product.id)
@@ -1,17 +1,33 @@
 import math
 import os
+import threading
+from bisect import bisect_left
 from time import perf_counter
 
-from flask import Flask
+from flask import Flask, current_app
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
 
 db = SQLAlchemy()
 migrate = Migrate()
 
 DEFAULT_DATABASE_URL = "postgresql+psycopg://postgres:postgres@db:5432/desafio"
 DEFAULT_READINESS_DB_TIMEOUT_MS = 1000
+DEFAULT_DATABASE_POOL_SIZE = 3
+DEFAULT_DATABASE_MAX_OVERFLOW = 2
+DEFAULT_DATABASE_POOL_TIMEOUT_SECONDS = 30
+DEFAULT_DATABASE_POOL_RECYCLE_SECONDS = 1800
+POOL_WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+def _parse_bool(value: str | None, default: bool = False) -> bool:
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    return normalized in {"1", "true", "yes", "on"}
 
 
 def _read_positive_int(value: str | None, default: int) -> int:
@@ -27,6 +43,85 @@ def _read_positive_int(value: str | None, default: int) -> int:
         return default
 
 
+def _read_non_negative_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed < 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+class PoolWaitHistogram:
+    def __init__(self, buckets_ms: tuple[int, ...] = POOL_WAIT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._timeouts = 0
+        self._lock = threading.Lock()
+
+    def observe(self, wait_ms: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.buckets_ms, wait_ms)] += 1
+            self._count += 1
+            self._total_ms += wait_ms
+            self._max_ms = max(self._max_ms, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            buckets: dict[str, int] = {}
+            cumulative = 0
+            for bound, count in zip((*self.buckets_ms, None), self._counts):
+                cumulative += count
+                buckets["inf" if bound is None else str(bound)] = cumulative
+            return {
+                "count": self._count,
+                "sum_ms": round(self._total_ms, 3),
+                "max_ms": round(self._max_ms, 3),
+                "timeouts": self._timeouts,
+                "buckets": buckets,
+            }
+
+
+class TimedQueuePool(QueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = PoolWaitHistogram()
+        self.connect_histogram = PoolWaitHistogram()
+        self._connect_elapsed = threading.local()
+
+    def _create_connection(self):
+        started = perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            elapsed_ms = (perf_counter() - started) * 1000
+            self.connect_histogram.observe(elapsed_ms)
+            self._connect_elapsed.ms = getattr(self._connect_elapsed, "ms", 0.0) + elapsed_ms
+
+    def _do_get(self):
+        self._connect_elapsed.ms = 0.0
+        started = perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_histogram.record_timeout()
+            raise
+        elapsed_ms = (perf_counter() - started) * 1000
+        self.wait_histogram.observe(max(elapsed_ms - self._connect_elapsed.ms, 0.0))
+        return connection
+
+
 def _sanitize_database_error(exc: Exception) -> str:
     message = str(exc).lower()
     if "timeout" in message:
@@ -47,17 +142,27 @@ def _sanitize_database_error(exc: Exception) -> str:
     return "unknown_error"
 
 
-def _build_engine_options(database_url: str, readiness_db_timeout_ms: int):
-    engine_options = {"pool_pre_ping": True}
+def _build_engine_options(
+    database_url: str,
+    readiness_db_timeout_ms: int,
+    *,
+    pool_size: int = DEFAULT_DATABASE_POOL_SIZE,
+    max_overflow: int = DEFAULT_DATABASE_MAX_OVERFLOW,
+    pool_timeout_seconds: int = DEFAULT_DATABASE_POOL_TIMEOUT_SECONDS,
+    pool_recycle_seconds: int = DEFAULT_DATABASE_POOL_RECYCLE_SECONDS,
+    pool_pre_ping: bool = True,
+):
+    engine_options = {"pool_pre_ping": pool_pre_ping}
 
     connect_args = {}
     if database_url.startswith("postgresql"):
         engine_options.update(
             {
-                "pool_size": 3,
-                "max_overflow": 2,
-                "pool_timeout": 30,
-                "pool_recycle": 1800,
+                "poolclass": TimedQueuePool,
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_timeout": pool_timeout_seconds,
+                "pool_recycle": pool_recycle_seconds,
             }
         )
         connect_timeout_seconds = max(1, math.ceil(readiness_db_timeout_ms / 1000))
@@ -81,12 +186,53 @@ def configure_database(app: Flask) -> None:
         DEFAULT_READINESS_DB_TIMEOUT_MS,
     )
 
+    pool_size = _read_positive_int(
+        str(app.config.get("DATABASE_POOL_SIZE"))
+        if app.config.get("DATABASE_POOL_SIZE") is not None
+        else os.getenv("DATABASE_POOL_SIZE"),
+        DEFAULT_DATABASE_POOL_SIZE,
+    )
+    max_overflow = _read_non_negative_int(
+        str(app.config.get("DATABASE_MAX_OVERFLOW"))
+        if app.config.get("DATABASE_MAX_OVERFLOW") is not None
+        else os.getenv("DATABASE_MAX_OVERFLOW"),
+        DEFAULT_DATABASE_MAX_OVERFLOW,
+    )
+    pool_timeout_seconds = _read_positive_int(
+        str(app.config.get("DATABASE_POOL_TIMEOUT_SECONDS"))
+        if app.config.get("DATABASE_POOL_TIMEOUT_SECONDS") is not None
+        else os.getenv("DATABASE_POOL_TIMEOUT_SECONDS"),
+        DEFAULT_DATABASE_POOL_TIMEOUT_SECONDS,
+    )
+    pool_recycle_seconds = _read_positive_int(
+        str(app.config.get("DATABASE_POOL_RECYCLE_SECONDS"))
+        if app.config.get("DATABASE_POOL_RECYCLE_SECONDS") is not None
+        else os.getenv("DATABASE_POOL_RECYCLE_SECONDS"),
+        DEFAULT_DATABASE_POOL_RECYCLE_SECONDS,
+    )
+    pool_pre_ping = _parse_bool(
+        str(app.config.get("DATABASE_POOL_PRE_PING"))
+        if app.config.get("DATABASE_POOL_PRE_PING") is not None
+        else os.getenv("DATABASE_POOL_PRE_PING"),
+        True,
+    )
+
     app.config["SQLALCHEMY_DATABASE_URI"] = database_url
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
     app.config["READINESS_DB_TIMEOUT_MS"] = readiness_db_timeout_ms
+    app.config["DATABASE_POOL_SIZE"] = pool_size
+    app.config["DATABASE_MAX_OVERFLOW"] = max_overflow
+    app.config["DATABASE_POOL_TIMEOUT_SECONDS"] = pool_timeout_seconds
+    app.config["DATABASE_POOL_RECYCLE_SECONDS"] = pool_recycle_seconds
+    app.config["DATABASE_POOL_PRE_PING"] = pool_pre_ping
     app.config["SQLALCHEMY_ENGINE_OPTIONS"] = _build_engine_options(
         database_url,
         readiness_db_timeout_ms,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout_seconds=pool_timeout_seconds,
+        pool_recycle_seconds=pool_recycle_seconds,
+        pool_pre_ping=pool_pre_ping,
     )
 
 
@@ -104,3 +250,27 @@ def check_database() -> dict[str, object]:
             "duration_ms": duration_ms,
             "error": _sanitize_database_error(exc),
         }
+
+
+def get_database_pool_stats() -> dict[str, object]:
+    pool = db.engine.pool
+    stats: dict[str, object] = {
+        "pool": type(pool).__name__,
+        "pre_ping": bool(current_app.config.get("DATABASE_POOL_PRE_PING", True)),
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "timeout_seconds": pool.timeout(),
+            }
+        )
+    if isinstance(pool, TimedQueuePool):
+        stats["max_overflow"] = current_app.config.get("DATABASE_MAX_OVERFLOW")
+        stats["recycle_seconds"] = current_app.config.get("DATABASE_POOL_RECYCLE_SECONDS")
+        stats["wait_ms"] = pool.wait_histogram.snapshot()
+        stats["connect_ms"] = pool.connect_histogram.snapshot()
+    return stats
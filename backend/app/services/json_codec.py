@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from flask import Flask, current_app
+from flask.json.provider import JSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_ENCODER_ORJSON = "orjson"
+JSON_ENCODER_STDLIB = "stdlib"
+ALLOWED_JSON_ENCODERS = {JSON_ENCODER_ORJSON, JSON_ENCODER_STDLIB}
+DEFAULT_JSON_ENCODER = JSON_ENCODER_ORJSON if orjson is not None else JSON_ENCODER_STDLIB
+
+
+def _format_datetime(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _default(value: object):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return _format_datetime(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_default(value: object):
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    def __init__(self, encoder: str = DEFAULT_JSON_ENCODER, sort_keys: bool = False):
+        if encoder == JSON_ENCODER_ORJSON and orjson is None:
+            encoder = JSON_ENCODER_STDLIB
+        self.encoder = encoder
+        self.sort_keys = sort_keys
+        self._orjson_options = 0
+        if encoder == JSON_ENCODER_ORJSON:
+            self._orjson_options = (
+                orjson.OPT_NAIVE_UTC
+                | orjson.OPT_UTC_Z
+                | orjson.OPT_OMIT_MICROSECONDS
+                | orjson.OPT_NON_STR_KEYS
+            )
+            if sort_keys:
+                self._orjson_options |= orjson.OPT_SORT_KEYS
+
+    def dumps(self, obj: object, indent: bool = False) -> bytes:
+        if self.encoder == JSON_ENCODER_ORJSON:
+            options = self._orjson_options | orjson.OPT_INDENT_2 if indent else self._orjson_options
+            return orjson.dumps(obj, default=_orjson_default, option=options)
+
+        return json.dumps(
+            obj,
+            default=_default,
+            ensure_ascii=False,
+            sort_keys=self.sort_keys,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> object:
+        if self.encoder == JSON_ENCODER_ORJSON:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class FastJSONProvider(JSONProvider):
+    compact: bool | None = None
+    mimetype = "application/json"
+
+    def __init__(self, app: Flask):
+        super().__init__(app)
+        self.codec = JSONCodec(app.config.get("JSON_ENCODER", DEFAULT_JSON_ENCODER), sort_keys=True)
+
+    def dumps(self, obj: object, **kwargs: object) -> str:
+        if kwargs:
+            kwargs.setdefault("default", _default)
+            kwargs.setdefault("ensure_ascii", False)
+            kwargs.setdefault("sort_keys", True)
+            return json.dumps(obj, **kwargs)
+        return self.codec.dumps(obj).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: object) -> object:
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return self.codec.loads(s)
+
+    def response(self, *args: object, **kwargs: object):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(
+            self.codec.dumps(obj, indent=indent) + b"\n",
+            mimetype=self.mimetype,
+        )
+
+
+def configure_json(app: Flask) -> None:
+    encoder = (
+        str(app.config.get("JSON_ENCODER"))
+        if app.config.get("JSON_ENCODER") is not None
+        else os.getenv("JSON_ENCODER", DEFAULT_JSON_ENCODER)
+    ).strip().lower()
+    if encoder not in ALLOWED_JSON_ENCODERS:
+        encoder = DEFAULT_JSON_ENCODER
+
+    codec = JSONCodec(encoder)
+    app.config["JSON_ENCODER"] = codec.encoder
+    app.extensions["json_codec"] = codec
+    app.json = FastJSONProvider(app)
+
+
+def get_json_codec() -> JSONCodec:
+    codec = current_app.extensions.get("json_codec")
+    if isinstance(codec, JSONCodec):
+        return codec
+    return DEFAULT_JSON_CODEC
+
+
+DEFAULT_JSON_CODEC = JSONCodec()
@@ -1,5 +1,41 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+from dataclasses import dataclass
+
+from flask import Flask, current_app
+
+OPENAPI_CACHE_MAX_AGE_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class EncodedOpenApiSpec:
+    body: bytes
+    gzip_body: bytes
+    etag: str
+
+
+def encode_openapi_spec(app: Flask) -> EncodedOpenApiSpec:
+    body = app.json.response(build_openapi_spec()).get_data()
+    return EncodedOpenApiSpec(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+        etag=hashlib.sha256(body).hexdigest()[:32],
+    )
+
+
+def configure_openapi_spec(app: Flask) -> None:
+    app.extensions["openapi_spec"] = encode_openapi_spec(app)
+
+
+def get_encoded_openapi_spec() -> EncodedOpenApiSpec:
+    encoded = current_app.extensions.get("openapi_spec")
+    if encoded is None:
+        encoded = encode_openapi_spec(current_app)
+        current_app.extensions["openapi_spec"] = encoded
+    return encoded
+
 
 def build_openapi_spec() -> dict[str, object]:
     bearer_security = [{"bearerAuth": []}]
@@ -35,6 +71,21 @@ def build_openapi_spec() -> dict[str, object]:
                     },
                 }
             },
+            "/metrics": {
+                "get": {
+                    "summary": "Metricas operacionais da API",
+                    "responses": {
+                        "200": {
+                            "description": "Metricas atuais",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/MetricsResponse"}
+                                }
+                            },
+                        }
+                    },
+                }
+            },
             "/auth/register": {
                 "post": {
                     "summary": "Criar conta de usuario",
@@ -156,8 +207,37 @@ def build_openapi_spec() -> dict[str, object]:
                             "in": "query",
                             "name": "limit",
                             "required": False,
+                            "description": "Sem limit a lista inteira e enviada em streaming; com limit vale o teto PRODUCTS_MAX_PAGE_SIZE",
                             "schema": {"type": "integer", "minimum": 1},
                         },
+                        {
+                            "in": "query",
+                            "name": "after_id",
+                            "required": False,
+                            "description": "Paginacao por cursor: retorna produtos com id maior que o informado",
+                            "schema": {"type": "integer", "minimum": 0},
+                        },
+                        {
+                            "in": "query",
+                            "name": "cursor",
+                            "required": False,
+                            "description": "Cursor opaco retornado em X-Next-Cursor",
+                            "schema": {"type": "string"},
+                        },
+                        {
+                            "in": "header",
+                            "name": "If-None-Match",
+                            "required": False,
+                            "description": "ETag de uma resposta anterior",
+                            "schema": {"type": "string"},
+                        },
+                        {
+                            "in": "header",
+                            "name": "Accept",
+                            "required": False,
+                            "description": "application/x-ndjson envia um produto por linha, em streaming",
+                            "schema": {"type": "string"},
+                        },
                     ],
                     "responses": {
                         "200": {
@@ -166,10 +246,25 @@ def build_openapi_spec() -> dict[str, object]:
                                 "X-Total-Count": {
                                     "schema": {"type": "integer", "minimum": 0}
                                 },
+                                "X-Total-Count-Strategy": {
+                                    "schema": {
+                                        "type": "string",
+                                        "enum": ["exact", "estimated", "redis"],
+                                    }
+                                },
                                 "X-Offset": {
                                     "schema": {"type": "integer", "minimum": 0}
                                 },
                                 "X-Limit": {"schema": {"type": "integer", "minimum": 1}},
+                                "X-Next-Cursor": {"schema": {"type": "string"}},
+                                "X-Cache": {
+                                    "description": "Presente quando a pagina passa pelo cache",
+                                    "schema": {"type": "string", "enum": ["hit", "miss"]},
+                                },
+                                "ETag": {
+                                    "description": "ETag fraca da pagina (geracao dos dados + parametros)",
+                                    "schema": {"type": "string"},
+                                },
                             },
                             "content": {
                                 "application/json": {
@@ -177,11 +272,17 @@ def build_openapi_spec() -> dict[str, object]:
                                         "type": "array",
                                         "items": {"$ref": "#/components/schemas/Product"},
                                     }
-                                }
+                                },
+                                "application/x-ndjson": {
+                                    "schema": {"$ref": "#/components/schemas/Product"}
+                                },
                             },
                         },
+                        "304": {
+                            "description": "Pagina nao mudou desde o ETag informado",
+                        },
                         "400": {
-                            "description": "Parametros de paginacao invalidos",
+                            "description": "Parametros de paginacao invalidos ou limit acima de PRODUCTS_MAX_PAGE_SIZE",
                             "content": {
                                 "application/json": {
                                     "schema": {"$ref": "#/components/schemas/ErrorResponse"}
@@ -239,6 +340,54 @@ def build_openapi_spec() -> dict[str, object]:
                     },
                 },
             },
+            "/products/bulk": {
+                "post": {
+                    "summary": "Enfileirar criacao de varios produtos",
+                    "security": bearer_security,
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {"$ref": "#/components/schemas/ProductInput"},
+                                }
+                            },
+                            "application/x-ndjson": {
+                                "schema": {"$ref": "#/components/schemas/ProductInput"}
+                            },
+                        },
+                    },
+                    "responses": {
+                        "202": {
+                            "description": "Operacoes enfileiradas, na ordem dos itens",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "$ref": "#/components/schemas/QueuedBulkOperationResponse"
+                                    }
+                                }
+                            },
+                        },
+                        "400": {
+                            "description": "Payload invalido, lote vazio ou acima de PRODUCTS_BULK_MAX_ITEMS",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/BulkErrorResponse"}
+                                }
+                            },
+                        },
+                        "401": {
+                            "description": "Token ausente/invalido",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                                }
+                            },
+                        },
+                    },
+                }
+            },
             "/products/{product_id}": {
                 "put": {
                     "summary": "Enfileirar atualizacao de produto",
@@ -337,6 +486,146 @@ def build_openapi_spec() -> dict[str, object]:
                     },
                 },
             },
+            "/operations/{operation_id}": {
+                "get": {
+                    "summary": "Consultar status de uma operacao enfileirada",
+                    "security": bearer_security,
+                    "parameters": [
+                        {
+                            "in": "path",
+                            "name": "operation_id",
+                            "required": True,
+                            "schema": {"type": "string"},
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Status atual da operacao",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/OperationStatus"}
+                                }
+                            },
+                        },
+                        "401": {
+                            "description": "Token ausente/invalido",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                                }
+                            },
+                        },
+                        "404": {
+                            "description": "Operacao desconhecida ou expirada",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                                }
+                            },
+                        },
+                    },
+                },
+            },
+            "/operations/events": {
+                "get": {
+                    "summary": "Receber via SSE a conclusao de operacoes enfileiradas",
+                    "description": (
+                        "Eventos: operation (status final), not_found (id desconhecido ou "
+                        "expirado), timeout (ids ainda pendentes) e done. O stream fecha "
+                        "quando todas as operacoes terminam ou apos "
+                        "OPERATION_EVENTS_TIMEOUT_SECONDS."
+                    ),
+                    "security": bearer_security,
+                    "parameters": [
+                        {
+                            "in": "query",
+                            "name": "ids",
+                            "required": True,
+                            "description": "Ids separados por virgula (maximo 100)",
+                            "schema": {"type": "string"},
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Stream text/event-stream",
+                            "content": {"text/event-stream": {"schema": {"type": "string"}}},
+                        },
+                        "400": {
+                            "description": "Parametro ids ausente ou com ids demais",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                                }
+                            },
+                        },
+                        "401": {
+                            "description": "Token ausente/invalido",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                                }
+                            },
+                        },
+                    },
+                },
+            },
+            "/operations": {
+                "get": {
+                    "summary": "Consultar status de varias operacoes em uma chamada",
+                    "security": bearer_security,
+                    "parameters": [
+                        {
+                            "in": "query",
+                            "name": "ids",
+                            "required": True,
+                            "description": "Ids separados por virgula (maximo 100)",
+                            "schema": {"type": "string"},
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Status por id (null quando desconhecido ou expirado)",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {
+                                            "operations": {
+                                                "type": "object",
+                                                "additionalProperties": {
+                                                    "allOf": [
+                                                        {
+                                                            "$ref": "#/components/schemas/OperationStatus"
+                                                        }
+                                                    ],
+                                                    "nullable": True,
+                                                },
+                                            }
+                                        },
+                                        "required": ["operations"],
+                                    }
+                                }
+                            },
+                        },
+                        "400": {
+                            "description": "Parametro ids ausente ou com ids demais",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                                }
+                            },
+                        },
+                        "401": {
+                            "description": "Token ausente/invalido",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/ErrorResponse"}
+                                }
+                            },
+                        },
+                    },
+                },
+            },
         },
         "components": {
             "securitySchemes": {
@@ -402,9 +691,9 @@ def build_openapi_spec() -> dict[str, object]:
                 "ProductInput": {
                     "type": "object",
                     "properties": {
-                        "nome": {"type": "string"},
-                        "marca": {"type": "string"},
-                        "valor": {"type": "number"},
+                        "nome": {"type": "string", "maxLength": 255},
+                        "marca": {"type": "string", "maxLength": 255},
+                        "valor": {"type": "number", "maximum": 9999999999.99},
                     },
                     "required": ["nome", "marca", "valor"],
                 },
@@ -421,6 +710,122 @@ def build_openapi_spec() -> dict[str, object]:
                     },
                     "required": ["status", "operation", "operation_id"],
                 },
+                "QueuedBulkOperationResponse": {
+                    "type": "object",
+                    "properties": {
+                        "status": {"type": "string", "example": "queued"},
+                        "operation": {"type": "string", "enum": ["create"]},
+                        "operation_ids": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "required": ["status", "operation", "operation_ids"],
+                },
+                "BulkErrorResponse": {
+                    "type": "object",
+                    "properties": {
+                        "error": {"type": "string"},
+                        "items": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "index": {"type": "integer"},
+                                    "error": {"type": "string"},
+                                },
+                                "required": ["index", "error"],
+                            },
+                        },
+                    },
+                    "required": ["error"],
+                },
+                "OperationStatus": {
+                    "type": "object",
+                    "properties": {
+                        "operation_id": {"type": "string"},
+                        "operation": {
+                            "type": "string",
+                            "enum": ["create", "update", "delete"],
+                        },
+                        "status": {"type": "string", "enum": ["queued", "success", "error"]},
+                        "product_id": {"type": "integer", "nullable": True},
+                        "error": {"type": "string", "nullable": True},
+                        "updated_at": {"type": "string", "format": "date-time"},
+                    },
+                    "required": ["operation_id", "operation", "status", "updated_at"],
+                },
+                "MetricsResponse": {
+                    "type": "object",
+                    "properties": {
+                        "products_cache": {
+                            "type": "object",
+                            "properties": {
+                                "enabled": {"type": "boolean"},
+                                "generation": {"type": "integer"},
+                                "hits": {"type": "integer"},
+                                "misses": {"type": "integer"},
+                                "error": {"type": "string"},
+                            },
+                            "required": ["enabled"],
+                        },
+                        "jwt_cache": {
+                            "type": "object",
+                            "description": "Cache de tokens verificados do processo que respondeu",
+                            "properties": {
+                                "enabled": {"type": "boolean"},
+                                "size": {"type": "integer"},
+                                "max_size": {"type": "integer"},
+                                "hits": {"type": "integer"},
+                                "misses": {"type": "integer"},
+                                "hit_rate": {"type": "number"},
+                            },
+                            "required": ["enabled"],
+                        },
+                        "database_pool": {
+                            "type": "object",
+                            "description": "Pool de conexoes do processo que respondeu",
+                            "properties": {
+                                "pool": {"type": "string"},
+                                "pre_ping": {"type": "boolean"},
+                                "size": {"type": "integer"},
+                                "max_overflow": {"type": "integer"},
+                                "checked_out": {"type": "integer"},
+                                "checked_in": {"type": "integer"},
+                                "overflow": {"type": "integer"},
+                                "timeout_seconds": {"type": "number"},
+                                "recycle_seconds": {"type": "integer"},
+                                "wait_ms": {
+                                    "type": "object",
+                                    "description": "Histograma acumulado da espera na fila do pool, sem o tempo de abertura de conexoes; chaves sao o limite em ms",
+                                    "properties": {
+                                        "count": {"type": "integer"},
+                                        "sum_ms": {"type": "number"},
+                                        "max_ms": {"type": "number"},
+                                        "timeouts": {"type": "integer"},
+                                        "buckets": {
+                                            "type": "object",
+                                            "additionalProperties": {"type": "integer"},
+                                        },
+                                    },
+                                },
+                                "connect_ms": {
+                                    "type": "object",
+                                    "description": "Histograma acumulado do tempo de abertura de novas conexoes; chaves sao o limite em ms",
+                                    "properties": {
+                                        "count": {"type": "integer"},
+                                        "sum_ms": {"type": "number"},
+                                        "max_ms": {"type": "number"},
+                                        "timeouts": {"type": "integer"},
+                                        "buckets": {
+                                            "type": "object",
+                                            "additionalProperties": {"type": "integer"},
+                                        },
+                                    },
+                                },
+                            },
+                            "required": ["pool", "pre_ping"],
+                        },
+                    },
+                    "required": ["products_cache", "jwt_cache", "database_pool"],
+                },
                 "ReadyCheck": {
                     "type": "object",
                     "properties": {
@@ -443,9 +848,10 @@ def build_openapi_spec() -> dict[str, object]:
                             },
                             "required": ["database", "redis"],
                         },
+                        "cached": {"type": "boolean"},
                         "time": {"type": "string", "format": "date-time"},
                     },
-                    "required": ["status", "service", "checks", "time"],
+                    "required": ["status", "service", "checks", "cached", "time"],
                 },
             },
         },
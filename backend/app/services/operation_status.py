@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Iterator
+
+from flask import Flask, current_app
+from redis import Redis
+
+from .queue import utc_now_iso
+from .redis import get_redis_client
+
+OPERATION_STATUS_QUEUED = "queued"
+OPERATION_STATUS_SUCCESS = "success"
+OPERATION_STATUS_ERROR = "error"
+FINISHED_OPERATION_STATUSES = {OPERATION_STATUS_SUCCESS, OPERATION_STATUS_ERROR}
+DEFAULT_OPERATION_STATUS_TTL_SECONDS = 3600
+DEFAULT_OPERATION_EVENTS_TIMEOUT_SECONDS = 30
+DEFAULT_OPERATION_EVENTS_KEEPALIVE_SECONDS = 15
+OPERATION_EVENTS_POLL_SECONDS = 1.0
+MAX_OPERATION_IDS_PER_LOOKUP = 100
+
+
+def _read_positive_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed <= 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def configure_operation_status(app: Flask) -> None:
+    app.config["OPERATION_STATUS_TTL_SECONDS"] = _read_positive_int(
+        str(app.config.get("OPERATION_STATUS_TTL_SECONDS"))
+        if app.config.get("OPERATION_STATUS_TTL_SECONDS") is not None
+        else os.getenv("OPERATION_STATUS_TTL_SECONDS"),
+        DEFAULT_OPERATION_STATUS_TTL_SECONDS,
+    )
+    app.config["OPERATION_EVENTS_TIMEOUT_SECONDS"] = _read_positive_int(
+        str(app.config.get("OPERATION_EVENTS_TIMEOUT_SECONDS"))
+        if app.config.get("OPERATION_EVENTS_TIMEOUT_SECONDS") is not None
+        else os.getenv("OPERATION_EVENTS_TIMEOUT_SECONDS"),
+        DEFAULT_OPERATION_EVENTS_TIMEOUT_SECONDS,
+    )
+    app.config["OPERATION_EVENTS_KEEPALIVE_SECONDS"] = _read_positive_int(
+        str(app.config.get("OPERATION_EVENTS_KEEPALIVE_SECONDS"))
+        if app.config.get("OPERATION_EVENTS_KEEPALIVE_SECONDS") is not None
+        else os.getenv("OPERATION_EVENTS_KEEPALIVE_SECONDS"),
+        DEFAULT_OPERATION_EVENTS_KEEPALIVE_SECONDS,
+    )
+
+
+def _status_key(operation_id: str) -> str:
+    return f"operations:{operation_id}"
+
+
+def _events_channel(operation_id: str) -> str:
+    return f"operations:events:{operation_id}"
+
+
+def _get_ttl_seconds() -> int:
+    ttl_seconds = current_app.config.get("OPERATION_STATUS_TTL_SECONDS")
+    if not isinstance(ttl_seconds, int) or ttl_seconds <= 0:
+        return DEFAULT_OPERATION_STATUS_TTL_SECONDS
+    return ttl_seconds
+
+
+def build_operation_status(
+    *,
+    operation_id: str,
+    operation: str,
+    status: str,
+    product_id: int | None = None,
+    error: str | None = None,
+) -> dict[str, object]:
+    return {
+        "operation_id": operation_id,
+        "operation": operation,
+        "status": status,
+        "product_id": product_id,
+        "error": error,
+        "updated_at": utc_now_iso(),
+    }
+
+
+def record_operation_statuses(
+    statuses: list[dict[str, object]],
+    client: Redis | None = None,
+) -> None:
+    if not statuses:
+        return
+
+    redis_client = client or get_redis_client()
+    ttl_seconds = _get_ttl_seconds()
+    pipeline = redis_client.pipeline(transaction=False)
+    for status in statuses:
+        operation_id = str(status["operation_id"])
+        payload = json.dumps(status)
+        pipeline.set(_status_key(operation_id), payload, ex=ttl_seconds)
+        if status.get("status") in FINISHED_OPERATION_STATUSES:
+            pipeline.publish(_events_channel(operation_id), payload)
+    pipeline.execute()
+
+
+def get_operation_statuses(
+    operation_ids: list[str],
+    client: Redis | None = None,
+) -> dict[str, dict[str, object] | None]:
+    if not operation_ids:
+        return {}
+
+    redis_client = client or get_redis_client()
+    raw_statuses = redis_client.mget([_status_key(operation_id) for operation_id in operation_ids])
+
+    statuses: dict[str, dict[str, object] | None] = {}
+    for operation_id, raw_status in zip(operation_ids, raw_statuses):
+        statuses[operation_id] = json.loads(raw_status) if raw_status is not None else None
+    return statuses
+
+
+def iter_operation_events(
+    operation_ids: list[str],
+    *,
+    timeout_seconds: float,
+    keepalive_seconds: float,
+    client: Redis | None = None,
+) -> Iterator[tuple[str, dict[str, object] | None]]:
+    redis_client = client or get_redis_client()
+    pending = set(operation_ids)
+    pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+    try:
+        pubsub.subscribe(*(_events_channel(operation_id) for operation_id in operation_ids))
+
+        for operation_id, status in get_operation_statuses(operation_ids, client=redis_client).items():
+            if status is None:
+                pending.discard(operation_id)
+                yield "not_found", {"operation_id": operation_id}
+            elif status.get("status") in FINISHED_OPERATION_STATUSES:
+                pending.discard(operation_id)
+                yield "operation", status
+
+        started = time.monotonic()
+        last_event_at = started
+        while pending:
+            now = time.monotonic()
+            remaining = timeout_seconds - (now - started)
+            if remaining <= 0:
+                yield "timeout", {"pending": sorted(pending)}
+                return
+
+            message = pubsub.get_message(timeout=min(OPERATION_EVENTS_POLL_SECONDS, remaining))
+            if message is None:
+                if time.monotonic() - last_event_at >= keepalive_seconds:
+                    last_event_at = time.monotonic()
+                    yield "keepalive", None
+                continue
+
+            status = json.loads(message["data"])
+            operation_id = status.get("operation_id")
+            if operation_id in pending:
+                pending.discard(operation_id)
+                last_event_at = time.monotonic()
+                yield "operation", status
+
+        yield "done", {}
+    finally:
+        pubsub.close()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+
+from flask import Flask, current_app
+from redis import Redis
+
+from .redis import get_redis_client
+
+DEFAULT_PRODUCTS_CACHE_ENABLED = True
+DEFAULT_PRODUCTS_CACHE_PREFIX = "products:cache"
+DEFAULT_PRODUCTS_CACHE_TTL_SECONDS = 300
+
+_READ_PAGE_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+local page = redis.call('HMGET', KEYS[2] .. generation .. ':' .. ARGV[1], 'body', 'headers')
+if page[1] then
+  redis.call('HINCRBY', KEYS[3], 'hits', 1)
+else
+  redis.call('HINCRBY', KEYS[3], 'misses', 1)
+end
+return {generation, page[1], page[2]}
+"""
+
+
+@dataclass(frozen=True)
+class CachedProductsPage:
+    body: bytes
+    headers: dict[str, str]
+
+
+def _parse_bool(value: str | None, default: bool = False) -> bool:
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    return normalized in {"1", "true", "yes", "on"}
+
+
+def _read_positive_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed <= 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def configure_products_cache(app: Flask) -> None:
+    app.config["PRODUCTS_CACHE_ENABLED"] = _parse_bool(
+        str(app.config.get("PRODUCTS_CACHE_ENABLED"))
+        if app.config.get("PRODUCTS_CACHE_ENABLED") is not None
+        else os.getenv("PRODUCTS_CACHE_ENABLED"),
+        default=DEFAULT_PRODUCTS_CACHE_ENABLED,
+    )
+    app.config["PRODUCTS_CACHE_PREFIX"] = app.config.get("PRODUCTS_CACHE_PREFIX") or os.getenv(
+        "PRODUCTS_CACHE_PREFIX",
+        DEFAULT_PRODUCTS_CACHE_PREFIX,
+    )
+    app.config["PRODUCTS_CACHE_TTL_SECONDS"] = _read_positive_int(
+        str(app.config.get("PRODUCTS_CACHE_TTL_SECONDS"))
+        if app.config.get("PRODUCTS_CACHE_TTL_SECONDS") is not None
+        else os.getenv("PRODUCTS_CACHE_TTL_SECONDS"),
+        DEFAULT_PRODUCTS_CACHE_TTL_SECONDS,
+    )
+
+
+def products_cache_enabled() -> bool:
+    return bool(current_app.config.get("PRODUCTS_CACHE_ENABLED", False))
+
+
+def _get_prefix() -> str:
+    prefix = current_app.config.get("PRODUCTS_CACHE_PREFIX")
+    if not isinstance(prefix, str) or not prefix.strip():
+        return DEFAULT_PRODUCTS_CACHE_PREFIX
+    return prefix
+
+
+def _generation_key() -> str:
+    return f"{_get_prefix()}:generation"
+
+
+def _stats_key() -> str:
+    return f"{_get_prefix()}:stats"
+
+
+def _page_key_prefix() -> str:
+    return f"{_get_prefix()}:page:"
+
+
+def _to_str(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def build_products_page_variant(
+    *,
+    offset: int,
+    after_id: int | None,
+    limit: int | None,
+) -> str:
+    if after_id is not None:
+        return f"after:{after_id}:limit:{limit}"
+    return f"offset:{offset}:limit:{limit}"
+
+
+def build_products_etag(generation: str, variant: str) -> str:
+    digest = hashlib.blake2b(variant.encode("utf-8"), digest_size=8).hexdigest()
+    return f"products-{generation}-{digest}"
+
+
+def get_products_cache_generation(client: Redis | None = None) -> str:
+    redis_client = client or get_redis_client()
+    raw_generation = redis_client.get(_generation_key())
+    return _to_str(raw_generation) if raw_generation is not None else "0"
+
+
+def get_cached_products_page(
+    variant: str,
+    client: Redis | None = None,
+) -> tuple[str, CachedProductsPage | None]:
+    redis_client = client or get_redis_client()
+    generation, body, raw_headers = redis_client.eval(
+        _READ_PAGE_SCRIPT,
+        3,
+        _generation_key(),
+        _page_key_prefix(),
+        _stats_key(),
+        variant,
+    )
+    if body is None or raw_headers is None:
+        return _to_str(generation), None
+
+    page = CachedProductsPage(
+        body=body if isinstance(body, bytes) else str(body).encode("utf-8"),
+        headers=json.loads(raw_headers),
+    )
+    return _to_str(generation), page
+
+
+def store_products_page(
+    generation: str,
+    variant: str,
+    body: bytes,
+    headers: dict[str, str],
+    client: Redis | None = None,
+) -> None:
+    redis_client = client or get_redis_client()
+    page_key = f"{_page_key_prefix()}{generation}:{variant}"
+    ttl_seconds = int(
+        current_app.config.get("PRODUCTS_CACHE_TTL_SECONDS") or DEFAULT_PRODUCTS_CACHE_TTL_SECONDS
+    )
+
+    pipeline = redis_client.pipeline(transaction=False)
+    pipeline.hset(page_key, mapping={"body": body, "headers": json.dumps(headers)})
+    pipeline.expire(page_key, ttl_seconds)
+    pipeline.execute()
+
+
+def bump_products_cache_generation(client: Redis | None = None) -> int:
+    redis_client = client or get_redis_client()
+    return int(redis_client.incr(_generation_key()))
+
+
+def get_products_cache_stats(client: Redis | None = None) -> dict[str, int]:
+    redis_client = client or get_redis_client()
+    pipeline = redis_client.pipeline(transaction=False)
+    pipeline.get(_generation_key())
+    pipeline.hgetall(_stats_key())
+    raw_generation, raw_stats = pipeline.execute()
+
+    stats = {_to_str(field): int(value) for field, value in (raw_stats or {}).items()}
+    return {
+        "generation": int(raw_generation or 0),
+        "hits": stats.get("hits", 0),
+        "misses": stats.get("misses", 0),
+    }
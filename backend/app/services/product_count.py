@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+
+from flask import Flask, current_app
+from redis import Redis
+from sqlalchemy import func, text
+
+from ..models import Product
+from .database import db
+from .redis import get_redis_client
+
+COUNT_STRATEGY_EXACT = "exact"
+COUNT_STRATEGY_ESTIMATED = "estimated"
+COUNT_STRATEGY_REDIS = "redis"
+ALLOWED_COUNT_STRATEGIES = {
+    COUNT_STRATEGY_EXACT,
+    COUNT_STRATEGY_ESTIMATED,
+    COUNT_STRATEGY_REDIS,
+}
+DEFAULT_PRODUCTS_COUNT_STRATEGY = COUNT_STRATEGY_EXACT
+DEFAULT_PRODUCTS_COUNT_KEY = "products:count"
+DEFAULT_PRODUCTS_COUNT_TTL_SECONDS = 300
+
+_ADJUST_IF_EXISTS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+  return redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+return nil
+"""
+
+
+def _read_positive_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed <= 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def _read_count_strategy(value: str | None) -> str:
+    if value is None:
+        return DEFAULT_PRODUCTS_COUNT_STRATEGY
+
+    normalized = value.strip().lower()
+    if normalized not in ALLOWED_COUNT_STRATEGIES:
+        return DEFAULT_PRODUCTS_COUNT_STRATEGY
+    return normalized
+
+
+def configure_product_count(app: Flask) -> None:
+    count_strategy = _read_count_strategy(
+        str(app.config.get("PRODUCTS_COUNT_STRATEGY"))
+        if app.config.get("PRODUCTS_COUNT_STRATEGY") is not None
+        else os.getenv("PRODUCTS_COUNT_STRATEGY"),
+    )
+    count_key = app.config.get("PRODUCTS_COUNT_KEY") or os.getenv(
+        "PRODUCTS_COUNT_KEY",
+        DEFAULT_PRODUCTS_COUNT_KEY,
+    )
+    count_ttl_seconds = _read_positive_int(
+        str(app.config.get("PRODUCTS_COUNT_TTL_SECONDS"))
+        if app.config.get("PRODUCTS_COUNT_TTL_SECONDS") is not None
+        else os.getenv("PRODUCTS_COUNT_TTL_SECONDS"),
+        DEFAULT_PRODUCTS_COUNT_TTL_SECONDS,
+    )
+
+    app.config["PRODUCTS_COUNT_STRATEGY"] = count_strategy
+    app.config["PRODUCTS_COUNT_KEY"] = count_key
+    app.config["PRODUCTS_COUNT_TTL_SECONDS"] = count_ttl_seconds
+
+
+def _get_count_key() -> str:
+    count_key = current_app.config.get("PRODUCTS_COUNT_KEY")
+    if not isinstance(count_key, str) or not count_key.strip():
+        return DEFAULT_PRODUCTS_COUNT_KEY
+    return count_key
+
+
+def _exact_count() -> int:
+    return int(db.session.query(func.count(Product.id)).scalar() or 0)
+
+
+def _estimated_count() -> int | None:
+    reltuples = db.session.execute(
+        text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table_name AS regclass)"),
+        {"table_name": Product.__tablename__},
+    ).scalar()
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
+
+
+def _redis_count(client: Redis) -> int:
+    count_key = _get_count_key()
+    cached = client.get(count_key)
+    if cached is not None:
+        return max(int(cached), 0)
+
+    exact_count = _exact_count()
+    ttl_seconds = int(
+        current_app.config.get("PRODUCTS_COUNT_TTL_SECONDS") or DEFAULT_PRODUCTS_COUNT_TTL_SECONDS
+    )
+    client.set(count_key, exact_count, ex=ttl_seconds, nx=True)
+    return exact_count
+
+
+def count_products(client: Redis | None = None) -> tuple[int, str]:
+    strategy = current_app.config.get("PRODUCTS_COUNT_STRATEGY", DEFAULT_PRODUCTS_COUNT_STRATEGY)
+
+    if strategy == COUNT_STRATEGY_ESTIMATED:
+        estimated = _estimated_count()
+        if estimated is not None:
+            return estimated, COUNT_STRATEGY_ESTIMATED
+
+    if strategy == COUNT_STRATEGY_REDIS:
+        try:
+            return _redis_count(client or get_redis_client()), COUNT_STRATEGY_REDIS
+        except Exception:
+            current_app.logger.warning("Products redis counter unavailable, using exact count")
+
+    return _exact_count(), COUNT_STRATEGY_EXACT
+
+
+def adjust_products_counter(delta: int, client: Redis | None = None) -> int | None:
+    redis_client = client or get_redis_client()
+    adjusted = redis_client.eval(_ADJUST_IF_EXISTS_SCRIPT, 1, _get_count_key(), int(delta))
+    return int(adjusted) if adjusted is not None else None
@@ -1,10 +1,64 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import os
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 
+from flask import Flask
+from sqlalchemy import Float, Select, cast, func, select
+
 from ..models import Product
 
+DEFAULT_PRODUCTS_BULK_MAX_ITEMS = 1000
+DEFAULT_PRODUCTS_BULK_CHUNK_SIZE = 500
+DEFAULT_PRODUCTS_MAX_PAGE_SIZE = 1000
+DEFAULT_PRODUCTS_STREAM_BATCH_SIZE = 500
+DATABASE_FORMATTED_DIALECTS = {"postgresql"}
+PRODUCT_TEXT_MAX_LENGTH = 255
+PRODUCT_VALOR_MAX = Decimal("9999999999.99")
+
+
+def _read_positive_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed <= 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def configure_products(app: Flask) -> None:
+    app.config["PRODUCTS_BULK_MAX_ITEMS"] = _read_positive_int(
+        str(app.config.get("PRODUCTS_BULK_MAX_ITEMS"))
+        if app.config.get("PRODUCTS_BULK_MAX_ITEMS") is not None
+        else os.getenv("PRODUCTS_BULK_MAX_ITEMS"),
+        DEFAULT_PRODUCTS_BULK_MAX_ITEMS,
+    )
+    app.config["PRODUCTS_BULK_CHUNK_SIZE"] = _read_positive_int(
+        str(app.config.get("PRODUCTS_BULK_CHUNK_SIZE"))
+        if app.config.get("PRODUCTS_BULK_CHUNK_SIZE") is not None
+        else os.getenv("PRODUCTS_BULK_CHUNK_SIZE"),
+        DEFAULT_PRODUCTS_BULK_CHUNK_SIZE,
+    )
+    app.config["PRODUCTS_MAX_PAGE_SIZE"] = _read_positive_int(
+        str(app.config.get("PRODUCTS_MAX_PAGE_SIZE"))
+        if app.config.get("PRODUCTS_MAX_PAGE_SIZE") is not None
+        else os.getenv("PRODUCTS_MAX_PAGE_SIZE"),
+        DEFAULT_PRODUCTS_MAX_PAGE_SIZE,
+    )
+    app.config["PRODUCTS_STREAM_BATCH_SIZE"] = _read_positive_int(
+        str(app.config.get("PRODUCTS_STREAM_BATCH_SIZE"))
+        if app.config.get("PRODUCTS_STREAM_BATCH_SIZE") is not None
+        else os.getenv("PRODUCTS_STREAM_BATCH_SIZE"),
+        DEFAULT_PRODUCTS_STREAM_BATCH_SIZE,
+    )
+
 
 def _format_datetime(value: datetime | None) -> str | None:
     if value is None:
@@ -17,15 +71,74 @@ def _format_datetime(value: datetime | None) -> str | None:
     return value.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def serialize_product(product: Product) -> dict[str, object]:
-    return {
-        "id": product.id,
-        "nome": product.nome,
-        "marca": product.marca,
-        "valor": float(product.valor),
-        "created_at": _format_datetime(product.created_at),
-        "updated_at": _format_datetime(product.updated_at),
-    }
+def _utc_iso_column(column, name: str):
+    return func.to_char(func.timezone("UTC", column), 'YYYY-MM-DD"T"HH24:MI:SS"Z"').label(name)
+
+
+def select_product_rows(dialect_name: str) -> Select:
+    if dialect_name in DATABASE_FORMATTED_DIALECTS:
+        return select(
+            Product.id,
+            Product.nome,
+            Product.marca,
+            cast(Product.valor, Float).label("valor"),
+            _utc_iso_column(Product.created_at, "created_at"),
+            _utc_iso_column(Product.updated_at, "updated_at"),
+        )
+    return select(
+        Product.id,
+        Product.nome,
+        Product.marca,
+        Product.valor,
+        Product.created_at,
+        Product.updated_at,
+    )
+
+
+def serialize_product_rows(rows, dialect_name: str) -> list[dict[str, object]]:
+    if dialect_name in DATABASE_FORMATTED_DIALECTS:
+        return [
+            {
+                "id": product_id,
+                "nome": nome,
+                "marca": marca,
+                "valor": valor,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+            for product_id, nome, marca, valor, created_at, updated_at in rows
+        ]
+
+    format_datetime = _format_datetime
+    return [
+        {
+            "id": product_id,
+            "nome": nome,
+            "marca": marca,
+            "valor": float(valor),
+            "created_at": format_datetime(created_at),
+            "updated_at": format_datetime(updated_at),
+        }
+        for product_id, nome, marca, valor, created_at, updated_at in rows
+    ]
+
+
+def encode_product_cursor(product_id: int) -> str:
+    raw_cursor = f"id:{int(product_id)}".encode("ascii")
+    return base64.urlsafe_b64encode(raw_cursor).decode("ascii").rstrip("=")
+
+
+def decode_product_cursor(cursor: str) -> int:
+    padded_cursor = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw_cursor = base64.urlsafe_b64decode(padded_cursor.encode("ascii")).decode("ascii")
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("invalid_cursor") from exc
+
+    prefix, _, raw_product_id = raw_cursor.partition(":")
+    if prefix != "id" or not raw_product_id.isdigit():
+        raise ValueError("invalid_cursor")
+    return int(raw_product_id)
 
 
 def _normalize_non_empty_str(value: object, field_name: str) -> str:
@@ -35,6 +148,8 @@ def _normalize_non_empty_str(value: object, field_name: str) -> str:
     normalized = value.strip()
     if not normalized:
         raise ValueError(f"{field_name}_is_required")
+    if len(normalized) > PRODUCT_TEXT_MAX_LENGTH:
+        raise ValueError(f"{field_name}_too_long")
     return normalized
 
 
@@ -44,8 +159,12 @@ def _normalize_positive_decimal(value: object, field_name: str) -> Decimal:
     except (InvalidOperation, ValueError, TypeError) as exc:
         raise ValueError(f"{field_name}_must_be_numeric") from exc
 
+    if not normalized.is_finite():
+        raise ValueError(f"{field_name}_must_be_numeric")
     if normalized <= 0:
         raise ValueError(f"{field_name}_must_be_greater_than_zero")
+    if normalized > PRODUCT_VALOR_MAX:
+        raise ValueError(f"{field_name}_too_large")
     return normalized.quantize(Decimal("0.01"))
 
 
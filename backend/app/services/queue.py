@@ -1,16 +1,32 @@
 from __future__ import annotations
 
-import json
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from decimal import Decimal
 from uuid import uuid4
 
 from flask import current_app
 from redis import Redis
 
-from .redis import get_redis_client
+from .json_codec import get_json_codec
+from .queue_backends import (
+    QUEUE_BACKEND_STREAM,
+    ListQueueBackend,
+    QueueBackend,
+    StreamQueueBackend,
+)
+from .queue_envelope import MESSAGE_FORMAT_JSON, decode_queue_message, encode_queue_message
+from .redis import DEFAULT_PRODUCTS_QUEUE_GROUP, get_redis_client
 
 ALLOWED_PRODUCT_OPERATIONS = {"create", "update", "delete"}
+PRODUCT_OPERATION_BULK_CREATE = "bulk_create"
+DEFAULT_VISIBILITY_TIMEOUT_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class ReservedOperation:
+    message: dict[str, object]
+    raw_message: bytes
+    receipt: bytes
 
 
 def utc_now_iso() -> str:
@@ -27,20 +43,45 @@ def get_products_queue_name() -> str:
     return queue_name
 
 
-def _decode_message(raw_message: bytes | str) -> dict[str, object]:
-    if isinstance(raw_message, bytes):
-        raw_message = raw_message.decode("utf-8")
+def get_products_queue_backend() -> QueueBackend:
+    queue_name = get_products_queue_name()
+    if current_app.config.get("PRODUCTS_QUEUE_BACKEND") == QUEUE_BACKEND_STREAM:
+        group_name = current_app.config.get("PRODUCTS_QUEUE_GROUP")
+        if not isinstance(group_name, str) or not group_name.strip():
+            group_name = DEFAULT_PRODUCTS_QUEUE_GROUP
+        return StreamQueueBackend(queue_name, group_name)
+    return ListQueueBackend(queue_name)
+
+
+def get_processing_list_name(consumer_id: str) -> str:
+    return ListQueueBackend(get_products_queue_name()).processing_list_name(consumer_id)
+
+
+def _get_visibility_timeout_seconds() -> int:
+    visibility_timeout = current_app.config.get("PRODUCTS_QUEUE_VISIBILITY_TIMEOUT_SECONDS")
+    if not isinstance(visibility_timeout, int) or visibility_timeout <= 0:
+        return DEFAULT_VISIBILITY_TIMEOUT_SECONDS
+    return visibility_timeout
+
 
-    loaded = json.loads(raw_message)
-    if not isinstance(loaded, dict):
-        raise ValueError("invalid_queue_message")
-    return loaded
+def _get_compression_min_bytes() -> int:
+    min_bytes = current_app.config.get("PRODUCTS_QUEUE_COMPRESSION_MIN_BYTES")
+    if not isinstance(min_bytes, int) or min_bytes < 0:
+        return 0
+    return min_bytes
 
 
-def _json_default(value: object):
-    if isinstance(value, Decimal):
-        return float(value)
-    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+def _encode_message(message: dict[str, object]) -> bytes:
+    return encode_queue_message(
+        message,
+        get_json_codec(),
+        current_app.config.get("PRODUCTS_QUEUE_MESSAGE_FORMAT", MESSAGE_FORMAT_JSON),
+        _get_compression_min_bytes(),
+    )
+
+
+def _decode_message(raw_message: bytes | str) -> dict[str, object]:
+    return decode_queue_message(raw_message, get_json_codec())
 
 
 def build_product_operation_message(
@@ -72,21 +113,93 @@ def build_product_operation_message(
     return message
 
 
+def build_bulk_create_message(
+    *,
+    payloads: list[dict[str, object]],
+    requested_by: str,
+    operation_ids: list[str] | None = None,
+    requested_at: str | None = None,
+) -> dict[str, object]:
+    if not payloads:
+        raise ValueError("payload_is_required")
+
+    if operation_ids is None:
+        operation_ids = [str(uuid4()) for _ in payloads]
+    if len(operation_ids) != len(payloads):
+        raise ValueError("operation_ids_must_match_payloads")
+
+    return {
+        "operation_id": str(uuid4()),
+        "operation": PRODUCT_OPERATION_BULK_CREATE,
+        "items": [
+            {"operation_id": operation_id, "payload": payload}
+            for operation_id, payload in zip(operation_ids, payloads)
+        ],
+        "requested_by": requested_by,
+        "requested_at": requested_at or utc_now_iso(),
+    }
+
+
 def enqueue_product_operation(message: dict[str, object], client: Redis | None = None) -> int:
     redis_client = client or get_redis_client()
-    queue_name = get_products_queue_name()
-    return int(redis_client.lpush(queue_name, json.dumps(message, default=_json_default)))
+    raw_message = _encode_message(message)
+    return get_products_queue_backend().enqueue(redis_client, raw_message)
+
+
+def enqueue_product_operations(
+    messages: list[dict[str, object]],
+    client: Redis | None = None,
+) -> int:
+    redis_client = client or get_redis_client()
+    raw_messages = [_encode_message(message) for message in messages]
+    return get_products_queue_backend().enqueue_many(redis_client, raw_messages)
 
 
-def pop_product_operation(
+def reserve_product_operations(
+    consumer_id: str,
+    count: int = 1,
     timeout: int = 1,
     client: Redis | None = None,
-) -> dict[str, object] | None:
+) -> list[ReservedOperation]:
     redis_client = client or get_redis_client()
-    queue_name = get_products_queue_name()
-    item = redis_client.brpop(queue_name, timeout=max(timeout, 0))
-    if item is None:
-        return None
+    backend = get_products_queue_backend()
+
+    reserved: list[ReservedOperation] = []
+    invalid_receipts: list[bytes] = []
+    for receipt, raw_message in backend.reserve(redis_client, consumer_id, count, timeout):
+        try:
+            reserved.append(ReservedOperation(_decode_message(raw_message), raw_message, receipt))
+        except ValueError:
+            invalid_receipts.append(receipt)
+
+    if invalid_receipts:
+        current_app.logger.warning(
+            "Discarded invalid queue messages queue=%s count=%s",
+            get_products_queue_name(),
+            len(invalid_receipts),
+        )
+        backend.ack(redis_client, consumer_id, invalid_receipts)
+    return reserved
+
+
+def ack_product_operations(
+    consumer_id: str,
+    reserved: list[ReservedOperation],
+    client: Redis | None = None,
+) -> int:
+    if not reserved:
+        return 0
 
-    _, raw_message = item
-    return _decode_message(raw_message)
+    redis_client = client or get_redis_client()
+    receipts = [item.receipt for item in reserved]
+    return get_products_queue_backend().ack(redis_client, consumer_id, receipts)
+
+
+def requeue_expired_operations(
+    visibility_timeout_seconds: int | None = None,
+    client: Redis | None = None,
+) -> int:
+    redis_client = client or get_redis_client()
+    if visibility_timeout_seconds is None:
+        visibility_timeout_seconds = _get_visibility_timeout_seconds()
+    return get_products_queue_backend().requeue_expired(redis_client, visibility_timeout_seconds)
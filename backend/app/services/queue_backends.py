@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import time
+from typing import Protocol
+
+from redis import Redis
+from redis.exceptions import ResponseError
+
+QUEUE_BACKEND_LIST = "list"
+QUEUE_BACKEND_STREAM = "stream"
+ALLOWED_QUEUE_BACKENDS = {QUEUE_BACKEND_LIST, QUEUE_BACKEND_STREAM}
+STREAM_MESSAGE_FIELD = b"data"
+STREAM_CLAIM_BATCH_SIZE = 100
+
+_REQUEUE_IF_IN_FLIGHT_SCRIPT = """
+local removed = redis.call('LREM', KEYS[1], 1, ARGV[1])
+if removed == 1 then
+  redis.call('RPUSH', KEYS[2], ARGV[1])
+end
+redis.call('ZREM', KEYS[3], ARGV[1])
+return removed
+"""
+
+
+class QueueBackend(Protocol):
+    def enqueue(self, client: Redis, raw_message: str | bytes) -> int: ...
+
+    def enqueue_many(self, client: Redis, raw_messages: list[str | bytes]) -> int: ...
+
+    def reserve(
+        self,
+        client: Redis,
+        consumer_id: str,
+        count: int,
+        timeout: int,
+    ) -> list[tuple[bytes, bytes]]: ...
+
+    def ack(self, client: Redis, consumer_id: str, receipts: list[bytes]) -> int: ...
+
+    def requeue_expired(self, client: Redis, visibility_timeout_seconds: int) -> int: ...
+
+
+def _to_str(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+class ListQueueBackend:
+    def __init__(self, queue_name: str):
+        self.queue_name = queue_name
+        self.in_flight_key = f"{queue_name}:inflight"
+        self.consumers_key = f"{queue_name}:consumers"
+
+    def processing_list_name(self, consumer_id: str) -> str:
+        return f"{self.queue_name}:processing:{consumer_id}"
+
+    def enqueue(self, client: Redis, raw_message: str | bytes) -> int:
+        return int(client.lpush(self.queue_name, raw_message))
+
+    def enqueue_many(self, client: Redis, raw_messages: list[str | bytes]) -> int:
+        if not raw_messages:
+            return 0
+        return int(client.lpush(self.queue_name, *raw_messages))
+
+    def reserve(
+        self,
+        client: Redis,
+        consumer_id: str,
+        count: int,
+        timeout: int,
+    ) -> list[tuple[bytes, bytes]]:
+        processing_list = self.processing_list_name(consumer_id)
+        first_message = client.blmove(
+            self.queue_name,
+            processing_list,
+            max(timeout, 0),
+            src="RIGHT",
+            dest="LEFT",
+        )
+        if first_message is None:
+            return []
+
+        raw_messages = [first_message]
+        if count > 1:
+            pipeline = client.pipeline(transaction=False)
+            for _ in range(count - 1):
+                pipeline.lmove(self.queue_name, processing_list, src="RIGHT", dest="LEFT")
+            raw_messages.extend(raw for raw in pipeline.execute() if raw is not None)
+
+        reserved_at = time.time()
+        pipeline = client.pipeline(transaction=False)
+        pipeline.sadd(self.consumers_key, consumer_id)
+        pipeline.zadd(self.in_flight_key, {raw: reserved_at for raw in raw_messages})
+        pipeline.execute()
+        return [(raw_message, raw_message) for raw_message in raw_messages]
+
+    def ack(self, client: Redis, consumer_id: str, receipts: list[bytes]) -> int:
+        if not receipts:
+            return 0
+
+        processing_list = self.processing_list_name(consumer_id)
+        pipeline = client.pipeline(transaction=True)
+        for raw_message in receipts:
+            pipeline.lrem(processing_list, 1, raw_message)
+        pipeline.zrem(self.in_flight_key, *receipts)
+        results = pipeline.execute()
+        return sum(int(removed) for removed in results[:-1])
+
+    def requeue_expired(self, client: Redis, visibility_timeout_seconds: int) -> int:
+        now = time.time()
+        expires_before = now - visibility_timeout_seconds
+
+        requeued = 0
+        for raw_consumer_id in client.smembers(self.consumers_key):
+            consumer_id = _to_str(raw_consumer_id)
+            processing_list = self.processing_list_name(consumer_id)
+            raw_messages = client.lrange(processing_list, 0, -1)
+            if not raw_messages:
+                client.srem(self.consumers_key, consumer_id)
+                continue
+
+            reserved_at_scores = client.zmscore(self.in_flight_key, raw_messages)
+            untracked = {
+                raw_message: now
+                for raw_message, reserved_at in zip(raw_messages, reserved_at_scores)
+                if reserved_at is None
+            }
+            if untracked:
+                client.zadd(self.in_flight_key, untracked, nx=True)
+
+            for raw_message, reserved_at in zip(raw_messages, reserved_at_scores):
+                if reserved_at is None or reserved_at > expires_before:
+                    continue
+                requeued += int(
+                    client.eval(
+                        _REQUEUE_IF_IN_FLIGHT_SCRIPT,
+                        3,
+                        processing_list,
+                        self.queue_name,
+                        self.in_flight_key,
+                        raw_message,
+                    )
+                )
+        return requeued
+
+
+class StreamQueueBackend:
+    def __init__(self, queue_name: str, group_name: str):
+        self.stream_name = f"{queue_name}:stream"
+        self.group_name = group_name
+
+    def _ensure_group(self, client: Redis) -> None:
+        try:
+            client.xgroup_create(self.stream_name, self.group_name, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    def enqueue(self, client: Redis, raw_message: str | bytes) -> int:
+        client.xadd(self.stream_name, {STREAM_MESSAGE_FIELD: raw_message})
+        return 1
+
+    def enqueue_many(self, client: Redis, raw_messages: list[str | bytes]) -> int:
+        if not raw_messages:
+            return 0
+
+        pipeline = client.pipeline(transaction=False)
+        for raw_message in raw_messages:
+            pipeline.xadd(self.stream_name, {STREAM_MESSAGE_FIELD: raw_message})
+        pipeline.execute()
+        return len(raw_messages)
+
+    def reserve(
+        self,
+        client: Redis,
+        consumer_id: str,
+        count: int,
+        timeout: int,
+    ) -> list[tuple[bytes, bytes]]:
+        read_kwargs = {
+            "streams": {self.stream_name: ">"},
+            "count": max(count, 1),
+            "block": max(timeout, 0) * 1000,
+        }
+        try:
+            response = client.xreadgroup(self.group_name, consumer_id, **read_kwargs)
+        except ResponseError as exc:
+            if "NOGROUP" not in str(exc):
+                raise
+            self._ensure_group(client)
+            response = client.xreadgroup(self.group_name, consumer_id, **read_kwargs)
+
+        reserved = []
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                raw_message = (fields or {}).get(STREAM_MESSAGE_FIELD)
+                if raw_message is not None:
+                    reserved.append((entry_id, raw_message))
+        return reserved
+
+    def ack(self, client: Redis, consumer_id: str, receipts: list[bytes]) -> int:
+        if not receipts:
+            return 0
+
+        pipeline = client.pipeline(transaction=True)
+        pipeline.xack(self.stream_name, self.group_name, *receipts)
+        pipeline.xdel(self.stream_name, *receipts)
+        acked, _ = pipeline.execute()
+        return int(acked)
+
+    def requeue_expired(self, client: Redis, visibility_timeout_seconds: int) -> int:
+        self._ensure_group(client)
+        min_idle_time_ms = max(visibility_timeout_seconds, 0) * 1000
+
+        requeued = 0
+        start_id: bytes | str = "0-0"
+        while True:
+            claim_response = client.xautoclaim(
+                self.stream_name,
+                self.group_name,
+                "reaper",
+                min_idle_time_ms,
+                start_id=start_id,
+                count=STREAM_CLAIM_BATCH_SIZE,
+            )
+            next_start_id, claimed = claim_response[0], claim_response[1]
+            if claimed:
+                pipeline = client.pipeline(transaction=True)
+                for _, fields in claimed:
+                    raw_message = (fields or {}).get(STREAM_MESSAGE_FIELD)
+                    if raw_message is not None:
+                        pipeline.xadd(self.stream_name, {STREAM_MESSAGE_FIELD: raw_message})
+                        requeued += 1
+                entry_ids = [entry_id for entry_id, _ in claimed]
+                pipeline.xack(self.stream_name, self.group_name, *entry_ids)
+                pipeline.xdel(self.stream_name, *entry_ids)
+                pipeline.execute()
+
+            if _to_str(next_start_id) == "0-0":
+                break
+            start_id = next_start_id
+
+        for consumer in client.xinfo_consumers(self.stream_name, self.group_name):
+            idle_ms = int(consumer.get("idle", 0))
+            if int(consumer.get("pending", 0)) == 0 and idle_ms > min_idle_time_ms:
+                client.xgroup_delconsumer(self.stream_name, self.group_name, consumer["name"])
+        return requeued
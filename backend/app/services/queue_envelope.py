@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from datetime import datetime, timezone
+from decimal import Decimal
+from functools import lru_cache
+
+from .json_codec import JSONCodec
+
+MESSAGE_FORMAT_JSON = "json"
+MESSAGE_FORMAT_BINARY = "binary"
+ALLOWED_MESSAGE_FORMATS = {MESSAGE_FORMAT_JSON, MESSAGE_FORMAT_BINARY}
+
+ENVELOPE_BINARY_V1 = 0x01
+ENVELOPE_BINARY_V1_ZLIB = 0x02
+COMPRESSION_LEVEL = 1
+EPOCH_CACHE_SIZE = 1024
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+_OPERATION_CODES = {"create": 1, "update": 2, "delete": 3, "bulk_create": 4}
+_OPERATION_NAMES = {code: name for name, code in _OPERATION_CODES.items()}
+_SINGLE_MESSAGE_KEYS = frozenset(
+    {"operation_id", "operation", "product_id", "payload", "requested_by", "requested_at"}
+)
+_BULK_MESSAGE_KEYS = frozenset(
+    {"operation_id", "operation", "items", "requested_by", "requested_at"}
+)
+_BULK_ITEM_KEYS = frozenset({"operation_id", "payload"})
+_PAYLOAD_KEYS = frozenset({"nome", "marca", "valor"})
+
+FLAG_PRODUCT_ID = 0x01
+FLAG_UUID_OPERATION_ID = 0x02
+FLAG_EPOCH_REQUESTED_AT = 0x04
+
+_HEADER = struct.Struct(">BBB")
+_INT64 = struct.Struct(">q")
+
+
+def _uuid_bytes(value: object) -> bytes | None:
+    if (
+        not isinstance(value, str)
+        or len(value) != 36
+        or value[8] != "-"
+        or value[13] != "-"
+        or value[18] != "-"
+        or value[23] != "-"
+        or value != value.lower()
+    ):
+        return None
+    try:
+        encoded = bytes.fromhex(value.replace("-", ""))
+    except ValueError:
+        return None
+    return encoded if len(encoded) == 16 else None
+
+
+def _format_uuid(data: bytes) -> str:
+    value = data.hex()
+    return f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}"
+
+
+def _epoch_seconds(value: object) -> int | None:
+    if not isinstance(value, str) or len(value) != 20 or value[10] != "T" or value[19] != "Z":
+        return None
+    return _parse_epoch(value)
+
+
+@lru_cache(maxsize=EPOCH_CACHE_SIZE)
+def _parse_epoch(value: str) -> int | None:
+    try:
+        epoch = int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        return None
+    if _format_epoch(epoch) != value:
+        return None
+    return epoch
+
+
+@lru_cache(maxsize=EPOCH_CACHE_SIZE)
+def _format_epoch(value: int) -> str:
+    return datetime.fromtimestamp(value, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _payload_row(payload: object) -> list[object] | None:
+    if not isinstance(payload, dict) or payload.keys() != _PAYLOAD_KEYS:
+        return None
+
+    nome, marca, valor = payload["nome"], payload["marca"], payload["valor"]
+    if not isinstance(nome, str) or not isinstance(marca, str):
+        return None
+    if isinstance(valor, bool) or not isinstance(valor, (int, float, Decimal)):
+        return None
+    return [nome, marca, float(valor)]
+
+
+def _encode_binary(message: dict[str, object], codec: JSONCodec) -> bytes | None:
+    operation_code = _OPERATION_CODES.get(message.get("operation"))
+    if operation_code is None:
+        return None
+
+    bulk = operation_code == _OPERATION_CODES["bulk_create"]
+    if message.keys() != (_BULK_MESSAGE_KEYS if bulk else _SINGLE_MESSAGE_KEYS):
+        return None
+    if not isinstance(message["requested_by"], str) or not isinstance(message["operation_id"], str):
+        return None
+
+    flags = 0
+    header = []
+    operation_id = message["operation_id"]
+    operation_id_bytes = _uuid_bytes(operation_id)
+    if operation_id_bytes is not None:
+        flags |= FLAG_UUID_OPERATION_ID
+        header.append(operation_id_bytes)
+        operation_id = None
+
+    requested_at = message["requested_at"]
+    epoch = _epoch_seconds(requested_at)
+    if epoch is not None:
+        flags |= FLAG_EPOCH_REQUESTED_AT
+        header.append(_INT64.pack(epoch))
+        requested_at = None
+    elif not isinstance(requested_at, str):
+        return None
+
+    if bulk:
+        items = message["items"]
+        if not isinstance(items, list):
+            return None
+        rows = []
+        for item in items:
+            if not isinstance(item, dict) or item.keys() != _BULK_ITEM_KEYS:
+                return None
+            row = _payload_row(item["payload"])
+            if row is None or not isinstance(item["operation_id"], str):
+                return None
+            rows.append([item["operation_id"], *row])
+        body = rows
+    else:
+        product_id = message["product_id"]
+        if product_id is not None:
+            if isinstance(product_id, bool) or not isinstance(product_id, int):
+                return None
+            if not INT64_MIN <= product_id <= INT64_MAX:
+                return None
+            flags |= FLAG_PRODUCT_ID
+            header.append(_INT64.pack(product_id))
+        body = None
+        if message["payload"] is not None:
+            body = _payload_row(message["payload"])
+            if body is None:
+                return None
+
+    tail = codec.dumps([message["requested_by"], operation_id, requested_at, body])
+    return _HEADER.pack(ENVELOPE_BINARY_V1, operation_code, flags) + b"".join(header) + tail
+
+
+def encode_queue_message(
+    message: dict[str, object],
+    codec: JSONCodec,
+    message_format: str = MESSAGE_FORMAT_JSON,
+    compression_min_bytes: int = 0,
+) -> bytes:
+    if message_format != MESSAGE_FORMAT_BINARY:
+        return codec.dumps(message)
+
+    encoded = _encode_binary(message, codec)
+    if encoded is None:
+        return codec.dumps(message)
+
+    if (
+        compression_min_bytes > 0
+        and len(encoded) >= compression_min_bytes
+        and encoded[1] == _OPERATION_CODES["bulk_create"]
+    ):
+        compressed = zlib.compress(memoryview(encoded)[1:], COMPRESSION_LEVEL)
+        if len(compressed) + 1 < len(encoded):
+            return bytes((ENVELOPE_BINARY_V1_ZLIB,)) + compressed
+    return encoded
+
+
+def _decode_binary(data: bytes, pos: int, codec: JSONCodec) -> dict[str, object]:
+    operation = _OPERATION_NAMES[data[pos]]
+    flags = data[pos + 1]
+    pos += 2
+
+    operation_id = None
+    if flags & FLAG_UUID_OPERATION_ID:
+        operation_id = _format_uuid(data[pos:pos + 16])
+        pos += 16
+    requested_at = None
+    if flags & FLAG_EPOCH_REQUESTED_AT:
+        (epoch,) = _INT64.unpack_from(data, pos)
+        requested_at = _format_epoch(epoch)
+        pos += 8
+    product_id = None
+    if flags & FLAG_PRODUCT_ID:
+        (product_id,) = _INT64.unpack_from(data, pos)
+        pos += 8
+
+    requested_by, tail_operation_id, tail_requested_at, body = codec.loads(data[pos:])
+    if not isinstance(requested_by, str):
+        raise ValueError("invalid_queue_message")
+    message = {
+        "operation_id": operation_id if operation_id is not None else tail_operation_id,
+        "operation": operation,
+    }
+
+    if operation == "bulk_create":
+        message["items"] = [
+            {
+                "operation_id": item_operation_id,
+                "payload": {"nome": nome, "marca": marca, "valor": valor},
+            }
+            for item_operation_id, nome, marca, valor in body
+        ]
+    else:
+        message["product_id"] = product_id
+        message["payload"] = (
+            None if body is None else {"nome": body[0], "marca": body[1], "valor": body[2]}
+        )
+
+    message["requested_by"] = requested_by
+    message["requested_at"] = requested_at if requested_at is not None else tail_requested_at
+    return message
+
+
+def decode_queue_message(raw_message: bytes | str, codec: JSONCodec) -> dict[str, object]:
+    if isinstance(raw_message, str) or not raw_message:
+        loaded = codec.loads(raw_message)
+    elif raw_message[0] == ENVELOPE_BINARY_V1:
+        loaded = _decode_envelope(raw_message, 1, codec)
+    elif raw_message[0] == ENVELOPE_BINARY_V1_ZLIB:
+        try:
+            body = zlib.decompress(memoryview(raw_message)[1:])
+        except zlib.error as exc:
+            raise ValueError("invalid_queue_message") from exc
+        loaded = _decode_envelope(body, 0, codec)
+    else:
+        loaded = codec.loads(raw_message)
+
+    if not isinstance(loaded, dict):
+        raise ValueError("invalid_queue_message")
+    return loaded
+
+
+def _decode_envelope(data: bytes, pos: int, codec: JSONCodec) -> dict[str, object]:
+    try:
+        return _decode_binary(data, pos, codec)
+    except (KeyError, IndexError, TypeError, struct.error, ValueError) as exc:
+        raise ValueError("invalid_queue_message") from exc
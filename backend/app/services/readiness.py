@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask, current_app
+
+from .database import check_database
+from .redis import check_redis
+
+DEFAULT_READINESS_CACHE_TTL_MS = 1000
+READINESS_EXECUTOR_MAX_WORKERS = 4
+
+
+def _read_non_negative_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed < 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+class ReadinessCache:
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._checks: dict[str, dict[str, object]] | None = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_or_refresh(
+        self,
+        refresh: Callable[[], dict[str, dict[str, object]]],
+    ) -> tuple[dict[str, dict[str, object]], bool]:
+        if self.ttl_seconds <= 0:
+            return refresh(), False
+
+        with self._lock:
+            if self._checks is not None and time.monotonic() < self._expires_at:
+                return self._checks, True
+
+            checks = refresh()
+            self._checks = checks
+            self._expires_at = time.monotonic() + self.ttl_seconds
+            return checks, False
+
+
+def configure_readiness(app: Flask) -> None:
+    cache_ttl_ms = _read_non_negative_int(
+        str(app.config.get("READINESS_CACHE_TTL_MS"))
+        if app.config.get("READINESS_CACHE_TTL_MS") is not None
+        else os.getenv("READINESS_CACHE_TTL_MS"),
+        DEFAULT_READINESS_CACHE_TTL_MS,
+    )
+
+    app.config["READINESS_CACHE_TTL_MS"] = cache_ttl_ms
+    app.extensions["readiness_cache"] = ReadinessCache(cache_ttl_ms / 1000)
+    app.extensions["readiness_executor"] = ThreadPoolExecutor(
+        max_workers=READINESS_EXECUTOR_MAX_WORKERS,
+        thread_name_prefix="readiness",
+    )
+
+
+def _check_database_in_context(app: Flask) -> dict[str, object]:
+    with app.app_context():
+        return check_database()
+
+
+def _run_checks(app: Flask) -> dict[str, dict[str, object]]:
+    executor = app.extensions.get("readiness_executor")
+    if not isinstance(executor, ThreadPoolExecutor):
+        return {"database": check_database(), "redis": check_redis()}
+
+    database_future = executor.submit(_check_database_in_context, app)
+    redis_check = check_redis()
+    return {"database": database_future.result(), "redis": redis_check}
+
+
+def run_readiness_checks() -> tuple[dict[str, dict[str, object]], bool]:
+    app = current_app._get_current_object()
+    cache = app.extensions.get("readiness_cache")
+    if not isinstance(cache, ReadinessCache):
+        return _run_checks(app), False
+    return cache.get_or_refresh(lambda: _run_checks(app))
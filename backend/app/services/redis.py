@@ -7,11 +7,19 @@ from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import RedisError
 from redis.exceptions import TimeoutError as RedisTimeoutError
 
+from .queue_backends import ALLOWED_QUEUE_BACKENDS, QUEUE_BACKEND_LIST
+from .queue_envelope import ALLOWED_MESSAGE_FORMATS, MESSAGE_FORMAT_JSON
+
 DEFAULT_REDIS_URL = "redis://redis:6379/0"
 DEFAULT_REDIS_SOCKET_CONNECT_TIMEOUT_MS = 1000
 DEFAULT_REDIS_SOCKET_TIMEOUT_MS = 5000
 DEFAULT_READINESS_REDIS_TIMEOUT_MS = 250
 DEFAULT_PRODUCTS_QUEUE_NAME = "queue:products"
+DEFAULT_PRODUCTS_QUEUE_VISIBILITY_TIMEOUT_SECONDS = 60
+DEFAULT_PRODUCTS_QUEUE_BACKEND = QUEUE_BACKEND_LIST
+DEFAULT_PRODUCTS_QUEUE_GROUP = "workers"
+DEFAULT_PRODUCTS_QUEUE_MESSAGE_FORMAT = MESSAGE_FORMAT_JSON
+DEFAULT_PRODUCTS_QUEUE_COMPRESSION_MIN_BYTES = 8192
 
 
 def _parse_bool(value: str | None, default: bool = False) -> bool:
@@ -34,6 +42,39 @@ def _read_positive_int(value: str | None, default: int) -> int:
         return default
 
 
+def _read_non_negative_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed < 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def _read_queue_backend(value: str | None) -> str:
+    if value is None:
+        return DEFAULT_PRODUCTS_QUEUE_BACKEND
+
+    normalized = value.strip().lower()
+    if normalized not in ALLOWED_QUEUE_BACKENDS:
+        return DEFAULT_PRODUCTS_QUEUE_BACKEND
+    return normalized
+
+
+def _read_message_format(value: str | None) -> str:
+    if value is None:
+        return DEFAULT_PRODUCTS_QUEUE_MESSAGE_FORMAT
+
+    normalized = value.strip().lower()
+    if normalized not in ALLOWED_MESSAGE_FORMATS:
+        return DEFAULT_PRODUCTS_QUEUE_MESSAGE_FORMAT
+    return normalized
+
+
 def _sanitize_redis_error(exc: Exception) -> str:
     message = str(exc).lower()
     if "timeout" in message:
@@ -108,12 +149,46 @@ def configure_redis(app: Flask) -> None:
         DEFAULT_PRODUCTS_QUEUE_NAME,
     )
 
+    products_queue_visibility_timeout_seconds = _read_positive_int(
+        str(app.config.get("PRODUCTS_QUEUE_VISIBILITY_TIMEOUT_SECONDS"))
+        if app.config.get("PRODUCTS_QUEUE_VISIBILITY_TIMEOUT_SECONDS") is not None
+        else os.getenv("PRODUCTS_QUEUE_VISIBILITY_TIMEOUT_SECONDS"),
+        DEFAULT_PRODUCTS_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+    )
+    products_queue_backend = _read_queue_backend(
+        str(app.config.get("PRODUCTS_QUEUE_BACKEND"))
+        if app.config.get("PRODUCTS_QUEUE_BACKEND") is not None
+        else os.getenv("PRODUCTS_QUEUE_BACKEND"),
+    )
+    products_queue_group = app.config.get("PRODUCTS_QUEUE_GROUP") or os.getenv(
+        "PRODUCTS_QUEUE_GROUP",
+        DEFAULT_PRODUCTS_QUEUE_GROUP,
+    )
+    products_queue_message_format = _read_message_format(
+        str(app.config.get("PRODUCTS_QUEUE_MESSAGE_FORMAT"))
+        if app.config.get("PRODUCTS_QUEUE_MESSAGE_FORMAT") is not None
+        else os.getenv("PRODUCTS_QUEUE_MESSAGE_FORMAT"),
+    )
+    products_queue_compression_min_bytes = _read_non_negative_int(
+        str(app.config.get("PRODUCTS_QUEUE_COMPRESSION_MIN_BYTES"))
+        if app.config.get("PRODUCTS_QUEUE_COMPRESSION_MIN_BYTES") is not None
+        else os.getenv("PRODUCTS_QUEUE_COMPRESSION_MIN_BYTES"),
+        DEFAULT_PRODUCTS_QUEUE_COMPRESSION_MIN_BYTES,
+    )
+
     app.config["REDIS_URL"] = redis_url
     app.config["REDIS_REQUIRED"] = redis_required
     app.config["REDIS_SOCKET_CONNECT_TIMEOUT_MS"] = redis_socket_connect_timeout_ms
     app.config["REDIS_SOCKET_TIMEOUT_MS"] = redis_socket_timeout_ms
     app.config["READINESS_REDIS_TIMEOUT_MS"] = readiness_redis_timeout_ms
     app.config["PRODUCTS_QUEUE_NAME"] = products_queue_name
+    app.config["PRODUCTS_QUEUE_VISIBILITY_TIMEOUT_SECONDS"] = (
+        products_queue_visibility_timeout_seconds
+    )
+    app.config["PRODUCTS_QUEUE_BACKEND"] = products_queue_backend
+    app.config["PRODUCTS_QUEUE_GROUP"] = products_queue_group
+    app.config["PRODUCTS_QUEUE_MESSAGE_FORMAT"] = products_queue_message_format
+    app.config["PRODUCTS_QUEUE_COMPRESSION_MIN_BYTES"] = products_queue_compression_min_bytes
 
     operational_client = _build_redis_client(
         redis_url,
@@ -0,0 +1,103 @@
+"""Mede vazao de POST /auth/login e a latencia de outras requests durante uma rajada de logins.
+
+Uso (com o banco do docker compose no ar):
+
+    python benchmarks/auth_login.py --threads 8 --logins 40 --pool-sizes 0 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import threading
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import create_app  # noqa: E402
+from app.auth.service import hash_password  # noqa: E402
+from app.models import User  # noqa: E402
+from app.services.database import db  # noqa: E402
+
+BENCH_USER_NAME = "bench-login"
+BENCH_USER_EMAIL = "bench-login@example.com"
+BENCH_PASSWORD = "bench-password"
+
+
+def _ensure_user(app) -> None:
+    with app.app_context():
+        User.query.filter(User.email == BENCH_USER_EMAIL).delete()
+        db.session.add(
+            User(
+                name=BENCH_USER_NAME,
+                email=BENCH_USER_EMAIL,
+                password_hash=hash_password(BENCH_PASSWORD),
+            )
+        )
+        db.session.commit()
+
+
+def _run_scenario(pool_size: int, method: str, threads: int, logins: int) -> tuple[float, float]:
+    app = create_app({"PASSWORD_HASH_POOL_SIZE": pool_size, "PASSWORD_HASH_METHOD": method})
+    _ensure_user(app)
+
+    stop_reads = threading.Event()
+    read_samples: list[float] = []
+
+    def login_loop() -> None:
+        client = app.test_client()
+        for _ in range(logins):
+            response = client.post(
+                "/auth/login",
+                json={"identifier": BENCH_USER_NAME, "password": BENCH_PASSWORD},
+            )
+            assert response.status_code == 200
+
+    def read_loop() -> None:
+        client = app.test_client()
+        while not stop_reads.is_set():
+            started = perf_counter()
+            client.get("/openapi.json")
+            read_samples.append((perf_counter() - started) * 1000)
+
+    reader = threading.Thread(target=read_loop)
+    workers = [threading.Thread(target=login_loop) for _ in range(threads)]
+
+    reader.start()
+    started = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = perf_counter() - started
+    stop_reads.set()
+    reader.join()
+
+    app.extensions["password_hasher"].shutdown()
+    read_p95 = statistics.quantiles(read_samples, n=20)[-1] if len(read_samples) > 1 else 0.0
+    return (threads * logins) / elapsed, read_p95
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--logins", type=int, default=40, help="logins por thread")
+    parser.add_argument("--method", default="scrypt:32768:8:1")
+    parser.add_argument("--pool-sizes", type=int, nargs="*", default=[0, 2, 4])
+    args = parser.parse_args()
+
+    print(f"{'pool':>6} {'logins_per_s':>13} {'read_p95_ms':>12}")
+    for pool_size in args.pool_sizes:
+        logins_per_second, read_p95 = _run_scenario(
+            pool_size,
+            args.method,
+            args.threads,
+            args.logins,
+        )
+        print(f"{pool_size:>6} {logins_per_second:>13.1f} {read_p95:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compara encode/decode de JSON entre o json.dumps com callback `default` e o JSONCodec (stdlib e orjson).
+
+Nao precisa de banco nem de Redis:
+
+    python benchmarks/json_codec.py --products 10000 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.json_codec import (  # noqa: E402
+    JSON_ENCODER_ORJSON,
+    JSON_ENCODER_STDLIB,
+    JSONCodec,
+    orjson,
+)
+from app.services.queue import build_bulk_create_message  # noqa: E402
+
+
+def _products(count: int) -> list[dict[str, object]]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": index,
+            "nome": f"Produto {index}",
+            "marca": f"Marca {index % 100}",
+            "valor": float((index % 1000) + 0.99),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+def _bulk_message(count: int) -> dict[str, object]:
+    payloads = [
+        {"nome": f"Produto {index}", "marca": "Marca", "valor": Decimal(f"{index % 1000}.99")}
+        for index in range(count)
+    ]
+    return build_bulk_create_message(payloads=payloads, requested_by="bench")
+
+
+def _median_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = perf_counter()
+        func()
+        samples.append((perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _legacy_default(value: object):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _codecs() -> dict[str, tuple]:
+    codecs = {
+        "json": (lambda obj: json.dumps(obj, default=_legacy_default).encode("utf-8"), json.loads),
+        JSON_ENCODER_STDLIB: JSONCodec(JSON_ENCODER_STDLIB),
+    }
+    if orjson is not None:
+        codecs[JSON_ENCODER_ORJSON] = JSONCodec(JSON_ENCODER_ORJSON)
+    return {
+        name: (codec.dumps, codec.loads) if isinstance(codec, JSONCodec) else codec
+        for name, codec in codecs.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "products": _products(args.products),
+        "bulk_message": _bulk_message(args.products),
+    }
+
+    print(f"{'payload':<14} {'encoder':<8} {'encode_ms':>10} {'decode_ms':>10} {'bytes':>10}")
+    for payload_name, payload in payloads.items():
+        for encoder_name, (dumps, loads) in _codecs().items():
+            raw = dumps(payload)
+            encode_ms = _median_ms(lambda: dumps(payload), args.repeat)
+            decode_ms = _median_ms(lambda: loads(raw), args.repeat)
+            print(
+                f"{payload_name:<14} {encoder_name:<8} {encode_ms:>10.2f} "
+                f"{decode_ms:>10.2f} {len(raw):>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Gera carga HTTP contra a API e compara o servidor de desenvolvimento com o gunicorn.
+
+Sobe cada servidor localmente em --port, espera responder e mede vazao/latencias:
+
+    python benchmarks/load_test.py --server all --concurrency 32 --duration 10
+    python benchmarks/load_test.py --server gthread gevent --concurrency 500 --path /ready
+
+Para medir um servidor ja no ar (por exemplo o servico `api` do compose):
+
+    python benchmarks/load_test.py --url http://localhost:5000 --path /products --token <jwt>
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+GUNICORN_COMMAND = ["gunicorn", "--config", "gunicorn.conf.py", "--bind", "127.0.0.1:{port}"]
+SERVERS = {
+    "dev": (["flask", "--app", "app", "run", "--host=127.0.0.1", "--port={port}", "--debug"], {}),
+    "gthread": (GUNICORN_COMMAND, {"GUNICORN_WORKER_CLASS": "gthread"}),
+    "gevent": (GUNICORN_COMMAND, {"GUNICORN_WORKER_CLASS": "gevent"}),
+}
+STARTUP_TIMEOUT_SECONDS = 20.0
+
+
+def _open_connection(base_url: str) -> http.client.HTTPConnection:
+    parts = urlsplit(base_url)
+    return http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+
+
+def _wait_until_up(base_url: str, path: str) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            connection = _open_connection(base_url)
+            connection.request("GET", path)
+            connection.getresponse().read()
+            connection.close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"servidor nao respondeu em {base_url}")
+
+
+def _run_load(
+    base_url: str,
+    paths: list[str],
+    headers: dict[str, str],
+    concurrency: int,
+    duration: float,
+) -> dict[str, float]:
+    deadline = time.monotonic() + duration
+    samples: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def worker(offset: int) -> None:
+        nonlocal errors
+        local_samples = []
+        local_errors = 0
+        connection = _open_connection(base_url)
+        request_index = offset
+        while time.monotonic() < deadline:
+            path = paths[request_index % len(paths)]
+            request_index += 1
+            started = time.perf_counter()
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status >= 500:
+                    local_errors += 1
+                if response.will_close:
+                    connection.close()
+                    connection = _open_connection(base_url)
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                connection.close()
+                connection = _open_connection(base_url)
+                continue
+            local_samples.append((time.perf_counter() - started) * 1000)
+        connection.close()
+        with lock:
+            samples.extend(local_samples)
+            errors += local_errors
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    percentiles = statistics.quantiles(samples, n=100) if len(samples) > 1 else [0.0] * 99
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": len(samples) / elapsed,
+        "p50_ms": percentiles[49],
+        "p95_ms": percentiles[94],
+        "p99_ms": percentiles[98],
+    }
+
+
+def _start_server(name: str, port: int) -> subprocess.Popen:
+    command, env = SERVERS[name]
+    return subprocess.Popen(
+        [part.format(port=port) for part in command],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "GUNICORN_ACCESS_LOG": "false", **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _print_result(label: str, result: dict[str, float]) -> None:
+    print(
+        f"{label:<10} {result['requests']:>9} {result['errors']:>7} {result['rps']:>9.1f} "
+        f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--server", nargs="*", choices=[*SERVERS, "all"], default=["all"])
+    parser.add_argument("--url", help="mede um servidor ja no ar em vez de subir um local")
+    parser.add_argument("--port", type=int, default=5055)
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("--token", help="JWT enviado como Bearer")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+
+    paths = args.paths or ["/openapi.json", "/ready"]
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+
+    print(f"{'servidor':<10} {'requests':>9} {'errors':>7} {'rps':>9} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8}")
+    if args.url:
+        _wait_until_up(args.url, paths[0])
+        _print_result("url", _run_load(args.url, paths, headers, args.concurrency, args.duration))
+        return
+
+    servers = list(SERVERS) if "all" in args.server else args.server
+    base_url = f"http://127.0.0.1:{args.port}"
+    for name in servers:
+        process = _start_server(name, args.port)
+        try:
+            _wait_until_up(base_url, paths[0])
+            result = _run_load(base_url, paths, headers, args.concurrency, args.duration)
+        finally:
+            process.terminate()
+            process.wait(timeout=STARTUP_TIMEOUT_SECONDS)
+        _print_result(name, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compara GET /openapi.json montando o spec a cada request com o spec pre-codificado.
+
+Nao precisa de banco nem Redis:
+
+    python benchmarks/openapi_json.py --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import Flask, jsonify  # noqa: E402
+
+from app.routes import api_bp  # noqa: E402
+from app.services.openapi_spec import build_openapi_spec  # noqa: E402
+
+
+def _build_app() -> Flask:
+    app = Flask(__name__)
+    app.register_blueprint(api_bp)
+
+    @app.route("/openapi-legacy.json")
+    def openapi_legacy():
+        return jsonify(build_openapi_spec())
+
+    return app
+
+
+def _time_requests(client, path: str, headers: dict[str, str], requests: int) -> tuple[float, int]:
+    samples = []
+    size = 0
+    for _ in range(requests):
+        started = perf_counter()
+        response = client.get(path, headers=headers)
+        samples.append((perf_counter() - started) * 1_000_000)
+        size = len(response.get_data())
+    return statistics.median(samples), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    client = _build_app().test_client()
+    client.get("/openapi.json")
+
+    scenarios = [
+        ("build por request", "/openapi-legacy.json", {}),
+        ("pre-codificado", "/openapi.json", {}),
+        ("pre-codificado gzip", "/openapi.json", {"Accept-Encoding": "gzip"}),
+    ]
+    print(f"{'cenario':<22} {'median_us':>10} {'bytes':>8}")
+    for label, path, headers in scenarios:
+        median_us, size = _time_requests(client, path, headers, args.requests)
+        print(f"{label:<22} {median_us:>10.1f} {size:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Compara paginacao por offset com paginacao por cursor (keyset) em GET /products.
+
+Uso (com o banco do docker compose no ar):
+
+    python benchmarks/products_pagination.py --rows 1000000 --limit 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import func, text  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.models import Product  # noqa: E402
+from app.services.database import db  # noqa: E402
+
+DEFAULT_OFFSETS = (0, 10_000, 100_000, 500_000, 900_000)
+
+
+def _seed_products(target_rows: int) -> None:
+    current_rows = int(db.session.query(func.count(Product.id)).scalar() or 0)
+    missing_rows = target_rows - current_rows
+    if missing_rows <= 0:
+        return
+
+    db.session.execute(
+        text(
+            """
+            INSERT INTO product (nome, marca, valor)
+            SELECT 'Produto ' || n, 'Marca ' || (n % 100), (n % 1000) + 0.99
+            FROM generate_series(1, :missing_rows) AS n
+            """
+        ),
+        {"missing_rows": missing_rows},
+    )
+    db.session.commit()
+    db.session.execute(text("ANALYZE product"))
+    db.session.commit()
+
+
+def _time_query(build_query, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = perf_counter()
+        build_query().all()
+        samples.append((perf_counter() - started) * 1000)
+        db.session.rollback()
+    return statistics.median(samples)
+
+
+def _offset_page(offset: int, limit: int):
+    return lambda: Product.query.order_by(Product.id.asc()).offset(offset).limit(limit)
+
+
+def _keyset_page(after_id: int, limit: int):
+    return (
+        lambda: Product.query.order_by(Product.id.asc())
+        .filter(Product.id > after_id)
+        .limit(limit)
+    )
+
+
+def _after_id_for_offset(offset: int) -> int:
+    if offset == 0:
+        return 0
+    row = (
+        db.session.query(Product.id)
+        .order_by(Product.id.asc())
+        .offset(offset - 1)
+        .limit(1)
+        .first()
+    )
+    return int(row[0]) if row is not None else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--offsets", type=int, nargs="*", default=list(DEFAULT_OFFSETS))
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        _seed_products(args.rows)
+
+        print(f"{'offset':>10} {'offset_ms':>10} {'keyset_ms':>10} {'speedup':>8}")
+        for offset in args.offsets:
+            after_id = _after_id_for_offset(offset)
+            offset_ms = _time_query(_offset_page(offset, args.limit), args.repeat)
+            keyset_ms = _time_query(_keyset_page(after_id, args.limit), args.repeat)
+            speedup = offset_ms / keyset_ms if keyset_ms else float("inf")
+            print(f"{offset:>10} {offset_ms:>10.2f} {keyset_ms:>10.2f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compara a serializacao de GET /products via objetos do ORM com a via de linhas simples.
+
+Uso (com o banco do docker compose no ar):
+
+    python benchmarks/products_serialization.py --rows 100000 --limits 50 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import jsonify  # noqa: E402
+from sqlalchemy import func, text  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.models import Product  # noqa: E402
+from app.services.database import db  # noqa: E402
+from app.services.products import (  # noqa: E402
+    _format_datetime,
+    select_product_rows,
+    serialize_product_rows,
+)
+
+DEFAULT_LIMITS = (50, 1000, 10_000)
+
+
+def _seed_products(target_rows: int) -> None:
+    current_rows = int(db.session.query(func.count(Product.id)).scalar() or 0)
+    missing_rows = target_rows - current_rows
+    if missing_rows <= 0:
+        return
+
+    db.session.execute(
+        text(
+            """
+            INSERT INTO product (nome, marca, valor)
+            SELECT 'Produto ' || n, 'Marca ' || (n % 100), (n % 1000) + 0.99
+            FROM generate_series(1, :missing_rows) AS n
+            """
+        ),
+        {"missing_rows": missing_rows},
+    )
+    db.session.commit()
+    db.session.execute(text("ANALYZE product"))
+    db.session.commit()
+
+
+def _serialize_orm_product(product: Product) -> dict[str, object]:
+    return {
+        "id": product.id,
+        "nome": product.nome,
+        "marca": product.marca,
+        "valor": float(product.valor),
+        "created_at": _format_datetime(product.created_at),
+        "updated_at": _format_datetime(product.updated_at),
+    }
+
+
+def _orm_page(limit: int) -> bytes:
+    products = Product.query.order_by(Product.id.asc()).limit(limit).all()
+    return jsonify([_serialize_orm_product(product) for product in products]).get_data()
+
+
+def _rows_page(limit: int) -> bytes:
+    dialect_name = db.engine.dialect.name
+    statement = select_product_rows(dialect_name).order_by(Product.id.asc()).limit(limit)
+    rows = db.session.execute(statement).all()
+    return jsonify(serialize_product_rows(rows, dialect_name)).get_data()
+
+
+def _time_page(render_page, limit: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = perf_counter()
+        render_page(limit)
+        samples.append((perf_counter() - started) * 1000)
+        db.session.rollback()
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limits", type=int, nargs="*", default=list(DEFAULT_LIMITS))
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context(), app.test_request_context():
+        _seed_products(args.rows)
+
+        print(f"{'limit':>10} {'orm_ms':>10} {'rows_ms':>10} {'speedup':>8}")
+        for limit in args.limits:
+            orm_ms = _time_page(_orm_page, limit, args.repeat)
+            rows_ms = _time_page(_rows_page, limit, args.repeat)
+            speedup = orm_ms / rows_ms if rows_ms else float("inf")
+            print(f"{limit:>10} {orm_ms:>10.2f} {rows_ms:>10.2f} {speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Compara tamanho e custo de encode/decode das mensagens da fila em JSON e no envelope binario.
+
+Nao precisa de banco nem de Redis:
+
+    python benchmarks/queue_envelope.py --messages 20000 --bulk-items 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+from decimal import Decimal
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.json_codec import JSONCodec  # noqa: E402
+from app.services.queue import (  # noqa: E402
+    build_bulk_create_message,
+    build_product_operation_message,
+)
+from app.services.queue_envelope import (  # noqa: E402
+    MESSAGE_FORMAT_BINARY,
+    MESSAGE_FORMAT_JSON,
+    decode_queue_message,
+    encode_queue_message,
+)
+
+SCENARIOS = {
+    "json": (MESSAGE_FORMAT_JSON, 0),
+    "binary": (MESSAGE_FORMAT_BINARY, 0),
+    "binary+zlib": (MESSAGE_FORMAT_BINARY, 1),
+}
+
+
+def _payload(index: int) -> dict[str, object]:
+    return {"nome": f"Produto {index}", "marca": f"Marca {index % 100}", "valor": Decimal("199.90")}
+
+
+def _single_messages(count: int) -> list[dict[str, object]]:
+    return [
+        build_product_operation_message(
+            operation="update",
+            requested_by="bench",
+            product_id=index + 1,
+            payload=_payload(index),
+        )
+        for index in range(count)
+    ]
+
+
+def _time_us(func, messages: list, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = perf_counter()
+        for message in messages:
+            func(message)
+        samples.append((perf_counter() - started) * 1_000_000 / len(messages))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--bulk-items", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    codec = JSONCodec()
+    workloads = {
+        "update": _single_messages(args.messages),
+        "bulk_create": [
+            build_bulk_create_message(
+                payloads=[_payload(index) for index in range(args.bulk_items)],
+                requested_by="bench",
+            )
+            for _ in range(max(args.messages // args.bulk_items, 1))
+        ],
+    }
+
+    print(f"encoder: {codec.encoder}")
+    print(f"{'message':<12} {'format':<12} {'bytes':>9} {'encode_us':>10} {'decode_us':>10}")
+    for workload, messages in workloads.items():
+        for scenario, (message_format, compression_min_bytes) in SCENARIOS.items():
+            def encode(message, message_format=message_format, min_bytes=compression_min_bytes):
+                return encode_queue_message(message, codec, message_format, min_bytes)
+
+            raw_messages = [encode(message) for message in messages]
+            average_bytes = sum(len(raw) for raw in raw_messages) / len(raw_messages)
+            encode_us = _time_us(encode, messages, args.repeat)
+            decode_us = _time_us(lambda raw: decode_queue_message(raw, codec), raw_messages, args.repeat)
+            print(
+                f"{workload:<12} {scenario:<12} {average_bytes:>9.0f} "
+                f"{encode_us:>10.2f} {decode_us:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
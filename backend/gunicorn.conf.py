@@ -0,0 +1,80 @@
+import multiprocessing
+import os
+
+DEFAULT_BIND = "0.0.0.0:5000"
+DEFAULT_WORKER_CLASS = "gthread"
+SUPPORTED_WORKER_CLASSES = {"gthread", "gevent"}
+DEFAULT_WORKER_CONNECTIONS = 1000
+DEFAULT_THREADS = 4
+DEFAULT_TIMEOUT_SECONDS = 60
+DEFAULT_GRACEFUL_TIMEOUT_SECONDS = 30
+DEFAULT_KEEPALIVE_SECONDS = 5
+DEFAULT_MAX_REQUESTS = 5000
+DEFAULT_MAX_REQUESTS_JITTER = 500
+
+
+def _parse_bool(value: str | None, default: bool = False) -> bool:
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    return normalized in {"1", "true", "yes", "on"}
+
+
+def _read_positive_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed <= 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def _read_worker_class(value: str | None) -> str:
+    if value is None:
+        return DEFAULT_WORKER_CLASS
+    normalized = value.strip().lower()
+    if normalized not in SUPPORTED_WORKER_CLASSES:
+        return DEFAULT_WORKER_CLASS
+    return normalized
+
+
+def _default_workers() -> int:
+    return min(multiprocessing.cpu_count() * 2 + 1, 8)
+
+
+wsgi_app = "app:app"
+bind = os.getenv("GUNICORN_BIND", DEFAULT_BIND)
+worker_class = _read_worker_class(os.getenv("GUNICORN_WORKER_CLASS"))
+workers = _read_positive_int(os.getenv("GUNICORN_WORKERS"), _default_workers())
+threads = _read_positive_int(os.getenv("GUNICORN_THREADS"), DEFAULT_THREADS)
+worker_connections = _read_positive_int(
+    os.getenv("GUNICORN_WORKER_CONNECTIONS"),
+    DEFAULT_WORKER_CONNECTIONS,
+)
+timeout = _read_positive_int(os.getenv("GUNICORN_TIMEOUT_SECONDS"), DEFAULT_TIMEOUT_SECONDS)
+graceful_timeout = _read_positive_int(
+    os.getenv("GUNICORN_GRACEFUL_TIMEOUT_SECONDS"),
+    DEFAULT_GRACEFUL_TIMEOUT_SECONDS,
+)
+keepalive = _read_positive_int(os.getenv("GUNICORN_KEEPALIVE_SECONDS"), DEFAULT_KEEPALIVE_SECONDS)
+max_requests = _read_positive_int(os.getenv("GUNICORN_MAX_REQUESTS"), DEFAULT_MAX_REQUESTS)
+max_requests_jitter = _read_positive_int(
+    os.getenv("GUNICORN_MAX_REQUESTS_JITTER"),
+    DEFAULT_MAX_REQUESTS_JITTER,
+)
+accesslog = "-" if _parse_bool(os.getenv("GUNICORN_ACCESS_LOG"), True) else None
+errorlog = "-"
+
+
+def post_worker_init(worker):
+    if worker_class != "gevent":
+        return
+
+    from psycopg import waiting
+
+    if waiting.wait is getattr(waiting, "wait_c", None):
+        worker.log.warning("psycopg was imported before gevent patching; database I/O will block the worker")
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
 from decimal import Decimal
 
 import pytest
 from flask_migrate import upgrade
-from sqlalchemy import text
+from sqlalchemy import event, text
 
 from app import create_app
 from app.auth.service import create_access_token, hash_password
@@ -32,6 +33,8 @@ def app():
         "REDIS_URL": DEFAULT_TEST_REDIS_URL,
         "REDIS_REQUIRED": False,
         "PRODUCTS_QUEUE_NAME": DEFAULT_TEST_QUEUE_NAME,
+        "PRODUCTS_CACHE_ENABLED": False,
+        "PASSWORD_HASH_POOL_SIZE": 0,
         "JWT_SECRET_KEY": "test-secret-key",
         "JWT_EXPIRES_SECONDS": 3600,
     }
@@ -115,3 +118,23 @@ def seed_product(app):
             }
 
     return _seed
+
+
+@pytest.fixture
+def count_queries(app):
+    @contextmanager
+    def _count():
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, _parameters, _context, _executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+    return _count
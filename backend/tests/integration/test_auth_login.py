@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from werkzeug.security import generate_password_hash
+
 from app.auth.service import decode_access_token, hash_password
 from app.models import User
 from app.services.database import db
@@ -76,3 +78,31 @@ def test_products_requires_valid_token(client):
 
     assert response.status_code == 401
     assert response.get_json() == {"error": "missing_token"}
+
+
+def test_login_rehashes_password_stored_with_old_parameters(app, client):
+    with app.app_context():
+        user = User(
+            name="legacy-user",
+            email="legacy@example.com",
+            password_hash=generate_password_hash("legacy-password", "pbkdf2:sha256:1000"),
+        )
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+    response = client.post(
+        "/auth/login",
+        json={"identifier": "legacy-user", "password": "legacy-password"},
+    )
+
+    assert response.status_code == 200
+    with app.app_context():
+        stored_hash = db.session.get(User, user_id).password_hash
+    assert stored_hash.startswith(str(app.config["PASSWORD_HASH_METHOD"]) + "$")
+
+    second_login = client.post(
+        "/auth/login",
+        json={"identifier": "legacy-user", "password": "legacy-password"},
+    )
+    assert second_login.status_code == 200
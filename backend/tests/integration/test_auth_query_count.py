@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+
+def test_login_by_email_runs_single_query(client, test_user, count_queries):
+    with count_queries() as statements:
+        response = client.post(
+            "/auth/login",
+            json={"identifier": test_user["email"], "password": test_user["password"]},
+        )
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+
+def test_login_by_name_runs_single_query(client, test_user, count_queries):
+    with count_queries() as statements:
+        response = client.post(
+            "/auth/login",
+            json={"identifier": str(test_user["name"]).upper(), "password": test_user["password"]},
+        )
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+
+def test_login_unknown_identifier_runs_single_query(client, count_queries):
+    with count_queries() as statements:
+        response = client.post(
+            "/auth/login",
+            json={"identifier": "ghost", "password": "whatever-password"},
+        )
+
+    assert response.status_code == 401
+    assert len(statements) == 1
+
+
+def test_register_success_query_count(client, count_queries):
+    with count_queries() as statements:
+        response = client.post(
+            "/auth/register",
+            json={"name": "counted", "email": "counted@example.com", "password": "strong-pass"},
+        )
+
+    assert response.status_code == 201
+    assert len(statements) == 3
+
+
+def test_register_conflict_runs_single_query(client, test_user, count_queries):
+    with count_queries() as statements:
+        response = client.post(
+            "/auth/register",
+            json={
+                "name": str(test_user["name"]).upper(),
+                "email": "another@example.com",
+                "password": "strong-pass",
+            },
+        )
+
+    assert response.status_code == 409
+    assert response.get_json() == {"error": "name_already_exists"}
+    assert len(statements) == 1
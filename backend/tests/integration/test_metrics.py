@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+
+def test_metrics_reports_database_pool(client, auth_headers):
+    client.get("/products?limit=5", headers=auth_headers)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    pool = response.get_json()["database_pool"]
+    assert pool["pool"] == "TimedQueuePool"
+    assert pool["pre_ping"] is True
+    assert pool["size"] == 3
+    assert pool["checked_out"] == 0
+    assert pool["wait_ms"]["count"] >= 1
+    assert pool["wait_ms"]["buckets"]["inf"] == pool["wait_ms"]["count"]
+    assert pool["connect_ms"]["count"] >= 1
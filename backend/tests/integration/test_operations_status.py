@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import worker
+
+
+def _process_next(app) -> bool:
+    with app.app_context():
+        return worker.process_next_message(timeout=1)
+
+
+def test_operation_status_moves_from_queued_to_success(app, client, auth_headers):
+    enqueue_response = client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Mouse", "marca": "ACME", "valor": 80},
+    )
+    operation_id = enqueue_response.get_json()["operation_id"]
+
+    queued = client.get(f"/operations/{operation_id}", headers=auth_headers)
+    assert queued.status_code == 200
+    assert queued.get_json()["status"] == "queued"
+    assert queued.get_json()["operation"] == "create"
+
+    assert _process_next(app) is True
+
+    done = client.get(f"/operations/{operation_id}", headers=auth_headers)
+    body = done.get_json()
+    assert done.status_code == 200
+    assert body["status"] == "success"
+    assert isinstance(body["product_id"], int)
+    assert body["error"] is None
+
+
+def test_operation_status_records_worker_errors(app, client, auth_headers):
+    enqueue_response = client.delete("/products/999999", headers=auth_headers)
+    operation_id = enqueue_response.get_json()["operation_id"]
+
+    assert _process_next(app) is False
+
+    response = client.get(f"/operations/{operation_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "error"
+    assert response.get_json()["error"] == "product_not_found"
+
+
+def test_list_operations_returns_known_and_unknown_ids(client, auth_headers):
+    enqueue_response = client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Teclado", "marca": "ACME", "valor": 120},
+    )
+    operation_id = enqueue_response.get_json()["operation_id"]
+
+    response = client.get(
+        f"/operations?ids={operation_id},desconhecida",
+        headers=auth_headers,
+    )
+
+    operations = response.get_json()["operations"]
+    assert response.status_code == 200
+    assert operations[operation_id]["status"] == "queued"
+    assert operations["desconhecida"] is None
+
+
+def test_get_operation_returns_404_for_unknown_id(client, auth_headers):
+    response = client.get("/operations/desconhecida", headers=auth_headers)
+
+    assert response.status_code == 404
+    assert response.get_json() == {"error": "operation_not_found"}
+
+
+def test_list_operations_validates_ids(client, auth_headers):
+    missing = client.get("/operations", headers=auth_headers)
+    too_many = client.get(
+        "/operations?ids=" + ",".join(f"op-{index}" for index in range(101)),
+        headers=auth_headers,
+    )
+
+    assert missing.status_code == 400
+    assert missing.get_json() == {"error": "ids_is_required"}
+    assert too_many.status_code == 400
+    assert too_many.get_json() == {"error": "too_many_operation_ids"}
+
+
+def test_operations_require_auth(client):
+    response = client.get("/operations/qualquer")
+
+    assert response.status_code == 401
+
+
+def _read_sse_events(response) -> list[tuple[str, dict]]:
+    events = []
+    for block in response.get_data(as_text=True).split("\n\n"):
+        lines = dict(
+            line.split(": ", 1) for line in block.splitlines() if line and not line.startswith(":")
+        )
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_operation_events_stream_finished_operations(app, client, auth_headers):
+    enqueue_response = client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Mouse", "marca": "ACME", "valor": 80},
+    )
+    operation_id = enqueue_response.get_json()["operation_id"]
+    assert _process_next(app) is True
+
+    response = client.get(
+        f"/operations/events?ids={operation_id},desconhecida",
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    events = _read_sse_events(response)
+    assert [event for event, _ in events] == ["operation", "not_found", "done"]
+    assert events[0][1]["status"] == "success"
+    assert events[1][1] == {"operation_id": "desconhecida"}
+
+
+def test_operation_events_receive_worker_publish(app, client, auth_headers):
+    enqueue_response = client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Teclado", "marca": "ACME", "valor": 120},
+    )
+    operation_id = enqueue_response.get_json()["operation_id"]
+
+    worker_thread = threading.Timer(0.3, _process_next, args=(app,))
+    worker_thread.start()
+    response = client.get(f"/operations/events?ids={operation_id}", headers=auth_headers)
+    worker_thread.join()
+
+    events = _read_sse_events(response)
+    assert [event for event, _ in events] == ["operation", "done"]
+    assert events[0][1]["operation_id"] == operation_id
+    assert events[0][1]["status"] == "success"
+
+
+def test_operation_events_time_out_when_operation_stays_queued(
+    app,
+    client,
+    auth_headers,
+    monkeypatch,
+):
+    enqueue_response = client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Fone", "marca": "ACME", "valor": 200},
+    )
+    operation_id = enqueue_response.get_json()["operation_id"]
+    monkeypatch.setitem(app.config, "OPERATION_EVENTS_TIMEOUT_SECONDS", 1)
+
+    response = client.get(f"/operations/events?ids={operation_id}", headers=auth_headers)
+
+    assert _read_sse_events(response) == [("timeout", {"pending": [operation_id]})]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+
+import worker
+from app.models import Product
+from app.services.operation_status import get_operation_statuses
+
+
+def _items(count: int) -> list[dict[str, object]]:
+    return [{"nome": f"Produto {index}", "marca": "ACME", "valor": index + 1} for index in range(count)]
+
+
+def test_bulk_create_enqueues_chunks_in_one_push(app, client, auth_headers, redis_client, queue_name):
+    app.config["PRODUCTS_BULK_CHUNK_SIZE"] = 2
+    try:
+        response = client.post("/products/bulk", headers=auth_headers, json=_items(5))
+    finally:
+        app.config["PRODUCTS_BULK_CHUNK_SIZE"] = 500
+
+    assert response.status_code == 202
+    body = response.get_json()
+    assert body["status"] == "queued"
+    assert body["operation"] == "create"
+    assert len(body["operation_ids"]) == 5
+    assert int(redis_client.llen(queue_name)) == 3
+
+    with app.app_context():
+        statuses = get_operation_statuses(body["operation_ids"])
+    assert {status["status"] for status in statuses.values()} == {"queued"}
+
+
+def test_bulk_create_accepts_ndjson(client, auth_headers, redis_client, queue_name):
+    response = client.post(
+        "/products/bulk",
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+        data="\n".join(json.dumps(item) for item in _items(3)) + "\n",
+    )
+
+    assert response.status_code == 202
+    assert len(response.get_json()["operation_ids"]) == 3
+    assert int(redis_client.llen(queue_name)) == 1
+
+
+def test_bulk_create_rejects_invalid_items_without_enqueueing(
+    client,
+    auth_headers,
+    redis_client,
+    queue_name,
+):
+    items = _items(3)
+    items[1]["valor"] = -1
+
+    response = client.post("/products/bulk", headers=auth_headers, json=items)
+
+    assert response.status_code == 400
+    assert response.get_json() == {
+        "error": "invalid_items",
+        "items": [{"index": 1, "error": "valor_must_be_greater_than_zero"}],
+    }
+    assert int(redis_client.llen(queue_name)) == 0
+
+
+def test_bulk_create_rejects_items_over_column_limits(
+    client,
+    auth_headers,
+    redis_client,
+    queue_name,
+):
+    items = _items(3)
+    items[0]["nome"] = "N" * 256
+    items[2]["valor"] = 1e12
+
+    response = client.post("/products/bulk", headers=auth_headers, json=items)
+
+    assert response.status_code == 400
+    assert response.get_json() == {
+        "error": "invalid_items",
+        "items": [
+            {"index": 0, "error": "nome_too_long"},
+            {"index": 2, "error": "valor_too_large"},
+        ],
+    }
+    assert int(redis_client.llen(queue_name)) == 0
+
+
+def test_bulk_create_rejects_empty_and_oversized_batches(app, client, auth_headers):
+    empty = client.post("/products/bulk", headers=auth_headers, json=[])
+    app.config["PRODUCTS_BULK_MAX_ITEMS"] = 2
+    try:
+        oversized = client.post("/products/bulk", headers=auth_headers, json=_items(3))
+    finally:
+        app.config["PRODUCTS_BULK_MAX_ITEMS"] = 1000
+
+    assert empty.status_code == 400
+    assert empty.get_json() == {"error": "items_are_required"}
+    assert oversized.status_code == 400
+    assert oversized.get_json() == {"error": "too_many_items"}
+
+
+def test_worker_inserts_bulk_message_and_reports_each_item(app, client, auth_headers):
+    response = client.post("/products/bulk", headers=auth_headers, json=_items(4))
+    operation_ids = response.get_json()["operation_ids"]
+
+    with app.app_context():
+        assert worker.process_next_message(timeout=1) is True
+        products = Product.query.order_by(Product.id.asc()).all()
+        statuses = get_operation_statuses(operation_ids)
+
+    assert [product.nome for product in products] == [f"Produto {index}" for index in range(4)]
+    assert [statuses[operation_id]["product_id"] for operation_id in operation_ids] == [
+        product.id for product in products
+    ]
+    assert {status["status"] for status in statuses.values()} == {"success"}
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import pytest
+
+import worker
+
+
+@pytest.fixture
+def cache_enabled(app, monkeypatch):
+    monkeypatch.setitem(app.config, "PRODUCTS_CACHE_ENABLED", True)
+
+
+def _process_next(app) -> bool:
+    with app.app_context():
+        return worker.process_next_message(timeout=1)
+
+
+def test_products_page_is_served_from_cache_until_worker_commits(
+    app,
+    client,
+    auth_headers,
+    seed_product,
+    cache_enabled,
+):
+    seed_product(nome="Mouse", marca="ACME", valor=80)
+
+    first = client.get("/products?limit=10", headers=auth_headers)
+    second = client.get("/products?limit=10", headers=auth_headers)
+
+    assert first.headers["X-Cache"] == "miss"
+    assert second.headers["X-Cache"] == "hit"
+    assert second.get_data() == first.get_data()
+    assert second.headers["X-Total-Count"] == "1"
+
+    client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Teclado", "marca": "ACME", "valor": 120},
+    )
+    assert _process_next(app) is True
+
+    after_write = client.get("/products?limit=10", headers=auth_headers)
+    assert after_write.headers["X-Cache"] == "miss"
+    assert after_write.headers["X-Total-Count"] == "2"
+    assert [product["nome"] for product in after_write.get_json()] == ["Mouse", "Teclado"]
+
+
+def test_products_cache_keys_pages_by_offset_and_cursor(
+    client,
+    auth_headers,
+    seed_product,
+    cache_enabled,
+):
+    for index in range(3):
+        seed_product(nome=f"Produto {index}", marca="ACME", valor=10 + index)
+
+    first_page = client.get("/products?limit=2", headers=auth_headers)
+    next_page = client.get(
+        f"/products?limit=2&cursor={first_page.headers['X-Next-Cursor']}",
+        headers=auth_headers,
+    )
+    offset_page = client.get("/products?limit=2&offset=2", headers=auth_headers)
+
+    assert next_page.headers["X-Cache"] == "miss"
+    assert offset_page.headers["X-Cache"] == "miss"
+    assert [product["nome"] for product in next_page.get_json()] == ["Produto 2"]
+    assert offset_page.get_json() == next_page.get_json()
+
+
+def test_products_cache_skips_unpaged_listing(client, auth_headers, cache_enabled):
+    response = client.get("/products", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "X-Cache" not in response.headers
+
+
+def test_metrics_reports_products_cache_hits_and_misses(client, auth_headers, cache_enabled):
+    client.get("/products?limit=5", headers=auth_headers)
+    client.get("/products?limit=5", headers=auth_headers)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.get_json()["products_cache"] == {
+        "enabled": True,
+        "generation": 0,
+        "hits": 1,
+        "misses": 1,
+    }
+
+
+def test_products_page_answers_304_until_worker_commits(
+    app,
+    client,
+    auth_headers,
+    seed_product,
+    cache_enabled,
+):
+    seed_product(nome="Mouse", marca="ACME", valor=80)
+
+    first = client.get("/products?limit=10", headers=auth_headers)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"products-0-')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    revalidated = client.get(
+        "/products?limit=10",
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b""
+
+    other_page = client.get(
+        "/products?limit=10&offset=1",
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert other_page.status_code == 200
+
+    client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Teclado", "marca": "ACME", "valor": 120},
+    )
+    assert _process_next(app) is True
+
+    after_write = client.get(
+        "/products?limit=10",
+        headers={**auth_headers, "If-None-Match": etag},
+    )
+    assert after_write.status_code == 200
+    assert after_write.headers["ETag"] != etag
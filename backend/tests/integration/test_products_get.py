@@ -63,3 +63,56 @@ def test_get_products_with_invalid_pagination_returns_400(client, auth_headers):
 
     assert response.status_code == 400
     assert response.get_json() == {"error": "offset_must_be_non_negative_integer"}
+
+
+def test_get_products_with_after_id_seeks_past_given_id(app, client, auth_headers):
+    with app.app_context():
+        for nome in ("Produto A", "Produto B", "Produto C"):
+            db.session.add(Product(nome=nome, marca="Marca", valor=Decimal("10.00")))
+        db.session.commit()
+        first_id = Product.query.order_by(Product.id.asc()).first().id
+
+    response = client.get(f"/products?after_id={first_id}&limit=1", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers.get("X-Total-Count") == "3"
+    assert response.headers.get("X-Offset") is None
+    body = response.get_json()
+    assert [item["nome"] for item in body] == ["Produto B"]
+
+    next_cursor = response.headers.get("X-Next-Cursor")
+    assert next_cursor
+
+    next_page = client.get(f"/products?cursor={next_cursor}&limit=5", headers=auth_headers)
+    assert next_page.status_code == 200
+    assert [item["nome"] for item in next_page.get_json()] == ["Produto C"]
+    assert next_page.headers.get("X-Next-Cursor") is None
+
+
+def test_get_products_rejects_offset_combined_with_cursor(client, auth_headers):
+    response = client.get("/products?offset=1&after_id=1", headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "offset_and_cursor_are_mutually_exclusive"}
+
+
+def test_get_products_rejects_invalid_cursor(client, auth_headers):
+    response = client.get("/products?cursor=not-a-cursor", headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "invalid_cursor"}
+
+
+def test_get_products_reports_count_strategy(app, client, auth_headers, monkeypatch):
+    with app.app_context():
+        db.session.add(Product(nome="Produto A", marca="Marca", valor=Decimal("10.00")))
+        db.session.commit()
+
+    response = client.get("/products", headers=auth_headers)
+    assert response.headers.get("X-Total-Count") == "1"
+    assert response.headers.get("X-Total-Count-Strategy") == "exact"
+
+    monkeypatch.setitem(app.config, "PRODUCTS_COUNT_STRATEGY", "redis")
+    response = client.get("/products", headers=auth_headers)
+    assert response.headers.get("X-Total-Count") == "1"
+    assert response.headers.get("X-Total-Count-Strategy") == "redis"
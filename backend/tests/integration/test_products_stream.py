@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+
+
+def test_unbounded_listing_streams_json_array(client, auth_headers, seed_product):
+    for index in range(3):
+        seed_product(nome=f"Produto {index}", marca="ACME", valor=10 + index)
+
+    response = client.get("/products", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.mimetype == "application/json"
+    assert response.headers["X-Total-Count"] == "3"
+    assert [product["nome"] for product in response.get_json()] == [
+        "Produto 0",
+        "Produto 1",
+        "Produto 2",
+    ]
+    assert response.get_json() == client.get("/products?limit=3", headers=auth_headers).get_json()
+
+
+def test_unbounded_listing_streams_empty_array(client, auth_headers):
+    response = client.get("/products", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.get_data() == b"[]"
+
+
+def test_listing_streams_ndjson_when_requested(client, auth_headers, seed_product):
+    for index in range(3):
+        seed_product(nome=f"Produto {index}", marca="ACME", valor=10 + index)
+
+    response = client.get(
+        "/products?offset=1",
+        headers={**auth_headers, "Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert "Accept" in response.headers["Vary"]
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line)["nome"] for line in lines] == ["Produto 1", "Produto 2"]
+
+
+def test_limit_above_max_page_size_is_rejected(app, client, auth_headers):
+    app.config["PRODUCTS_MAX_PAGE_SIZE"] = 5
+    try:
+        rejected = client.get("/products?limit=6", headers=auth_headers)
+        streamed = client.get(
+            "/products?limit=6",
+            headers={**auth_headers, "Accept": "application/x-ndjson"},
+        )
+    finally:
+        app.config["PRODUCTS_MAX_PAGE_SIZE"] = 1000
+
+    assert rejected.status_code == 400
+    assert rejected.get_json() == {"error": "limit_exceeds_max_page_size"}
+    assert streamed.status_code == 200
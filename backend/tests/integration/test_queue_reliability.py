@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import worker
+from app.services.queue import (
+    ack_product_operations,
+    build_product_operation_message,
+    enqueue_product_operation,
+    get_processing_list_name,
+    requeue_expired_operations,
+    reserve_product_operations,
+)
+
+
+def _enqueue_create(nome: str) -> str:
+    message = build_product_operation_message(
+        operation="create",
+        requested_by="test-user",
+        payload={"nome": nome, "marca": "ACME", "valor": 10},
+    )
+    enqueue_product_operation(message)
+    return str(message["operation_id"])
+
+
+def test_reserve_moves_messages_to_processing_list_until_ack(app, redis_client, queue_name):
+    with app.app_context():
+        first_id = _enqueue_create("Mouse")
+        second_id = _enqueue_create("Teclado")
+
+        reserved = reserve_product_operations("consumer-a", count=5, timeout=1)
+        processing_list = get_processing_list_name("consumer-a")
+
+        assert [item.message["operation_id"] for item in reserved] == [first_id, second_id]
+        assert int(redis_client.llen(queue_name)) == 0
+        assert int(redis_client.llen(processing_list)) == 2
+
+        acked = ack_product_operations("consumer-a", reserved)
+
+    assert acked == 2
+    assert int(redis_client.llen(processing_list)) == 0
+
+
+def test_requeue_returns_stuck_messages_to_queue(app, redis_client, queue_name):
+    with app.app_context():
+        operation_id = _enqueue_create("Mouse")
+        reserve_product_operations("crashed-consumer", count=1, timeout=1)
+
+        assert requeue_expired_operations(visibility_timeout_seconds=3600) == 0
+        assert int(redis_client.llen(queue_name)) == 0
+
+        assert requeue_expired_operations(visibility_timeout_seconds=0) == 1
+        processing_list = get_processing_list_name("crashed-consumer")
+        assert int(redis_client.llen(processing_list)) == 0
+
+        redelivered = reserve_product_operations("consumer-b", count=1, timeout=1)
+
+    assert [item.message["operation_id"] for item in redelivered] == [operation_id]
+
+
+def test_worker_acks_processed_message(app, redis_client):
+    with app.app_context():
+        _enqueue_create("Mouse")
+        assert worker.process_next_message(timeout=1, consumer_id="consumer-a") is True
+
+        processing_list = get_processing_list_name("consumer-a")
+        assert int(redis_client.llen(processing_list)) == 0
+
+
+def test_stream_backend_delivers_acks_and_reclaims_messages(app, monkeypatch):
+    monkeypatch.setitem(app.config, "PRODUCTS_QUEUE_BACKEND", "stream")
+
+    with app.app_context():
+        first_id = _enqueue_create("Mouse")
+        second_id = _enqueue_create("Teclado")
+
+        reserved = reserve_product_operations("consumer-a", count=1, timeout=1)
+        assert [item.message["operation_id"] for item in reserved] == [first_id]
+
+        other = reserve_product_operations("consumer-b", count=5, timeout=1)
+        assert [item.message["operation_id"] for item in other] == [second_id]
+        assert ack_product_operations("consumer-b", other) == 1
+
+        assert requeue_expired_operations(visibility_timeout_seconds=0) == 1
+        redelivered = reserve_product_operations("consumer-b", count=5, timeout=1)
+
+    assert [item.message["operation_id"] for item in redelivered] == [first_id]
+
+
+def test_worker_processes_messages_from_stream_backend(app, client, auth_headers, monkeypatch):
+    monkeypatch.setitem(app.config, "PRODUCTS_QUEUE_BACKEND", "stream")
+    response = client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Mouse", "marca": "ACME", "valor": 80},
+    )
+    assert response.status_code == 202
+
+    with app.app_context():
+        assert worker.process_next_batch(10, timeout=1, consumer_id="consumer-a") is True
+
+    body = client.get("/products", headers=auth_headers).get_json()
+    assert [item["nome"] for item in body] == ["Mouse"]
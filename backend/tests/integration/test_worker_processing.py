@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import json
+from time import perf_counter
+
 import worker
+from app.models import Product
+
+STOP_DEADLINE_SECONDS = 5.0
 
 
 def _process_next(app) -> bool:
@@ -67,3 +73,61 @@ def test_worker_processes_delete_after_enqueue(app, client, auth_headers, seed_p
 
     after = client.get("/products", headers=auth_headers).get_json()
     assert after == []
+
+
+def test_worker_batch_applies_valid_messages_and_isolates_failures(
+    app,
+    client,
+    auth_headers,
+    seed_product,
+    redis_client,
+    queue_name,
+):
+    seeded = seed_product(nome="Headset", marca="C", valor=500)
+    client.post("/products", headers=auth_headers, json={"nome": "Mouse", "marca": "A", "valor": 10})
+    client.delete(f"/products/{seeded['id']}", headers=auth_headers)
+    client.delete(f"/products/{seeded['id']}", headers=auth_headers)
+    client.post("/products", headers=auth_headers, json={"nome": "Teclado", "marca": "B", "valor": 20})
+    assert int(redis_client.llen(queue_name)) == 4
+
+    with app.app_context():
+        assert worker.process_next_batch(10, timeout=1) is True
+
+    assert int(redis_client.llen(queue_name)) == 0
+    after = client.get("/products", headers=auth_headers).get_json()
+    assert [item["nome"] for item in after] == ["Mouse", "Teclado"]
+
+
+def test_worker_commits_message_queued_right_after_failure_without_delay(
+    app,
+    client,
+    auth_headers,
+    redis_client,
+    queue_name,
+):
+    redis_client.lpush(queue_name, json.dumps({"operation_id": "op-bad", "operation": "unknown"}))
+    enqueued_at = perf_counter()
+    response = client.post(
+        "/products",
+        headers=auth_headers,
+        json={"nome": "Mouse", "marca": "ACME", "valor": 80},
+    )
+    assert response.status_code == 202
+
+    committed_at: list[float] = []
+    deadline = perf_counter() + STOP_DEADLINE_SECONDS
+
+    def stop_requested() -> bool:
+        if Product.query.count() > 0:
+            committed_at.append(perf_counter())
+            return True
+        return perf_counter() >= deadline
+
+    with app.app_context():
+        worker.run_forever(poll_timeout=1, stop_requested=stop_requested)
+
+    assert committed_at, f"product was not committed within {STOP_DEADLINE_SECONDS}s"
+    enqueue_to_commit_seconds = committed_at[0] - enqueued_at
+    assert enqueue_to_commit_seconds < 0.5, (
+        f"enqueue_to_commit_ms={enqueue_to_commit_seconds * 1000:.1f}"
+    )
@@ -2,9 +2,22 @@ from __future__ import annotations
 
 import pytest
 from flask import Flask
+from werkzeug.security import generate_password_hash
 
 from app.auth import init_auth
-from app.auth.service import AuthError, create_access_token, decode_access_token, hash_password, verify_password
+from app.auth import service as auth_service
+from app.auth import token_cache as token_cache_module
+from app.auth.service import (
+    AuthError,
+    create_access_token,
+    decode_access_token,
+    get_token_cache_stats,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+from app.auth.passwords import PasswordHasher
+from app.auth.token_cache import TokenCache
 
 
 @pytest.fixture
@@ -37,3 +50,128 @@ def test_hash_password_and_verify_password():
     assert password_hash != "my-password"
     assert verify_password("my-password", password_hash)
     assert not verify_password("wrong-password", password_hash)
+
+
+def test_decode_access_token_uses_verified_token_cache(auth_app, monkeypatch):
+    with auth_app.app_context():
+        token = create_access_token(user_id=7, identifier="alice")
+        decode_calls = []
+        original_decode = auth_service.jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            decode_calls.append(1)
+            return original_decode(*args, **kwargs)
+
+        monkeypatch.setattr(auth_service.jwt, "decode", counting_decode)
+
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+        stats = get_token_cache_stats()
+
+    assert first == second
+    assert len(decode_calls) == 1
+    assert stats == {
+        "enabled": True,
+        "size": 1,
+        "max_size": 1024,
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_decode_access_token_skips_cache_when_disabled():
+    flask_app = Flask(__name__)
+    flask_app.config["JWT_SECRET_KEY"] = "unit-test-secret"
+    flask_app.config["JWT_CACHE_ENABLED"] = False
+    init_auth(flask_app)
+
+    with flask_app.app_context():
+        token = create_access_token(user_id=7, identifier="alice")
+        assert decode_access_token(token)["sub"] == "7"
+        assert get_token_cache_stats() == {"enabled": False}
+
+
+def test_token_cache_evicts_least_recently_used_and_expired_entries(monkeypatch):
+    now = 1_000.0
+    monkeypatch.setattr(token_cache_module.time, "time", lambda: now)
+    cache = TokenCache(max_size=2)
+
+    cache.put("a", {"sub": "1", "exp": now + 60})
+    cache.put("b", {"sub": "2", "exp": now + 5})
+    assert cache.get("a") == {"sub": "1", "exp": now + 60}
+    cache.put("c", {"sub": "3", "exp": now + 60})
+
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+    now += 120
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 1
+
+
+def test_token_cache_ignores_payload_without_exp():
+    cache = TokenCache(max_size=2)
+
+    cache.put("a", {"sub": "1"})
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_init_auth_reads_password_hash_settings(monkeypatch):
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    monkeypatch.setenv("PASSWORD_HASH_POOL_SIZE", "0")
+    flask_app = Flask(__name__)
+
+    init_auth(flask_app)
+
+    assert flask_app.config["PASSWORD_HASH_METHOD"] == "pbkdf2:sha256:1000"
+    assert flask_app.config["PASSWORD_HASH_POOL_SIZE"] == 0
+
+
+def test_init_auth_rejects_unknown_password_hash_method(monkeypatch):
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "md5")
+    flask_app = Flask(__name__)
+
+    init_auth(flask_app)
+
+    assert flask_app.config["PASSWORD_HASH_METHOD"] == "scrypt:32768:8:1"
+
+
+def test_password_needs_rehash_when_configured_method_changes():
+    old_hasher = PasswordHasher("pbkdf2:sha256:1000", pool_size=0)
+    new_hasher = PasswordHasher("pbkdf2:sha256:2000", pool_size=0)
+    old_hash = old_hasher.hash("my-password")
+
+    assert old_hash.startswith("pbkdf2:sha256:1000$")
+    assert new_hasher.verify("my-password", old_hash)
+    assert new_hasher.needs_rehash(old_hash)
+    assert not old_hasher.needs_rehash(old_hash)
+    assert not new_hasher.needs_rehash(new_hasher.hash("my-password"))
+
+
+def test_password_hasher_runs_in_process_pool():
+    hasher = PasswordHasher("pbkdf2:sha256:1000", pool_size=1)
+    try:
+        password_hash = hasher.hash("my-password")
+
+        assert hasher.verify("my-password", password_hash)
+        assert not hasher.verify("wrong-password", password_hash)
+    finally:
+        hasher.shutdown()
+
+
+def test_hash_password_uses_app_configured_method():
+    flask_app = Flask(__name__)
+    flask_app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:1000"
+    flask_app.config["PASSWORD_HASH_POOL_SIZE"] = 0
+    init_auth(flask_app)
+
+    with flask_app.app_context():
+        password_hash = hash_password("my-password")
+
+        assert password_hash.startswith("pbkdf2:sha256:1000$")
+        assert verify_password("my-password", password_hash)
+        assert not password_needs_rehash(password_hash)
+        assert password_needs_rehash(generate_password_hash("my-password"))
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+
+import pytest
+from flask import Flask
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.services import database as database_service
+
+POSTGRES_URL = "postgresql+psycopg://postgres:postgres@db:5432/desafio"
+
+
+def test_configure_database_pool_defaults(monkeypatch):
+    for name in (
+        "DATABASE_POOL_SIZE",
+        "DATABASE_MAX_OVERFLOW",
+        "DATABASE_POOL_TIMEOUT_SECONDS",
+        "DATABASE_POOL_RECYCLE_SECONDS",
+        "DATABASE_POOL_PRE_PING",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = POSTGRES_URL
+
+    database_service.configure_database(app)
+
+    assert app.config["SQLALCHEMY_ENGINE_OPTIONS"] == {
+        "pool_pre_ping": True,
+        "poolclass": database_service.TimedQueuePool,
+        "pool_size": 3,
+        "max_overflow": 2,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "connect_args": {"connect_timeout": 1},
+    }
+
+
+def test_configure_database_pool_from_env(monkeypatch):
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "10")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DATABASE_POOL_TIMEOUT_SECONDS", "2")
+    monkeypatch.setenv("DATABASE_POOL_RECYCLE_SECONDS", "300")
+    monkeypatch.setenv("DATABASE_POOL_PRE_PING", "false")
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = POSTGRES_URL
+
+    database_service.configure_database(app)
+
+    options = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+    assert options["pool_pre_ping"] is False
+    assert options["pool_size"] == 10
+    assert options["max_overflow"] == 0
+    assert options["pool_timeout"] == 2
+    assert options["pool_recycle"] == 300
+    assert app.config["DATABASE_POOL_PRE_PING"] is False
+
+
+def test_configure_database_ignores_invalid_pool_values(monkeypatch):
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "0")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "-1")
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = POSTGRES_URL
+
+    database_service.configure_database(app)
+
+    assert app.config["DATABASE_POOL_SIZE"] == 3
+    assert app.config["DATABASE_MAX_OVERFLOW"] == 2
+
+
+def test_pool_wait_histogram_snapshot_is_cumulative():
+    histogram = database_service.PoolWaitHistogram(buckets_ms=(1, 10))
+
+    histogram.observe(0.5)
+    histogram.observe(4)
+    histogram.observe(250)
+    histogram.record_timeout()
+
+    assert histogram.snapshot() == {
+        "count": 3,
+        "sum_ms": 254.5,
+        "max_ms": 250.0,
+        "timeouts": 1,
+        "buckets": {"1": 1, "10": 2, "inf": 3},
+    }
+
+
+def test_timed_queue_pool_records_waits_and_timeouts():
+    pool = database_service.TimedQueuePool(
+        lambda: sqlite3.connect(":memory:", check_same_thread=False),
+        pool_size=1,
+        max_overflow=0,
+        timeout=0.05,
+    )
+
+    connection = pool.connect()
+    with pytest.raises(PoolTimeoutError):
+        pool.connect()
+    connection.close()
+    pool.connect().close()
+
+    snapshot = pool.wait_histogram.snapshot()
+    assert snapshot["count"] == 2
+    assert snapshot["timeouts"] == 1
+
+
+def test_timed_queue_pool_excludes_connect_time_from_wait():
+    def slow_connect():
+        time.sleep(0.05)
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    pool = database_service.TimedQueuePool(slow_connect, pool_size=1, max_overflow=0)
+
+    pool.connect().close()
+    pool.connect().close()
+
+    wait = pool.wait_histogram.snapshot()
+    connect = pool.connect_histogram.snapshot()
+    assert wait["count"] == 2
+    assert wait["max_ms"] < 50
+    assert connect["count"] == 1
+    assert connect["max_ms"] >= 50
+
+
+def test_recreated_pool_keeps_timing():
+    pool = database_service.TimedQueuePool(
+        lambda: sqlite3.connect(":memory:", check_same_thread=False),
+        pool_size=1,
+    )
+
+    recreated = pool.recreate()
+
+    assert isinstance(recreated, database_service.TimedQueuePool)
+    assert recreated.wait_histogram.snapshot()["count"] == 0
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from flask import Flask
+
+from app.services.json_codec import (
+    JSON_ENCODER_ORJSON,
+    JSON_ENCODER_STDLIB,
+    FastJSONProvider,
+    JSONCodec,
+    configure_json,
+    orjson,
+)
+
+ENCODERS = [
+    JSON_ENCODER_STDLIB,
+    pytest.param(
+        JSON_ENCODER_ORJSON,
+        marks=pytest.mark.skipif(orjson is None, reason="orjson is not installed"),
+    ),
+]
+
+
+@pytest.mark.parametrize("encoder", ENCODERS)
+def test_json_codec_encodes_decimal_and_datetimes(encoder):
+    codec = JSONCodec(encoder)
+
+    raw = codec.dumps(
+        {
+            "valor": Decimal("12.50"),
+            "naive": datetime(2026, 2, 11, 12, 0, 0, 123456),
+            "utc": datetime(2026, 2, 11, 12, 0, 0, tzinfo=timezone.utc),
+            "local": datetime(2026, 2, 11, 9, 0, 0, tzinfo=timezone(timedelta(hours=-3))),
+            "id": UUID("12345678-1234-5678-1234-567812345678"),
+            "nome": "Caneca",
+        }
+    )
+
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == {
+        "valor": 12.5,
+        "naive": "2026-02-11T12:00:00Z",
+        "utc": "2026-02-11T12:00:00Z",
+        "local": "2026-02-11T09:00:00-03:00",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "nome": "Caneca",
+    }
+
+
+@pytest.mark.parametrize("encoder", ENCODERS)
+def test_json_codec_output_matches_between_encoders(encoder):
+    payload = {"b": [1, 2.5, None, True], "a": {"nome": "Cafe", "valor": Decimal("3.10")}}
+
+    sorted_codec = JSONCodec(encoder, sort_keys=True)
+
+    assert sorted_codec.dumps(payload) == JSONCodec(JSON_ENCODER_STDLIB, sort_keys=True).dumps(payload)
+    assert sorted_codec.loads(sorted_codec.dumps(payload)) == {
+        "a": {"nome": "Cafe", "valor": 3.1},
+        "b": [1, 2.5, None, True],
+    }
+
+
+@pytest.mark.parametrize("encoder", ENCODERS)
+def test_json_codec_rejects_unknown_types_and_invalid_input(encoder):
+    codec = JSONCodec(encoder)
+
+    with pytest.raises(TypeError):
+        codec.dumps({"value": object()})
+    with pytest.raises(ValueError):
+        codec.loads(b"{not-json")
+
+
+def test_configure_json_installs_provider_and_falls_back_on_unknown_encoder():
+    app = Flask(__name__)
+    app.config["JSON_ENCODER"] = "simdjson"
+
+    configure_json(app)
+
+    assert isinstance(app.json, FastJSONProvider)
+    assert app.config["JSON_ENCODER"] in {JSON_ENCODER_ORJSON, JSON_ENCODER_STDLIB}
+    assert app.extensions["json_codec"].encoder == app.config["JSON_ENCODER"]
+
+
+def test_configure_json_honors_stdlib_encoder(monkeypatch):
+    monkeypatch.setenv("JSON_ENCODER", "stdlib")
+    app = Flask(__name__)
+
+    configure_json(app)
+
+    assert app.config["JSON_ENCODER"] == JSON_ENCODER_STDLIB
+    assert app.json.codec.encoder == JSON_ENCODER_STDLIB
+
+
+def test_fast_json_provider_response_is_compact_and_sorted():
+    app = Flask(__name__)
+    configure_json(app)
+
+    with app.app_context():
+        response = app.json.response({"valor": Decimal("9.90"), "nome": "Livro"})
+
+    assert response.mimetype == "application/json"
+    assert response.get_data() == b'{"nome":"Livro","valor":9.9}\n'
+    assert app.json.loads(app.json.dumps({"a": 1})) == {"a": 1}
+    assert app.json.dumps({"b": 1, "a": 2}, indent=2) == '{\n  "a": 2,\n  "b": 1\n}'
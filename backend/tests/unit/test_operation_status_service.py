@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+
+from flask import Flask
+import pytest
+
+from app.routes.operations import _parse_operation_ids
+from app.services import operation_status as operation_status_service
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: list[tuple[str, str, str, int | None]] = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, value, ex))
+        return self
+
+    def publish(self, channel, value):
+        self.commands.append(("publish", channel, value, None))
+        return self
+
+    def execute(self):
+        self.redis.executed_pipelines += 1
+        for command, key, value, ex in self.commands:
+            if command == "publish":
+                self.redis.published.append((key, json.loads(value)))
+                continue
+            self.redis.values[key] = value.encode("utf-8")
+            self.redis.expirations[key] = ex
+        return [True] * len(self.commands)
+
+
+class FakePubSub:
+    def __init__(self, messages: list[dict[str, object] | None]):
+        self.messages = list(messages)
+        self.channels: list[str] = []
+        self.closed = False
+
+    def subscribe(self, *channels):
+        self.channels.extend(channels)
+
+    def get_message(self, timeout=0.0):
+        if not self.messages:
+            return None
+        status = self.messages.pop(0)
+        if status is None:
+            return None
+        return {"type": "message", "data": json.dumps(status).encode("utf-8")}
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.expirations: dict[str, int | None] = {}
+        self.executed_pipelines = 0
+        self.published: list[tuple[str, dict[str, object]]] = []
+        self.pubsub_client = FakePubSub([])
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return self.pubsub_client
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+
+@pytest.fixture
+def status_app():
+    app = Flask(__name__)
+    app.config["OPERATION_STATUS_TTL_SECONDS"] = 120
+    return app
+
+
+def test_configure_operation_status_reads_ttl_from_env(monkeypatch):
+    monkeypatch.setenv("OPERATION_STATUS_TTL_SECONDS", "30")
+    app = Flask(__name__)
+
+    operation_status_service.configure_operation_status(app)
+
+    assert app.config["OPERATION_STATUS_TTL_SECONDS"] == 30
+
+
+def test_configure_operation_status_ignores_invalid_ttl(monkeypatch):
+    monkeypatch.setenv("OPERATION_STATUS_TTL_SECONDS", "-1")
+    app = Flask(__name__)
+
+    operation_status_service.configure_operation_status(app)
+
+    assert (
+        app.config["OPERATION_STATUS_TTL_SECONDS"]
+        == operation_status_service.DEFAULT_OPERATION_STATUS_TTL_SECONDS
+    )
+
+
+def test_record_operation_statuses_uses_single_pipeline_with_ttl(status_app):
+    fake_redis = FakeRedis()
+
+    with status_app.app_context():
+        operation_status_service.record_operation_statuses(
+            [
+                operation_status_service.build_operation_status(
+                    operation_id="op-1",
+                    operation="create",
+                    status=operation_status_service.OPERATION_STATUS_QUEUED,
+                ),
+                operation_status_service.build_operation_status(
+                    operation_id="op-2",
+                    operation="delete",
+                    status=operation_status_service.OPERATION_STATUS_ERROR,
+                    product_id=7,
+                    error="product_not_found",
+                ),
+            ],
+            client=fake_redis,
+        )
+
+    assert fake_redis.executed_pipelines == 1
+    assert fake_redis.expirations == {"operations:op-1": 120, "operations:op-2": 120}
+    stored = json.loads(fake_redis.values["operations:op-2"])
+    assert stored["status"] == "error"
+    assert stored["product_id"] == 7
+    assert stored["error"] == "product_not_found"
+    assert stored["updated_at"].endswith("Z")
+    assert [channel for channel, _ in fake_redis.published] == ["operations:events:op-2"]
+
+
+def test_record_operation_statuses_skips_empty_list(status_app):
+    fake_redis = FakeRedis()
+
+    with status_app.app_context():
+        operation_status_service.record_operation_statuses([], client=fake_redis)
+
+    assert fake_redis.executed_pipelines == 0
+
+
+def test_get_operation_statuses_returns_none_for_unknown_ids(status_app):
+    fake_redis = FakeRedis()
+    fake_redis.values["operations:op-1"] = json.dumps(
+        {"operation_id": "op-1", "status": "success"}
+    ).encode("utf-8")
+
+    statuses = operation_status_service.get_operation_statuses(
+        ["op-1", "op-missing"],
+        client=fake_redis,
+    )
+
+    assert statuses == {
+        "op-1": {"operation_id": "op-1", "status": "success"},
+        "op-missing": None,
+    }
+
+
+def _store_status(fake_redis: FakeRedis, operation_id: str, status: str) -> None:
+    fake_redis.values[f"operations:{operation_id}"] = json.dumps(
+        {"operation_id": operation_id, "status": status}
+    ).encode("utf-8")
+
+
+def test_iter_operation_events_emits_finished_and_published_statuses():
+    fake_redis = FakeRedis()
+    _store_status(fake_redis, "op-1", "success")
+    _store_status(fake_redis, "op-2", "queued")
+    fake_redis.pubsub_client = FakePubSub(
+        [
+            None,
+            {"operation_id": "op-other", "status": "success"},
+            {"operation_id": "op-2", "status": "error"},
+        ]
+    )
+
+    events = list(
+        operation_status_service.iter_operation_events(
+            ["op-1", "op-2", "op-missing"],
+            timeout_seconds=5,
+            keepalive_seconds=60,
+            client=fake_redis,
+        )
+    )
+
+    assert events == [
+        ("operation", {"operation_id": "op-1", "status": "success"}),
+        ("not_found", {"operation_id": "op-missing"}),
+        ("operation", {"operation_id": "op-2", "status": "error"}),
+        ("done", {}),
+    ]
+    assert fake_redis.pubsub_client.channels == [
+        "operations:events:op-1",
+        "operations:events:op-2",
+        "operations:events:op-missing",
+    ]
+    assert fake_redis.pubsub_client.closed is True
+
+
+def test_iter_operation_events_sends_keepalive_and_times_out(monkeypatch):
+    fake_redis = FakeRedis()
+    _store_status(fake_redis, "op-1", "queued")
+    clock = iter([0.0, 0.0, 0.0, 2.0, 2.0, 2.0, 4.0])
+    monkeypatch.setattr(operation_status_service.time, "monotonic", lambda: next(clock))
+
+    events = list(
+        operation_status_service.iter_operation_events(
+            ["op-1"],
+            timeout_seconds=3,
+            keepalive_seconds=1,
+            client=fake_redis,
+        )
+    )
+
+    assert events == [("keepalive", None), ("timeout", {"pending": ["op-1"]})]
+    assert fake_redis.pubsub_client.closed is True
+
+
+def test_parse_operation_ids_dedupes_and_validates():
+    assert _parse_operation_ids("a, b,a,,c") == ["a", "b", "c"]
+
+    with pytest.raises(ValueError, match="ids_is_required"):
+        _parse_operation_ids(None)
+    with pytest.raises(ValueError, match="ids_is_required"):
+        _parse_operation_ids(" , ")
+    with pytest.raises(ValueError, match="too_many_operation_ids"):
+        _parse_operation_ids(
+            ",".join(
+                f"op-{index}"
+                for index in range(operation_status_service.MAX_OPERATION_IDS_PER_LOOKUP + 1)
+            )
+        )
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from flask import Flask
+import pytest
+
+from app.services import product_cache as product_cache_service
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self.redis = redis
+        self.commands: list[tuple[str, tuple[object, ...], dict[str, object]]] = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return _queue
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.hashes: dict[str, dict[str, object]] = {}
+        self.expirations: dict[str, int] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value).encode("utf-8")
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def hincrby(self, key, field, amount):
+        current = int(self.hashes.setdefault(key, {}).get(field, 0))
+        self.hashes[key][field] = current + amount
+        return current + amount
+
+    def hgetall(self, key):
+        return {
+            field.encode("utf-8"): str(value).encode("utf-8")
+            for field, value in self.hashes.get(key, {}).items()
+        }
+
+    def expire(self, key, seconds):
+        self.expirations[key] = seconds
+        return True
+
+    def eval(self, _script, _num_keys, generation_key, page_prefix, stats_key, variant):
+        generation = str(self.values.get(generation_key, 0))
+        page = self.hashes.get(f"{page_prefix}{generation}:{variant}", {})
+        self.hincrby(stats_key, "hits" if "body" in page else "misses", 1)
+        headers = page.get("headers")
+        return [
+            generation.encode("utf-8"),
+            page.get("body"),
+            headers.encode("utf-8") if headers is not None else None,
+        ]
+
+
+@pytest.fixture
+def cache_app():
+    app = Flask(__name__)
+    app.config["PRODUCTS_CACHE_ENABLED"] = True
+    app.config["PRODUCTS_CACHE_PREFIX"] = "products:cache:test"
+    app.config["PRODUCTS_CACHE_TTL_SECONDS"] = 45
+    return app
+
+
+def test_configure_products_cache_defaults(monkeypatch):
+    monkeypatch.delenv("PRODUCTS_CACHE_ENABLED", raising=False)
+    monkeypatch.delenv("PRODUCTS_CACHE_TTL_SECONDS", raising=False)
+    app = Flask(__name__)
+
+    product_cache_service.configure_products_cache(app)
+
+    assert app.config["PRODUCTS_CACHE_ENABLED"] is True
+    assert app.config["PRODUCTS_CACHE_PREFIX"] == "products:cache"
+    assert app.config["PRODUCTS_CACHE_TTL_SECONDS"] == 300
+
+
+def test_configure_products_cache_can_be_disabled_from_env(monkeypatch):
+    monkeypatch.setenv("PRODUCTS_CACHE_ENABLED", "false")
+    app = Flask(__name__)
+
+    product_cache_service.configure_products_cache(app)
+
+    with app.app_context():
+        assert product_cache_service.products_cache_enabled() is False
+
+
+def test_build_products_page_variant_distinguishes_offset_and_cursor():
+    assert (
+        product_cache_service.build_products_page_variant(offset=20, after_id=None, limit=10)
+        == "offset:20:limit:10"
+    )
+    assert (
+        product_cache_service.build_products_page_variant(offset=0, after_id=20, limit=10)
+        == "after:20:limit:10"
+    )
+
+
+def test_build_products_etag_changes_with_generation_and_variant():
+    etag = product_cache_service.build_products_etag("3", "offset:0:limit:10")
+
+    assert etag.startswith("products-3-")
+    assert etag == product_cache_service.build_products_etag("3", "offset:0:limit:10")
+    assert etag != product_cache_service.build_products_etag("4", "offset:0:limit:10")
+    assert etag != product_cache_service.build_products_etag("3", "offset:10:limit:10")
+
+
+def test_get_products_cache_generation_defaults_to_zero(cache_app):
+    fake_redis = FakeRedis()
+
+    with cache_app.app_context():
+        assert product_cache_service.get_products_cache_generation(client=fake_redis) == "0"
+        product_cache_service.bump_products_cache_generation(client=fake_redis)
+        assert product_cache_service.get_products_cache_generation(client=fake_redis) == "1"
+
+
+def test_products_cache_miss_store_hit_and_invalidate(cache_app):
+    fake_redis = FakeRedis()
+    headers = {"X-Total-Count": "3", "X-Limit": "10"}
+
+    with cache_app.app_context():
+        generation, page = product_cache_service.get_cached_products_page(
+            "offset:0:limit:10",
+            client=fake_redis,
+        )
+        assert (generation, page) == ("0", None)
+
+        product_cache_service.store_products_page(
+            generation,
+            "offset:0:limit:10",
+            b"[]",
+            headers,
+            client=fake_redis,
+        )
+        assert fake_redis.expirations == {"products:cache:test:page:0:offset:0:limit:10": 45}
+
+        _, cached = product_cache_service.get_cached_products_page(
+            "offset:0:limit:10",
+            client=fake_redis,
+        )
+        assert cached == product_cache_service.CachedProductsPage(body=b"[]", headers=headers)
+
+        assert product_cache_service.bump_products_cache_generation(client=fake_redis) == 1
+        generation, page = product_cache_service.get_cached_products_page(
+            "offset:0:limit:10",
+            client=fake_redis,
+        )
+        assert (generation, page) == ("1", None)
+
+        stats = product_cache_service.get_products_cache_stats(client=fake_redis)
+
+    assert stats == {"generation": 1, "hits": 1, "misses": 2}
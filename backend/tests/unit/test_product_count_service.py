@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from flask import Flask
+import pytest
+
+from app.services import product_count as product_count_service
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values: dict[str, int] = {}
+        self.set_calls: list[dict[str, object]] = []
+
+    def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value).encode("utf-8")
+
+    def set(self, key, value, ex=None, nx=False):
+        self.set_calls.append({"key": key, "value": value, "ex": ex, "nx": nx})
+        if nx and key in self.values:
+            return None
+        self.values[key] = int(value)
+        return True
+
+    def eval(self, _script, _num_keys, key, delta):
+        if key not in self.values:
+            return None
+        self.values[key] += int(delta)
+        return self.values[key]
+
+
+@pytest.fixture
+def count_app():
+    app = Flask(__name__)
+    app.config["PRODUCTS_COUNT_KEY"] = "products:count:test"
+    app.config["PRODUCTS_COUNT_TTL_SECONDS"] = 60
+    return app
+
+
+def test_configure_product_count_defaults_to_exact(monkeypatch):
+    monkeypatch.delenv("PRODUCTS_COUNT_STRATEGY", raising=False)
+    app = Flask(__name__)
+
+    product_count_service.configure_product_count(app)
+
+    assert app.config["PRODUCTS_COUNT_STRATEGY"] == "exact"
+    assert app.config["PRODUCTS_COUNT_KEY"] == "products:count"
+    assert app.config["PRODUCTS_COUNT_TTL_SECONDS"] == 300
+
+
+def test_configure_product_count_reads_env_and_ignores_unknown_strategy(monkeypatch):
+    monkeypatch.setenv("PRODUCTS_COUNT_STRATEGY", " Estimated ")
+    app = Flask(__name__)
+    product_count_service.configure_product_count(app)
+    assert app.config["PRODUCTS_COUNT_STRATEGY"] == "estimated"
+
+    other_app = Flask(__name__)
+    other_app.config["PRODUCTS_COUNT_STRATEGY"] = "guess"
+    product_count_service.configure_product_count(other_app)
+    assert other_app.config["PRODUCTS_COUNT_STRATEGY"] == "exact"
+
+
+def test_count_products_estimated_falls_back_to_exact_when_never_analyzed(count_app, monkeypatch):
+    count_app.config["PRODUCTS_COUNT_STRATEGY"] = "estimated"
+    monkeypatch.setattr(product_count_service, "_estimated_count", lambda: None)
+    monkeypatch.setattr(product_count_service, "_exact_count", lambda: 7)
+
+    with count_app.app_context():
+        assert product_count_service.count_products() == (7, "exact")
+
+    monkeypatch.setattr(product_count_service, "_estimated_count", lambda: 1200)
+    with count_app.app_context():
+        assert product_count_service.count_products() == (1200, "estimated")
+
+
+def test_count_products_redis_seeds_counter_from_exact_count(count_app, monkeypatch):
+    count_app.config["PRODUCTS_COUNT_STRATEGY"] = "redis"
+    fake_redis = FakeRedis()
+    exact_calls: list[int] = []
+
+    def fake_exact_count() -> int:
+        exact_calls.append(1)
+        return 3
+
+    monkeypatch.setattr(product_count_service, "_exact_count", fake_exact_count)
+
+    with count_app.app_context():
+        assert product_count_service.count_products(client=fake_redis) == (3, "redis")
+        assert product_count_service.adjust_products_counter(1, client=fake_redis) == 4
+        assert product_count_service.count_products(client=fake_redis) == (4, "redis")
+
+    assert len(exact_calls) == 1
+    assert fake_redis.set_calls == [
+        {"key": "products:count:test", "value": 3, "ex": 60, "nx": True}
+    ]
+
+
+def test_adjust_products_counter_does_not_create_missing_key(count_app):
+    fake_redis = FakeRedis()
+
+    with count_app.app_context():
+        assert product_count_service.adjust_products_counter(-1, client=fake_redis) is None
+
+    assert fake_redis.values == {}
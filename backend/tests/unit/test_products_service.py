@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
 
-from app.services.products import validate_product_payload
+from sqlalchemy.dialects import postgresql
+
+from app.services.products import (
+    decode_product_cursor,
+    encode_product_cursor,
+    select_product_rows,
+    serialize_product_rows,
+    validate_product_payload,
+)
 
 
 def test_validate_product_payload_accepts_valid_data():
@@ -30,6 +39,11 @@ def test_validate_product_payload_accepts_valid_data():
             {"nome": "X", "marca": "Y", "valor": 0},
             "valor_must_be_greater_than_zero",
         ),
+        ({"nome": "X" * 256, "marca": "Y", "valor": 1}, "nome_too_long"),
+        ({"nome": "X", "marca": "Y" * 256, "valor": 1}, "marca_too_long"),
+        ({"nome": "X", "marca": "Y", "valor": "10000000000"}, "valor_too_large"),
+        ({"nome": "X", "marca": "Y", "valor": 1e30}, "valor_too_large"),
+        ({"nome": "X", "marca": "Y", "valor": "NaN"}, "valor_must_be_numeric"),
     ],
 )
 def test_validate_product_payload_rejects_invalid_data(raw_payload, expected_error):
@@ -37,3 +51,59 @@ def test_validate_product_payload_rejects_invalid_data(raw_payload, expected_err
         validate_product_payload(raw_payload)
 
     assert str(exc.value) == expected_error
+
+
+def test_product_cursor_round_trip():
+    cursor = encode_product_cursor(1234)
+
+    assert "1234" not in cursor
+    assert decode_product_cursor(cursor) == 1234
+
+
+@pytest.mark.parametrize("raw_cursor", ["", "not-base64!", "eHl6OjE", "aWQ6YWJj"])
+def test_decode_product_cursor_rejects_invalid_values(raw_cursor):
+    with pytest.raises(ValueError) as exc:
+        decode_product_cursor(raw_cursor)
+
+    assert str(exc.value) == "invalid_cursor"
+
+
+def test_serialize_product_rows_formats_values_in_python():
+    created_at = datetime(2024, 5, 1, 12, 30, 45, 123456)
+    updated_at = datetime(2024, 5, 1, 9, 0, 0, tzinfo=timezone(timedelta(hours=-3)))
+    rows = [(7, "Teclado", "Keychron", Decimal("199.90"), created_at, updated_at)]
+
+    assert serialize_product_rows(rows, "sqlite") == [
+        {
+            "id": 7,
+            "nome": "Teclado",
+            "marca": "Keychron",
+            "valor": 199.9,
+            "created_at": "2024-05-01T12:30:45Z",
+            "updated_at": "2024-05-01T12:00:00Z",
+        }
+    ]
+
+
+def test_serialize_product_rows_keeps_database_formatted_values():
+    rows = [(1, "Mouse", "Logi", 99.9, "2024-05-01T12:30:45Z", "2024-05-02T08:00:00Z")]
+
+    assert serialize_product_rows(rows, "postgresql") == [
+        {
+            "id": 1,
+            "nome": "Mouse",
+            "marca": "Logi",
+            "valor": 99.9,
+            "created_at": "2024-05-01T12:30:45Z",
+            "updated_at": "2024-05-02T08:00:00Z",
+        }
+    ]
+    assert serialize_product_rows([], "postgresql") == []
+
+
+def test_select_product_rows_formats_columns_in_postgres():
+    compiled = str(select_product_rows("postgresql").compile(dialect=postgresql.dialect()))
+
+    assert "CAST(product.valor AS FLOAT) AS valor" in compiled
+    assert "to_char(timezone(" in compiled
+    assert "to_char" not in str(select_product_rows("sqlite"))
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from app.services.json_codec import JSON_ENCODER_ORJSON, JSON_ENCODER_STDLIB, JSONCodec, orjson
+from app.services.queue import build_bulk_create_message, build_product_operation_message
+from app.services.queue_envelope import (
+    ENVELOPE_BINARY_V1,
+    ENVELOPE_BINARY_V1_ZLIB,
+    MESSAGE_FORMAT_BINARY,
+    MESSAGE_FORMAT_JSON,
+    decode_queue_message,
+    encode_queue_message,
+)
+
+CODECS = [
+    JSONCodec(JSON_ENCODER_STDLIB),
+    pytest.param(
+        JSONCodec(JSON_ENCODER_ORJSON),
+        marks=pytest.mark.skipif(orjson is None, reason="orjson is not installed"),
+    ),
+]
+
+
+def _bulk_message(count: int) -> dict[str, object]:
+    return build_bulk_create_message(
+        payloads=[
+            {"nome": f"Produto {index}", "marca": "ACME", "valor": Decimal("10.50")}
+            for index in range(count)
+        ],
+        requested_by="test-user",
+        requested_at="2026-02-11T12:00:00Z",
+    )
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize(
+    "message",
+    [
+        build_product_operation_message(
+            operation="create",
+            requested_by="test-user",
+            payload={"nome": "Caneca ção", "marca": "ACME", "valor": Decimal("12.50")},
+            requested_at="2026-02-11T12:00:00Z",
+        ),
+        build_product_operation_message(
+            operation="update",
+            requested_by="test-user",
+            product_id=42,
+            payload={"nome": "Mouse", "marca": "ACME", "valor": 99},
+        ),
+        build_product_operation_message(
+            operation="delete",
+            requested_by="test-user",
+            product_id=7,
+            operation_id="op-legacy",
+            requested_at="2026-02-11T12:00:00.123Z",
+        ),
+    ],
+)
+def test_binary_envelope_round_trips_like_json(codec, message):
+    raw = encode_queue_message(message, codec, MESSAGE_FORMAT_BINARY)
+
+    assert raw[0] == ENVELOPE_BINARY_V1
+    assert len(raw) < len(encode_queue_message(message, codec, MESSAGE_FORMAT_JSON))
+    assert decode_queue_message(raw, codec) == json.loads(json.dumps(message, default=float))
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_binary_envelope_compresses_large_bulk_messages(codec):
+    message = _bulk_message(200)
+    expected = json.loads(json.dumps(message, default=float))
+
+    compressed = encode_queue_message(message, codec, MESSAGE_FORMAT_BINARY, 1024)
+    uncompressed = encode_queue_message(message, codec, MESSAGE_FORMAT_BINARY, 0)
+
+    assert compressed[0] == ENVELOPE_BINARY_V1_ZLIB
+    assert uncompressed[0] == ENVELOPE_BINARY_V1
+    assert len(compressed) < len(uncompressed)
+    assert decode_queue_message(compressed, codec) == expected
+    assert decode_queue_message(uncompressed, codec) == expected
+
+
+def test_binary_envelope_skips_compression_below_threshold():
+    codec = JSONCodec(JSON_ENCODER_STDLIB)
+
+    raw = encode_queue_message(_bulk_message(2), codec, MESSAGE_FORMAT_BINARY, 1024)
+
+    assert raw[0] == ENVELOPE_BINARY_V1
+
+
+def test_binary_envelope_falls_back_to_json_for_unknown_shapes():
+    codec = JSONCodec(JSON_ENCODER_STDLIB)
+    message = build_product_operation_message(
+        operation="create",
+        requested_by="test-user",
+        payload={"nome": "Mouse", "marca": "ACME", "valor": 1, "cor": "preto"},
+    )
+
+    raw = encode_queue_message(message, codec, MESSAGE_FORMAT_BINARY)
+
+    assert raw.startswith(b"{")
+    assert decode_queue_message(raw, codec) == message
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_decode_queue_message_reads_legacy_json(codec):
+    legacy = json.dumps({"operation_id": "op-1", "operation": "delete", "product_id": 3})
+
+    assert decode_queue_message(legacy, codec)["operation_id"] == "op-1"
+    assert decode_queue_message(legacy.encode("utf-8"), codec)["product_id"] == 3
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize(
+    "raw_message",
+    [b"\x01", b"\x01\x09\x00[]", b"\x02not-zlib", b"\x01\x01\x00[1,2]", b"[1, 2]", b"\x07"],
+)
+def test_decode_queue_message_rejects_invalid_envelopes(codec, raw_message):
+    with pytest.raises(ValueError):
+        decode_queue_message(raw_message, codec)
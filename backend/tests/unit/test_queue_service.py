@@ -6,7 +6,16 @@ from decimal import Decimal
 import pytest
 from flask import Flask
 
-from app.services.queue import build_product_operation_message, enqueue_product_operation
+from app.services.json_codec import configure_json
+from app.services.queue import (
+    build_bulk_create_message,
+    build_product_operation_message,
+    enqueue_product_operation,
+    enqueue_product_operations,
+    get_products_queue_backend,
+    reserve_product_operations,
+)
+from app.services.queue_backends import ListQueueBackend, StreamQueueBackend
 
 
 def test_build_product_operation_message_includes_required_fields():
@@ -71,3 +80,199 @@ def test_enqueue_product_operation_serializes_decimal_payload():
 
     parsed = json.loads(fake_redis.value)
     assert parsed["payload"]["valor"] == 12.5
+
+
+def test_build_bulk_create_message_assigns_one_operation_id_per_item():
+    message = build_bulk_create_message(
+        payloads=[{"nome": "A", "marca": "X", "valor": 1}, {"nome": "B", "marca": "Y", "valor": 2}],
+        requested_by="test-user",
+        operation_ids=["op-1", "op-2"],
+    )
+
+    assert message["operation"] == "bulk_create"
+    assert isinstance(message["operation_id"], str)
+    assert [item["operation_id"] for item in message["items"]] == ["op-1", "op-2"]
+    assert message["items"][1]["payload"]["nome"] == "B"
+
+
+def test_build_bulk_create_message_requires_payloads():
+    with pytest.raises(ValueError) as exc:
+        build_bulk_create_message(payloads=[], requested_by="test-user")
+
+    assert str(exc.value) == "payload_is_required"
+
+
+def test_enqueue_product_operations_uses_single_multi_value_lpush():
+    class FakeRedis:
+        def __init__(self):
+            self.calls: list[tuple[object, ...]] = []
+
+        def lpush(self, queue_name, *values):
+            self.calls.append((queue_name, *values))
+            return len(values)
+
+    app = Flask(__name__)
+    app.config["PRODUCTS_QUEUE_NAME"] = "queue:products:test"
+    fake_redis = FakeRedis()
+
+    with app.app_context():
+        messages = [
+            build_bulk_create_message(
+                payloads=[{"nome": "Mouse", "marca": "ACME", "valor": Decimal("12.50")}],
+                requested_by="test-user",
+            )
+            for _ in range(3)
+        ]
+        pushed = enqueue_product_operations(messages, client=fake_redis)
+
+    assert pushed == 3
+    assert len(fake_redis.calls) == 1
+    queue_name, *raw_messages = fake_redis.calls[0]
+    assert queue_name == "queue:products:test"
+    assert [json.loads(raw)["operation_id"] for raw in raw_messages] == [
+        message["operation_id"] for message in messages
+    ]
+
+
+def test_get_products_queue_backend_uses_configured_backend():
+    app = Flask(__name__)
+    app.config["PRODUCTS_QUEUE_NAME"] = "queue:products:test"
+
+    with app.app_context():
+        list_backend = get_products_queue_backend()
+        app.config["PRODUCTS_QUEUE_BACKEND"] = "stream"
+        app.config["PRODUCTS_QUEUE_GROUP"] = "workers:test"
+        stream_backend = get_products_queue_backend()
+
+    assert isinstance(list_backend, ListQueueBackend)
+    assert list_backend.processing_list_name("c-1") == "queue:products:test:processing:c-1"
+    assert isinstance(stream_backend, StreamQueueBackend)
+    assert stream_backend.stream_name == "queue:products:test:stream"
+    assert stream_backend.group_name == "workers:test"
+
+
+def test_stream_backend_enqueue_and_reserve_use_consumer_group():
+    class FakeRedis:
+        def __init__(self):
+            self.added: list[tuple[str, dict[bytes, object]]] = []
+            self.read_calls: list[dict[str, object]] = []
+
+        def xadd(self, name, fields):
+            self.added.append((name, fields))
+            return b"1-0"
+
+        def xreadgroup(self, groupname, consumername, streams, count, block):
+            self.read_calls.append(
+                {
+                    "group": groupname,
+                    "consumer": consumername,
+                    "streams": streams,
+                    "count": count,
+                    "block": block,
+                }
+            )
+            entries = [(b"1-0", {b"data": b'{"operation_id": "op-1"}'})]
+            return [[b"queue:products:test:stream", entries]]
+
+    app = Flask(__name__)
+    app.config.update(
+        {
+            "PRODUCTS_QUEUE_NAME": "queue:products:test",
+            "PRODUCTS_QUEUE_BACKEND": "stream",
+            "PRODUCTS_QUEUE_GROUP": "workers",
+        }
+    )
+    fake_redis = FakeRedis()
+
+    with app.app_context():
+        message = build_product_operation_message(
+            operation="delete",
+            requested_by="test-user",
+            product_id=1,
+            operation_id="op-1",
+        )
+        enqueue_product_operation(message, client=fake_redis)
+        reserved = reserve_product_operations("c-1", count=10, timeout=2, client=fake_redis)
+
+    assert fake_redis.added[0][0] == "queue:products:test:stream"
+    assert json.loads(fake_redis.added[0][1][b"data"])["operation_id"] == "op-1"
+    assert fake_redis.read_calls == [
+        {
+            "group": "workers",
+            "consumer": "c-1",
+            "streams": {"queue:products:test:stream": ">"},
+            "count": 10,
+            "block": 2000,
+        }
+    ]
+    assert [(item.message, item.receipt) for item in reserved] == [
+        ({"operation_id": "op-1"}, b"1-0")
+    ]
+
+
+def test_enqueue_product_operation_uses_app_json_codec():
+    class FakeRedis:
+        def __init__(self):
+            self.value = b""
+
+        def lpush(self, _queue_name, value):
+            self.value = value
+            return 1
+
+    app = Flask(__name__)
+    app.config["JSON_ENCODER"] = "stdlib"
+    configure_json(app)
+    fake_redis = FakeRedis()
+
+    with app.app_context():
+        enqueue_product_operation(
+            {"operation_id": "op-1", "payload": {"valor": Decimal("1.50")}},
+            client=fake_redis,
+        )
+
+    assert fake_redis.value == b'{"operation_id":"op-1","payload":{"valor":1.5}}'
+
+
+def test_stream_backend_round_trips_binary_and_legacy_messages():
+    class FakeRedis:
+        def __init__(self):
+            self.added: list[bytes] = []
+
+        def xadd(self, _name, fields):
+            self.added.append(fields[b"data"])
+            return f"{len(self.added)}-0".encode("ascii")
+
+        def xreadgroup(self, groupname, consumername, streams, count, block):
+            entries = [
+                (f"{index + 1}-0".encode("ascii"), {b"data": raw})
+                for index, raw in enumerate(self.added)
+            ]
+            entries.append((b"9-0", {b"data": b'{"operation_id": "op-legacy"}'}))
+            return [[b"queue:products:test:stream", entries]]
+
+    app = Flask(__name__)
+    app.config.update(
+        {
+            "PRODUCTS_QUEUE_NAME": "queue:products:test",
+            "PRODUCTS_QUEUE_BACKEND": "stream",
+            "PRODUCTS_QUEUE_MESSAGE_FORMAT": "binary",
+        }
+    )
+    fake_redis = FakeRedis()
+    message = build_product_operation_message(
+        operation="update",
+        requested_by="test-user",
+        product_id=5,
+        payload={"nome": "Mouse", "marca": "ACME", "valor": Decimal("12.50")},
+        requested_at="2026-02-11T12:00:00Z",
+    )
+
+    with app.app_context():
+        enqueue_product_operation(message, client=fake_redis)
+        reserved = reserve_product_operations("c-1", count=10, timeout=2, client=fake_redis)
+
+    assert fake_redis.added[0][0] == 0x01
+    assert [item.message for item in reserved] == [
+        {**message, "payload": {"nome": "Mouse", "marca": "ACME", "valor": 12.5}},
+        {"operation_id": "op-legacy"},
+    ]
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+
+from flask import Flask
+
+from app.routes import api_bp
+from app.services import readiness as readiness_service
+
+
+def _build_app(ttl_ms: int) -> Flask:
+    app = Flask(__name__)
+    app.config["READINESS_CACHE_TTL_MS"] = ttl_ms
+    readiness_service.configure_readiness(app)
+    app.register_blueprint(api_bp)
+    return app
+
+
+def _install_checks(monkeypatch, *, delay_seconds: float = 0.0, database_ok: bool = True):
+    calls = {"database": 0, "redis": 0}
+
+    def fake_check_database():
+        calls["database"] += 1
+        time.sleep(delay_seconds)
+        return {"ok": database_ok, "duration_ms": 1, "error": None if database_ok else "timeout"}
+
+    def fake_check_redis():
+        calls["redis"] += 1
+        time.sleep(delay_seconds)
+        return {"ok": True, "duration_ms": 1}
+
+    monkeypatch.setattr(readiness_service, "check_database", fake_check_database)
+    monkeypatch.setattr(readiness_service, "check_redis", fake_check_redis)
+    return calls
+
+
+def test_configure_readiness_defaults(monkeypatch):
+    monkeypatch.delenv("READINESS_CACHE_TTL_MS", raising=False)
+    app = Flask(__name__)
+
+    readiness_service.configure_readiness(app)
+
+    assert app.config["READINESS_CACHE_TTL_MS"] == 1000
+    assert app.extensions["readiness_cache"].ttl_seconds == 1.0
+
+
+def test_configure_readiness_accepts_zero_ttl_from_env(monkeypatch):
+    monkeypatch.setenv("READINESS_CACHE_TTL_MS", "0")
+    app = Flask(__name__)
+
+    readiness_service.configure_readiness(app)
+
+    assert app.config["READINESS_CACHE_TTL_MS"] == 0
+
+
+def test_readiness_checks_run_concurrently(monkeypatch):
+    _install_checks(monkeypatch, delay_seconds=0.2)
+    app = _build_app(ttl_ms=0)
+
+    with app.app_context():
+        started = time.perf_counter()
+        checks, cached = readiness_service.run_readiness_checks()
+        elapsed = time.perf_counter() - started
+
+    assert checks["database"]["ok"] is True
+    assert checks["redis"]["ok"] is True
+    assert cached is False
+    assert elapsed < 0.35
+
+
+def test_ready_serves_cached_result_within_ttl(monkeypatch):
+    calls = _install_checks(monkeypatch)
+    client = _build_app(ttl_ms=60_000).test_client()
+
+    first = client.get("/ready")
+    second = client.get("/ready")
+
+    assert first.status_code == 200
+    assert first.get_json()["cached"] is False
+    assert second.status_code == 200
+    assert second.get_json()["cached"] is True
+    assert calls == {"database": 1, "redis": 1}
+
+
+def test_ready_without_cache_checks_every_time(monkeypatch):
+    calls = _install_checks(monkeypatch, database_ok=False)
+    client = _build_app(ttl_ms=0).test_client()
+
+    first = client.get("/ready")
+    second = client.get("/ready")
+
+    assert first.status_code == 503
+    assert first.get_json()["checks"]["database"] == {
+        "ok": False,
+        "duration_ms": 1,
+        "error": "timeout",
+    }
+    assert second.get_json()["cached"] is False
+    assert calls == {"database": 2, "redis": 2}
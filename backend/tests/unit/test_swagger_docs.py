@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import gzip
+import json
+
 from flask import Flask
 import pytest
 
 from app.routes import api_bp
+from app.services import openapi_spec as openapi_spec_service
 
 
 @pytest.fixture
@@ -51,6 +55,61 @@ def test_openapi_has_security_on_protected_operations(client):
     assert spec["paths"]["/auth/logout"]["post"]["security"] == expected_security
 
 
+def test_openapi_json_supports_if_none_match(client):
+
+    first = client.get("/openapi.json")
+    etag = first.headers["ETag"]
+
+    revalidated = client.get("/openapi.json", headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.get_data() == b""
+    assert revalidated.headers["ETag"] == etag
+    assert client.get("/openapi.json", headers={"If-None-Match": '"outro"'}).status_code == 200
+
+
+def test_openapi_json_is_built_once_and_cached(client, monkeypatch):
+    calls = []
+    build_openapi_spec = openapi_spec_service.build_openapi_spec
+
+    def counting_build():
+        calls.append(1)
+        return build_openapi_spec()
+
+    monkeypatch.setattr(openapi_spec_service, "build_openapi_spec", counting_build)
+
+    first = client.get("/openapi.json")
+    second = client.get("/openapi.json")
+
+    assert len(calls) == 1
+    assert first.get_data() == second.get_data()
+    assert first.headers["Cache-Control"] == "public, max-age=3600"
+    assert first.headers["Vary"] == "Accept-Encoding"
+
+
+def test_openapi_json_serves_pre_gzipped_body(client):
+
+    plain = client.get("/openapi.json")
+    compressed = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.status_code == 200
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+    assert len(compressed.get_data()) < len(plain.get_data())
+    assert json.loads(gzip.decompress(compressed.get_data())) == plain.get_json()
+
+
+def test_openapi_json_skips_gzip_when_client_refuses_it(client):
+
+    plain = client.get("/openapi.json")
+    refused = client.get("/openapi.json", headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+    assert refused.status_code == 200
+    assert "Content-Encoding" not in refused.headers
+    assert refused.headers["ETag"] == plain.headers["ETag"]
+    assert refused.get_json() == plain.get_json()
+
+
 def test_docs_page_is_public_and_contains_swagger_ui(client):
 
     response = client.get("/docs")
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from types import SimpleNamespace
 from unittest.mock import Mock
 
+import pytest
+from flask import Flask
 from redis.exceptions import TimeoutError as RedisTimeoutError
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app.services import queue as queue_service
+from app.services.queue import ReservedOperation
 import worker
 
 
@@ -22,6 +30,11 @@ class FakeSession:
         self._next_id = 1
         self.commits = 0
         self.rollbacks = 0
+        self.operation_statuses: list[dict[str, object]] = []
+        self.cache_bumps: list[int] = []
+        self.counter_deltas: list[int] = []
+        self.savepoints = 0
+        self.savepoint_rollbacks = 0
 
     def add(self, product: FakeProduct):
         if product.id is None:
@@ -39,6 +52,17 @@ class FakeSession:
     def commit(self):
         self.commits += 1
 
+    @contextmanager
+    def begin_nested(self):
+        self.savepoints += 1
+        snapshot = {product_id: replace(product) for product_id, product in self.storage.items()}
+        try:
+            yield self
+        except Exception:
+            self.storage = snapshot
+            self.savepoint_rollbacks += 1
+            raise
+
     def flush(self):
         return None
 
@@ -50,9 +74,54 @@ def _install_fakes(monkeypatch):
     fake_session = FakeSession()
     monkeypatch.setattr(worker, "db", SimpleNamespace(session=fake_session))
     monkeypatch.setattr(worker, "Product", FakeProduct)
+    monkeypatch.setattr(worker, "adjust_products_counter", fake_session.counter_deltas.append)
+    monkeypatch.setattr(worker, "record_operation_statuses", fake_session.operation_statuses.extend)
+    monkeypatch.setattr(
+        worker,
+        "bump_products_cache_generation",
+        lambda: fake_session.cache_bumps.append(fake_session.commits),
+    )
     return fake_session
 
 
+class FakeQueue:
+    def __init__(self, items: list[object]):
+        self.items = list(items)
+        self.reserve_calls: list[dict[str, object]] = []
+        self.acked: list[tuple[str, list[bytes]]] = []
+        self.reaper_runs = 0
+
+    def reserve(self, consumer_id: str, count: int, timeout: int) -> list[ReservedOperation]:
+        self.reserve_calls.append({"consumer_id": consumer_id, "count": count, "timeout": timeout})
+        item = self.items.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        if item is None:
+            return []
+        messages = item if isinstance(item, list) else [item]
+        reserved = []
+        for message in messages:
+            raw_message = json.dumps(message).encode("utf-8")
+            reserved.append(ReservedOperation(message, raw_message, raw_message))
+        return reserved
+
+    def ack(self, consumer_id: str, reserved: list[ReservedOperation]) -> int:
+        self.acked.append((consumer_id, [item.raw_message for item in reserved]))
+        return len(reserved)
+
+    def requeue_expired(self) -> int:
+        self.reaper_runs += 1
+        return 0
+
+
+def _install_queue(monkeypatch, items: list[object]) -> FakeQueue:
+    fake_queue = FakeQueue(items)
+    monkeypatch.setattr(worker, "reserve_product_operations", fake_queue.reserve)
+    monkeypatch.setattr(worker, "ack_product_operations", fake_queue.ack)
+    monkeypatch.setattr(worker, "requeue_expired_operations", fake_queue.requeue_expired)
+    return fake_queue
+
+
 def test_process_message_create(monkeypatch):
     fake_session = _install_fakes(monkeypatch)
     logger = Mock()
@@ -68,6 +137,7 @@ def test_process_message_create(monkeypatch):
 
     assert processed is True
     assert fake_session.commits == 1
+    assert fake_session.cache_bumps == [1]
     assert len(fake_session.storage) == 1
     created = next(iter(fake_session.storage.values()))
     assert created.nome == "Mouse"
@@ -77,6 +147,9 @@ def test_process_message_create(monkeypatch):
         "op-1",
         created.id,
     )
+    assert len(fake_session.operation_statuses) == 1
+    assert fake_session.operation_statuses[0]["status"] == "success"
+    assert fake_session.operation_statuses[0]["product_id"] == created.id
 
 
 def test_process_message_update(monkeypatch):
@@ -115,6 +188,53 @@ def test_process_message_delete(monkeypatch):
     assert processed is True
     assert fake_session.commits == 1
     assert 11 not in fake_session.storage
+    assert fake_session.counter_deltas == [-1]
+
+
+def test_process_message_adjusts_products_counter_only_for_create(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+
+    worker.process_message(
+        {
+            "operation_id": "op-5",
+            "operation": "create",
+            "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+        }
+    )
+    worker.process_message(
+        {
+            "operation_id": "op-6",
+            "operation": "update",
+            "product_id": 10,
+            "payload": {"nome": "Novo", "marca": "Y", "valor": 2.5},
+        }
+    )
+
+    assert fake_session.counter_deltas == [1]
+
+
+def test_process_message_keeps_success_when_counter_update_fails(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    logger = Mock()
+
+    def raise_error(_delta):
+        raise RuntimeError("redis_unavailable")
+
+    monkeypatch.setattr(worker, "adjust_products_counter", raise_error)
+
+    processed = worker.process_message(
+        {
+            "operation_id": "op-7",
+            "operation": "create",
+            "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+        },
+        logger=logger,
+    )
+
+    assert processed is True
+    assert fake_session.commits == 1
+    logger.warning.assert_called_once()
 
 
 def test_process_message_invalid_message_rolls_back(monkeypatch):
@@ -125,15 +245,15 @@ def test_process_message_invalid_message_rolls_back(monkeypatch):
     assert processed is False
     assert fake_session.commits == 0
     assert fake_session.rollbacks == 1
+    assert fake_session.cache_bumps == []
+    assert fake_session.operation_statuses[0]["operation_id"] == "op-4"
+    assert fake_session.operation_statuses[0]["status"] == "error"
+    assert fake_session.operation_statuses[0]["error"] == "unsupported_operation"
 
 
 def test_process_next_message_handles_redis_timeout_without_exception_log(monkeypatch):
     logger = Mock()
-
-    def raise_timeout(timeout):
-        raise RedisTimeoutError("Timeout reading from socket")
-
-    monkeypatch.setattr(worker, "pop_product_operation", raise_timeout)
+    _install_queue(monkeypatch, [RedisTimeoutError("Timeout reading from socket")])
 
     processed = worker.process_next_message(timeout=2, logger=logger)
 
@@ -144,14 +264,803 @@ def test_process_next_message_handles_redis_timeout_without_exception_log(monkey
 
 def test_process_next_message_logs_unexpected_queue_errors(monkeypatch):
     logger = Mock()
-
-    def raise_error(timeout):
-        raise RuntimeError("redis_unavailable")
-
-    monkeypatch.setattr(worker, "pop_product_operation", raise_error)
+    _install_queue(monkeypatch, [RuntimeError("redis_unavailable")])
 
     processed = worker.process_next_message(timeout=2, logger=logger)
 
     assert processed is False
     logger.debug.assert_not_called()
     logger.exception.assert_called_once()
+
+
+def test_process_batch_commits_once_and_isolates_bad_message(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+    logger = Mock()
+
+    processed = worker.process_batch(
+        [
+            {
+                "operation_id": "op-1",
+                "operation": "create",
+                "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+            },
+            {
+                "operation_id": "op-2",
+                "operation": "update",
+                "product_id": 999,
+                "payload": {"nome": "X", "marca": "Y", "valor": 1},
+            },
+            {"operation_id": "op-3", "operation": "delete", "product_id": 10},
+        ],
+        logger=logger,
+    )
+
+    assert processed == 2
+    assert fake_session.commits == 1
+    assert fake_session.savepoints == 3
+    assert fake_session.savepoint_rollbacks == 1
+    assert fake_session.cache_bumps == [1]
+    assert 10 not in fake_session.storage
+    assert [product.nome for product in fake_session.storage.values()] == ["Mouse"]
+    assert fake_session.counter_deltas == []
+    logger.exception.assert_called_once()
+    batch_log = logger.info.call_args_list[-1]
+    assert batch_log.args[0].startswith("Worker processed batch size=%s succeeded=%s failed=%s")
+    assert batch_log.args[1:4] == (3, 2, 1)
+    assert [
+        (status["operation_id"], status["status"], status["error"])
+        for status in fake_session.operation_statuses
+    ] == [
+        ("op-2", "error", "product_not_found"),
+        ("op-1", "success", None),
+        ("op-3", "success", None),
+    ]
+
+
+def test_process_batch_rolls_back_everything_when_commit_fails(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    logger = Mock()
+
+    def fail_commit():
+        raise RuntimeError("db_unavailable")
+
+    monkeypatch.setattr(fake_session, "commit", fail_commit)
+
+    with pytest.raises(RuntimeError):
+        worker.process_batch(
+            [
+                {
+                    "operation_id": "op-1",
+                    "operation": "create",
+                    "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+                }
+            ],
+            logger=logger,
+        )
+
+    assert fake_session.rollbacks == 1
+    assert fake_session.counter_deltas == []
+    assert fake_session.cache_bumps == []
+    assert fake_session.operation_statuses == []
+    logger.exception.assert_called_once()
+
+
+def test_process_batch_aborts_on_database_outage_inside_savepoint(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+
+    def lose_connection(_model, _product_id):
+        raise OperationalError("SELECT products", {}, Exception("server closed the connection"))
+
+    monkeypatch.setattr(fake_session, "get", lose_connection)
+
+    with pytest.raises(OperationalError):
+        worker.process_batch(
+            [_update("op-1", 10, "Novo"), _update("op-2", 20, "Outro")],
+            logger=Mock(),
+        )
+
+    assert fake_session.savepoints == 1
+    assert fake_session.commits == 0
+    assert fake_session.rollbacks == 1
+    assert fake_session.operation_statuses == []
+
+
+def test_process_message_raises_on_database_outage(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+
+    def lose_connection(_model, _product_id):
+        raise OperationalError("SELECT products", {}, Exception("server closed the connection"))
+
+    monkeypatch.setattr(fake_session, "get", lose_connection)
+
+    with pytest.raises(OperationalError):
+        worker.process_message(_update("op-1", 10, "Novo"), logger=Mock())
+
+    assert fake_session.rollbacks == 1
+    assert fake_session.operation_statuses == []
+
+
+def _install_bulk_insert(monkeypatch, fake_session: FakeSession) -> list[list[dict[str, object]]]:
+    inserts: list[list[dict[str, object]]] = []
+
+    def fake_insert_products(rows):
+        inserts.append(rows)
+        product_ids = []
+        for row in rows:
+            product = FakeProduct(**row)
+            fake_session.add(product)
+            product_ids.append(product.id)
+        return product_ids
+
+    monkeypatch.setattr(worker, "_insert_products", fake_insert_products)
+    return inserts
+
+
+def test_process_batch_inserts_bulk_message_in_one_statement(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    inserts = _install_bulk_insert(monkeypatch, fake_session)
+    logger = Mock()
+
+    processed = worker.process_batch(
+        [
+            {
+                "operation_id": "bulk-1",
+                "operation": "bulk_create",
+                "items": [
+                    {"operation_id": "op-1", "payload": {"nome": "A", "marca": "X", "valor": 1}},
+                    {"operation_id": "op-2", "payload": {"nome": "", "marca": "X", "valor": 1}},
+                    {"operation_id": "op-3", "payload": {"nome": "C", "marca": "Z", "valor": 3}},
+                ],
+            },
+            {
+                "operation_id": "op-4",
+                "operation": "create",
+                "payload": {"nome": "D", "marca": "W", "valor": 4},
+            },
+        ],
+        logger=logger,
+    )
+
+    assert processed == 3
+    assert len(inserts) == 1
+    assert [row["nome"] for row in inserts[0]] == ["A", "C"]
+    assert fake_session.commits == 1
+    assert fake_session.counter_deltas == [3]
+    assert fake_session.cache_bumps == [1]
+    assert [
+        (status["operation_id"], status["operation"], status["status"], status["product_id"])
+        for status in fake_session.operation_statuses
+    ] == [
+        ("op-2", "create", "error", None),
+        ("op-1", "create", "success", 1),
+        ("op-3", "create", "success", 2),
+        ("op-4", "create", "success", 3),
+    ]
+    batch_log = logger.info.call_args_list[-1]
+    assert batch_log.args[1:4] == (2, 3, 1)
+
+
+def test_process_batch_reports_every_bulk_item_when_insert_fails(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+
+    def failing_insert(_rows):
+        raise RuntimeError("insert_failed")
+
+    monkeypatch.setattr(worker, "_insert_products", failing_insert)
+
+    processed = worker.process_batch(
+        [
+            {
+                "operation_id": "bulk-1",
+                "operation": "bulk_create",
+                "items": [
+                    {"operation_id": "op-1", "payload": {"nome": "A", "marca": "X", "valor": 1}},
+                    {"operation_id": "op-2", "payload": {"nome": "B", "marca": "Y", "valor": 2}},
+                ],
+            }
+        ],
+        logger=Mock(),
+    )
+
+    assert processed == 0
+    assert fake_session.savepoint_rollbacks == 1
+    assert fake_session.counter_deltas == []
+    assert [
+        (status["operation_id"], status["status"], status["error"])
+        for status in fake_session.operation_statuses
+    ] == [("op-1", "error", "processing_failed"), ("op-2", "error", "processing_failed")]
+
+
+def test_process_message_routes_bulk_message_through_batch(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    inserts = _install_bulk_insert(monkeypatch, fake_session)
+
+    processed = worker.process_message(
+        {
+            "operation_id": "bulk-1",
+            "operation": "bulk_create",
+            "items": [{"operation_id": "op-1", "payload": {"nome": "A", "marca": "X", "valor": 1}}],
+        },
+        logger=Mock(),
+    )
+
+    assert processed is True
+    assert len(inserts) == 1
+    assert fake_session.commits == 1
+
+
+def _update(operation_id: str, product_id: int, nome: str) -> dict[str, object]:
+    return {
+        "operation_id": operation_id,
+        "operation": "update",
+        "product_id": product_id,
+        "payload": {"nome": nome, "marca": "ACME", "valor": 10},
+    }
+
+
+def _status_tuples(fake_session: FakeSession) -> list[tuple[str, str, str, object]]:
+    return [
+        (status["operation_id"], status["operation"], status["status"], status["error"])
+        for status in fake_session.operation_statuses
+    ]
+
+
+def test_process_batch_coalesces_updates_to_last_write(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+    fake_session.storage[20] = FakeProduct(id=20, nome="Outro", marca="X", valor=1)
+    logger = Mock()
+
+    processed = worker.process_batch(
+        [
+            _update("op-1", 10, "Primeiro"),
+            _update("op-2", 20, "Unico"),
+            _update("op-3", 10, "Segundo"),
+            _update("op-4", 10, "Final"),
+        ],
+        logger=logger,
+    )
+
+    assert processed == 4
+    assert fake_session.savepoints == 2
+    assert fake_session.commits == 1
+    assert fake_session.storage[10].nome == "Final"
+    assert fake_session.storage[20].nome == "Unico"
+    assert _status_tuples(fake_session) == [
+        ("op-2", "update", "success", None),
+        ("op-4", "update", "success", None),
+        ("op-1", "update", "success", None),
+        ("op-3", "update", "success", None),
+    ]
+    coalesce_log = logger.info.call_args_list[0]
+    assert coalesce_log.args[0].startswith("Worker coalesced batch")
+    assert coalesce_log.args[1:] == (4, "op-1->op-4,op-3->op-4", 2)
+    batch_log = logger.info.call_args_list[-1]
+    assert batch_log.args[1:4] == (4, 4, 0)
+
+
+def test_process_batch_drops_updates_followed_by_delete(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+
+    processed = worker.process_batch(
+        [
+            _update("op-1", 10, "Novo"),
+            {"operation_id": "op-2", "operation": "delete", "product_id": 10},
+            _update("op-3", 10, "Depois"),
+        ],
+        logger=Mock(),
+    )
+
+    assert processed == 2
+    assert fake_session.savepoints == 2
+    assert 10 not in fake_session.storage
+    assert fake_session.counter_deltas == [-1]
+    assert _status_tuples(fake_session) == [
+        ("op-3", "update", "error", "product_not_found"),
+        ("op-2", "delete", "success", None),
+        ("op-1", "update", "success", None),
+    ]
+
+
+def test_process_batch_superseded_update_reports_superseding_error(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+
+    processed = worker.process_batch(
+        [_update("op-1", 99, "Novo"), _update("op-2", 99, "Final")],
+        logger=Mock(),
+    )
+
+    assert processed == 0
+    assert _status_tuples(fake_session) == [
+        ("op-2", "update", "error", "product_not_found"),
+        ("op-1", "update", "error", "product_not_found"),
+    ]
+
+
+def test_process_batch_replays_superseded_update_when_superseder_fails(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+    add = fake_session.add
+
+    def add_with_check_constraint(product: FakeProduct):
+        if product.nome == "Bloqueado":
+            raise IntegrityError("UPDATE products", {}, Exception("check constraint violated"))
+        add(product)
+
+    monkeypatch.setattr(fake_session, "add", add_with_check_constraint)
+    logger = Mock()
+
+    processed = worker.process_batch(
+        [_update("op-1", 10, "Novo"), _update("op-2", 10, "Bloqueado")],
+        logger=logger,
+    )
+
+    assert processed == 1
+    assert fake_session.savepoints == 2
+    assert fake_session.commits == 1
+    assert fake_session.storage[10].nome == "Novo"
+    assert _status_tuples(fake_session) == [
+        ("op-2", "update", "error", "processing_failed"),
+        ("op-1", "update", "success", None),
+    ]
+    replay_log = logger.info.call_args_list[1]
+    assert replay_log.args[0].startswith("Worker replaying superseded operations")
+    assert replay_log.args[1:] == ("op-2", "op-1")
+
+
+def test_process_batch_overflowing_update_does_not_drop_earlier_update(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+    overflow = _update("op-2", 10, "Final")
+    overflow["payload"]["valor"] = 1e12
+
+    processed = worker.process_batch([_update("op-1", 10, "Novo"), overflow], logger=Mock())
+
+    assert processed == 1
+    assert fake_session.storage[10].nome == "Novo"
+    assert fake_session.storage[10].valor == 10
+    assert _status_tuples(fake_session) == [
+        ("op-2", "update", "error", "valor_too_large"),
+        ("op-1", "update", "success", None),
+    ]
+
+
+def test_process_batch_invalid_update_does_not_supersede(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+    invalid = _update("op-2", 10, "")
+
+    processed = worker.process_batch([_update("op-1", 10, "Novo"), invalid], logger=Mock())
+
+    assert processed == 1
+    assert fake_session.savepoints == 2
+    assert fake_session.storage[10].nome == "Novo"
+    assert _status_tuples(fake_session) == [
+        ("op-2", "update", "error", "nome_is_required"),
+        ("op-1", "update", "success", None),
+    ]
+
+
+def test_process_batch_without_coalescing_applies_every_update(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_session.storage[10] = FakeProduct(id=10, nome="Velho", marca="X", valor=1)
+
+    processed = worker.process_batch(
+        [_update("op-1", 10, "Novo"), _update("op-2", 10, "Final")],
+        logger=Mock(),
+        coalesce=False,
+    )
+
+    assert processed == 2
+    assert fake_session.savepoints == 2
+    assert fake_session.storage[10].nome == "Final"
+
+
+def test_process_next_batch_reserves_requested_batch_size_and_acks(monkeypatch):
+    _install_fakes(monkeypatch)
+    fake_queue = _install_queue(
+        monkeypatch,
+        [
+            [
+                {
+                    "operation_id": "op-1",
+                    "operation": "create",
+                    "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+                },
+                {"operation_id": "op-2", "operation": "unknown"},
+            ]
+        ],
+    )
+
+    assert worker.process_next_batch(50, timeout=2, logger=Mock(), consumer_id="c-1") is True
+    assert fake_queue.reserve_calls == [{"consumer_id": "c-1", "count": 50, "timeout": 2}]
+    assert len(fake_queue.acked) == 1
+    consumer_id, raw_messages = fake_queue.acked[0]
+    assert consumer_id == "c-1"
+    assert [json.loads(raw)["operation_id"] for raw in raw_messages] == ["op-1", "op-2"]
+
+
+def test_process_next_message_acks_only_after_commit(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_queue = _install_queue(
+        monkeypatch,
+        [
+            {
+                "operation_id": "op-1",
+                "operation": "create",
+                "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+            }
+        ],
+    )
+    commits_at_ack: list[int] = []
+    original_ack = fake_queue.ack
+
+    def recording_ack(consumer_id, reserved):
+        commits_at_ack.append(fake_session.commits)
+        return original_ack(consumer_id, reserved)
+
+    monkeypatch.setattr(worker, "ack_product_operations", recording_ack)
+
+    assert worker.process_next_message(timeout=1, consumer_id="c-1") is True
+    assert commits_at_ack == [1]
+
+
+def test_process_next_message_keeps_result_when_ack_fails(monkeypatch):
+    _install_fakes(monkeypatch)
+    _install_queue(
+        monkeypatch,
+        [
+            {
+                "operation_id": "op-1",
+                "operation": "create",
+                "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+            }
+        ],
+    )
+    logger = Mock()
+
+    def raise_error(_consumer_id, _reserved):
+        raise RuntimeError("redis_unavailable")
+
+    monkeypatch.setattr(worker, "ack_product_operations", raise_error)
+
+    assert worker.process_next_message(timeout=1, logger=logger, consumer_id="c-1") is True
+    logger.warning.assert_called_once()
+
+
+class FakeListRedis:
+    def __init__(self):
+        self.lists: dict[str, list[bytes]] = {}
+        self.sets: dict[str, set[bytes]] = {}
+        self.zsets: dict[str, dict[bytes, float]] = {}
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    def lpush(self, name, *values):
+        items = self.lists.setdefault(name, [])
+        for value in values:
+            items.insert(0, value if isinstance(value, bytes) else str(value).encode("utf-8"))
+        return len(items)
+
+    def rpush(self, name, value):
+        self.lists.setdefault(name, []).append(value)
+        return len(self.lists[name])
+
+    def lmove(self, source, destination, src="RIGHT", dest="LEFT"):
+        items = self.lists.get(source) or []
+        if not items:
+            return None
+        value = items.pop()
+        self.lists.setdefault(destination, []).insert(0, value)
+        return value
+
+    def blmove(self, source, destination, _timeout, src="RIGHT", dest="LEFT"):
+        return self.lmove(source, destination, src=src, dest=dest)
+
+    def lrange(self, name, _start, _end):
+        return list(self.lists.get(name, []))
+
+    def lrem(self, name, _count, value):
+        items = self.lists.get(name, [])
+        if value in items:
+            items.remove(value)
+            return 1
+        return 0
+
+    def sadd(self, name, value):
+        self.sets.setdefault(name, set()).add(value.encode("utf-8"))
+
+    def srem(self, name, value):
+        self.sets.get(name, set()).discard(value.encode("utf-8"))
+
+    def smembers(self, name):
+        return set(self.sets.get(name, set()))
+
+    def zadd(self, name, mapping, nx=False):
+        scores = self.zsets.setdefault(name, {})
+        for member, score in mapping.items():
+            if not nx or member not in scores:
+                scores[member] = score
+
+    def zrem(self, name, *members):
+        for member in members:
+            self.zsets.get(name, {}).pop(member, None)
+
+    def zmscore(self, name, members):
+        return [self.zsets.get(name, {}).get(member) for member in members]
+
+    def eval(self, _script, _numkeys, processing_list, queue_name, in_flight_key, raw_message):
+        removed = self.lrem(processing_list, 1, raw_message)
+        if removed:
+            self.rpush(queue_name, raw_message)
+        self.zrem(in_flight_key, raw_message)
+        return removed
+
+
+class FakePipeline:
+    def __init__(self, client: FakeListRedis):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return record
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+def test_database_outage_leaves_reserved_messages_for_redelivery(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    fake_redis = FakeListRedis()
+    monkeypatch.setattr(queue_service, "get_redis_client", lambda: fake_redis)
+
+    def lose_connection():
+        raise OperationalError("COMMIT", {}, Exception("server closed the connection"))
+
+    monkeypatch.setattr(fake_session, "commit", lose_connection)
+    app = Flask(__name__)
+    app.config["PRODUCTS_QUEUE_NAME"] = "queue:products:test"
+
+    with app.app_context():
+        queue_service.enqueue_product_operations(
+            [
+                {
+                    "operation_id": f"op-{index}",
+                    "operation": "create",
+                    "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+                }
+                for index in range(3)
+            ]
+        )
+
+        assert worker.process_next_batch(50, timeout=0, logger=Mock(), consumer_id="c-1") is False
+        processing_list = queue_service.get_processing_list_name("c-1")
+        assert len(fake_redis.lists[processing_list]) == 3
+        assert fake_redis.lists["queue:products:test"] == []
+        assert fake_session.operation_statuses == []
+
+        assert queue_service.requeue_expired_operations(visibility_timeout_seconds=0) == 3
+        assert fake_redis.lists[processing_list] == []
+        assert len(fake_redis.lists["queue:products:test"]) == 3
+
+
+def _stop_after(iterations: int):
+    calls = {"count": 0}
+
+    def stop_requested() -> bool:
+        calls["count"] += 1
+        return calls["count"] > iterations
+
+    return stop_requested
+
+
+def test_run_forever_does_not_sleep_after_empty_poll_or_failed_message(monkeypatch):
+    _install_fakes(monkeypatch)
+    sleeps: list[float] = []
+    fake_queue = _install_queue(
+        monkeypatch,
+        [
+            None,
+            {"operation_id": "op-bad", "operation": "unknown"},
+            {
+                "operation_id": "op-good",
+                "operation": "create",
+                "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+            },
+        ],
+    )
+    monkeypatch.setattr(worker.time, "sleep", sleeps.append)
+
+    worker.run_forever(poll_timeout=1, stop_requested=_stop_after(3))
+
+    assert fake_queue.items == []
+    assert len(fake_queue.acked) == 2
+    assert sleeps == []
+
+
+def test_run_forever_backs_off_exponentially_on_queue_errors(monkeypatch):
+    sleeps: list[float] = []
+    _install_queue(monkeypatch, [RuntimeError("down")] * 5 + [None, RuntimeError("down")])
+    monkeypatch.setattr(worker.time, "sleep", sleeps.append)
+
+    worker.run_forever(
+        poll_timeout=1,
+        backoff_initial_seconds=0.5,
+        backoff_max_seconds=4,
+        stop_requested=_stop_after(7),
+    )
+
+    assert sleeps == [0.5, 1.0, 2.0, 4, 4, 0.5]
+
+
+def test_run_forever_backs_off_exponentially_on_database_errors(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    sleeps: list[float] = []
+    message = {
+        "operation_id": "op-1",
+        "operation": "create",
+        "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+    }
+    fake_queue = _install_queue(monkeypatch, [message] * 4 + [None])
+    monkeypatch.setattr(worker.time, "sleep", sleeps.append)
+    commit = fake_session.commit
+    outcomes = iter([False, False, False, True])
+
+    def commit_while_database_is_down():
+        if not next(outcomes):
+            raise OperationalError("COMMIT", {}, Exception("connection refused"))
+        commit()
+
+    monkeypatch.setattr(fake_session, "commit", commit_while_database_is_down)
+
+    worker.run_forever(
+        poll_timeout=1,
+        backoff_initial_seconds=0.5,
+        backoff_max_seconds=30,
+        stop_requested=_stop_after(5),
+    )
+
+    assert sleeps == [0.5, 1.0, 2.0]
+    assert len(fake_queue.acked) == 1
+    assert fake_session.commits == 1
+
+
+def test_message_queued_after_failure_is_committed_without_idle_delay(monkeypatch):
+    fake_session = _install_fakes(monkeypatch)
+    _install_queue(
+        monkeypatch,
+        [
+            {"operation_id": "op-bad", "operation": "unknown"},
+            {
+                "operation_id": "op-good",
+                "operation": "create",
+                "payload": {"nome": "Mouse", "marca": "ACME", "valor": 10},
+            },
+        ],
+    )
+    committed_at: list[float] = []
+    original_commit = fake_session.commit
+
+    def timed_commit():
+        original_commit()
+        committed_at.append(time.perf_counter())
+
+    monkeypatch.setattr(fake_session, "commit", timed_commit)
+
+    enqueued_at = time.perf_counter()
+    worker.run_forever(poll_timeout=1, stop_requested=_stop_after(2))
+
+    assert len(committed_at) == 1
+    assert committed_at[0] - enqueued_at < 0.1
+
+
+def test_run_forever_runs_reaper_on_interval(monkeypatch):
+    fake_queue = _install_queue(monkeypatch, [None, None, None])
+    clock = iter([0.0, 0.0, 5.0, 20.0, 20.0])
+    monkeypatch.setattr(worker.time, "monotonic", lambda: next(clock))
+
+    worker.run_forever(
+        poll_timeout=1,
+        reaper_interval_seconds=10,
+        consumer_id="c-1",
+        stop_requested=_stop_after(3),
+    )
+
+    assert fake_queue.reaper_runs == 2
+    assert {call["consumer_id"] for call in fake_queue.reserve_calls} == {"c-1"}
+
+
+class FakeProcess:
+    def __init__(self, pid: int, alive_checks: int):
+        self.pid = pid
+        self.exitcode: int | None = None
+        self._alive_checks = alive_checks
+        self.terminated = False
+        self.joined = False
+
+    def is_alive(self) -> bool:
+        if self.terminated:
+            return False
+        if self._alive_checks <= 0:
+            self.exitcode = 1
+            return False
+        self._alive_checks -= 1
+        return True
+
+    def terminate(self):
+        self.terminated = True
+
+    def join(self, timeout=None):
+        self.joined = True
+
+    def kill(self):
+        self.terminated = True
+
+
+def test_supervise_restarts_crashed_workers_and_terminates_on_stop(monkeypatch):
+    spawned: list[tuple[int, int, FakeProcess]] = []
+
+    def fake_spawn(index: int, batch_size: int) -> FakeProcess:
+        alive_checks = 0 if not spawned else 100
+        process = FakeProcess(pid=100 + len(spawned), alive_checks=alive_checks)
+        spawned.append((index, batch_size, process))
+        return process
+
+    monkeypatch.setattr(worker, "_spawn_worker_process", fake_spawn)
+    monkeypatch.setattr(worker.time, "sleep", lambda _seconds: None)
+
+    worker.supervise(
+        2,
+        batch_size=25,
+        stop_requested=_stop_after(2),
+        shutdown_timeout_seconds=0,
+    )
+
+    assert [(index, batch_size) for index, batch_size, _ in spawned] == [(0, 25), (1, 25), (0, 25)]
+    crashed = spawned[0][2]
+    assert crashed.terminated is False
+    assert all(process.terminated and process.joined for _, _, process in spawned[1:])
+
+
+def test_supervise_backs_off_workers_that_keep_crashing_on_start(monkeypatch):
+    clock = {"now": 0.0}
+    spawned_at: list[float] = []
+
+    def fake_spawn(_index: int, _batch_size: int) -> FakeProcess:
+        spawned_at.append(clock["now"])
+        return FakeProcess(pid=100 + len(spawned_at), alive_checks=0)
+
+    def fake_sleep(seconds: float) -> None:
+        clock["now"] += seconds
+
+    monkeypatch.setattr(worker, "_spawn_worker_process", fake_spawn)
+    monkeypatch.setattr(worker.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(worker.time, "sleep", fake_sleep)
+
+    worker.supervise(
+        1,
+        stop_requested=_stop_after(9),
+        poll_interval_seconds=1.0,
+        shutdown_timeout_seconds=0,
+        backoff_initial_seconds=0.5,
+        backoff_max_seconds=30.0,
+    )
+
+    assert spawned_at == [0.0, 0.0, 2.0, 4.0, 7.0]
+
+
+def test_parse_args_reads_concurrency_from_env(monkeypatch):
+    monkeypatch.setenv("WORKER_CONCURRENCY", "4")
+    monkeypatch.setenv("WORKER_BATCH_SIZE", "50")
+
+    args = worker._parse_args([])
+    assert (args.concurrency, args.batch_size) == (4, 50)
+
+    args = worker._parse_args(["--concurrency", "2"])
+    assert args.concurrency == 2
@@ -1,20 +1,79 @@
+import argparse
 import logging
+import multiprocessing
+import os
+import signal
+import socket
 import time
+from collections.abc import Callable
 
 from redis.exceptions import TimeoutError as RedisTimeoutError
+from sqlalchemy import insert
+from sqlalchemy.exc import InterfaceError, OperationalError
 
 from app import create_app
 from app.models import Product
 from app.services.database import check_database
 from app.services.database import db
+from app.services.operation_status import (
+    OPERATION_STATUS_ERROR,
+    OPERATION_STATUS_SUCCESS,
+    build_operation_status,
+    record_operation_statuses,
+)
+from app.services.product_cache import bump_products_cache_generation
+from app.services.product_count import adjust_products_counter
 from app.services.products import validate_product_payload
-from app.services.queue import pop_product_operation
+from app.services.queue import (
+    PRODUCT_OPERATION_BULK_CREATE,
+    ReservedOperation,
+    ack_product_operations,
+    requeue_expired_operations,
+    reserve_product_operations,
+)
 from app.services.redis import check_redis
 
 LOGGER = logging.getLogger("worker")
 LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
 DEFAULT_POLL_TIMEOUT_SECONDS = 2
-IDLE_SLEEP_SECONDS = 1
+RECONNECT_BACKOFF_INITIAL_SECONDS = 0.5
+RECONNECT_BACKOFF_MAX_SECONDS = 30.0
+REAPER_INTERVAL_SECONDS = 10.0
+DEFAULT_BATCH_SIZE = 1
+DEFAULT_CONCURRENCY = 1
+SUPERVISOR_POLL_INTERVAL_SECONDS = 1.0
+SUPERVISOR_SHUTDOWN_TIMEOUT_SECONDS = 30.0
+SUPERVISOR_FAST_EXIT_SECONDS = 10.0
+PRODUCT_COUNT_DELTAS = {"create": 1, "delete": -1}
+SUPERSEDING_OPERATIONS = {"update", "delete"}
+RETRYABLE_DATABASE_ERRORS = (OperationalError, InterfaceError)
+
+POLL_PROCESSED = "processed"
+POLL_FAILED = "failed"
+POLL_EMPTY = "empty"
+POLL_QUEUE_ERROR = "queue_error"
+POLL_DB_ERROR = "db_error"
+BACKOFF_OUTCOMES = {POLL_QUEUE_ERROR, POLL_DB_ERROR}
+
+
+def _read_positive_int(value: str | None, default: int) -> int:
+    if value is None:
+        return default
+
+    try:
+        parsed = int(value)
+        if parsed <= 0:
+            return default
+        return parsed
+    except ValueError:
+        return default
+
+
+def _parse_bool(value: str | None, default: bool = False) -> bool:
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    return normalized in {"1", "true", "yes", "on"}
 
 
 def _to_int(value: object, field_name: str) -> int:
@@ -64,39 +123,306 @@ def _handle_delete(message: dict[str, object]) -> int:
     return product_id
 
 
-def process_message(message: dict[str, object], logger: logging.Logger | None = None) -> bool:
-    active_logger = logger or LOGGER
+def _insert_products(rows: list[dict[str, object]]) -> list[int]:
+    result = db.session.execute(
+        insert(Product).returning(Product.id, sort_by_parameter_order=True),
+        rows,
+    )
+    return [int(product_id) for product_id in result.scalars()]
+
+
+def _bulk_items(message: dict[str, object]) -> list[tuple[str, object]]:
+    items = message.get("items")
+    if not isinstance(items, list):
+        raise ValueError("items_are_required")
+
+    return [
+        (str(item["operation_id"]), item.get("payload"))
+        for item in items
+        if isinstance(item, dict) and item.get("operation_id")
+    ]
+
+
+def _handle_bulk_create(
+    message: dict[str, object],
+) -> tuple[list[tuple[str, str, int]], list[dict[str, object]]]:
+    rows: list[dict[str, object]] = []
+    operation_ids: list[str] = []
+    failed_statuses: list[dict[str, object]] = []
+    for operation_id, payload in _bulk_items(message):
+        try:
+            rows.append(validate_product_payload(payload))
+        except ValueError as exc:
+            failed_statuses.append(
+                build_operation_status(
+                    operation_id=operation_id,
+                    operation="create",
+                    status=OPERATION_STATUS_ERROR,
+                    error=str(exc),
+                )
+            )
+            continue
+        operation_ids.append(operation_id)
+
+    if not rows:
+        return [], failed_statuses
+
+    product_ids = _insert_products(rows)
+    applied = [
+        ("create", operation_id, product_id)
+        for operation_id, product_id in zip(operation_ids, product_ids)
+    ]
+    return applied, failed_statuses
+
+
+def _status_targets(message: dict[str, object]) -> list[tuple[str, str, int | None]]:
     operation = str(message.get("operation") or "")
-    operation_id = str(message.get("operation_id") or "")
-    product_id: int | None
+    if operation == PRODUCT_OPERATION_BULK_CREATE:
+        try:
+            return [("create", operation_id, None) for operation_id, _ in _bulk_items(message)]
+        except ValueError:
+            return []
+    return [(operation, str(message.get("operation_id") or ""), _message_product_id(message))]
+
+
+def _update_products_counter(delta: int, logger: logging.Logger) -> None:
+    if delta == 0:
+        return
+
+    try:
+        adjust_products_counter(delta)
+    except Exception as exc:
+        logger.warning("Worker could not update products counter error=%s", exc)
+
+
+def _invalidate_products_cache(logger: logging.Logger) -> None:
+    try:
+        bump_products_cache_generation()
+    except Exception as exc:
+        logger.warning("Worker could not invalidate products cache error=%s", exc)
+
+
+def _error_code(exc: Exception) -> str:
+    if isinstance(exc, ValueError) and str(exc):
+        return str(exc)
+    return "processing_failed"
+
+
+def _record_statuses(statuses: list[dict[str, object]], logger: logging.Logger) -> None:
+    try:
+        record_operation_statuses(statuses)
+    except Exception as exc:
+        logger.warning(
+            "Worker could not record operation status count=%s error=%s",
+            len(statuses),
+            exc,
+        )
+
+
+def _message_product_id(message: dict[str, object]) -> int | None:
     raw_product_id = message.get("product_id")
     try:
-        product_id = int(raw_product_id) if raw_product_id is not None else None
+        return int(raw_product_id) if raw_product_id is not None else None
     except (TypeError, ValueError):
-        product_id = None
+        return None
 
-    if not operation_id:
-        active_logger.error("Worker skipped message missing operation_id")
-        return False
 
+def _is_valid_write(message: dict[str, object]) -> bool:
+    if message.get("operation") == "delete":
+        return True
     try:
-        if operation == "create":
-            product_id = _handle_create(message)
-        elif operation == "update":
-            product_id = _handle_update(message)
-        elif operation == "delete":
-            product_id = _handle_delete(message)
-        else:
-            raise ValueError("unsupported_operation")
+        validate_product_payload(message.get("payload"))
+    except ValueError:
+        return False
+    return True
 
-        db.session.commit()
-        active_logger.info(
-            "Worker processed operation=%s operation_id=%s product_id=%s status=success",
+
+def _coalesce_messages(
+    messages: list[dict[str, object]],
+) -> tuple[list[dict[str, object]], dict[str, tuple[dict[str, object], str]]]:
+    last_write: dict[int, str] = {}
+    superseded: dict[str, tuple[dict[str, object], str]] = {}
+    for message in reversed(messages):
+        operation = message.get("operation")
+        operation_id = str(message.get("operation_id") or "")
+        product_id = _message_product_id(message)
+        if operation not in SUPERSEDING_OPERATIONS or not operation_id or product_id is None:
+            continue
+        if not _is_valid_write(message):
+            continue
+        if operation == "update" and product_id in last_write:
+            superseded[operation_id] = (message, last_write[product_id])
+            continue
+        last_write[product_id] = operation_id
+
+    if not superseded:
+        return messages, superseded
+    superseded = dict(reversed(superseded.items()))
+    kept = [
+        message
+        for message in messages
+        if str(message.get("operation_id") or "") not in superseded
+    ]
+    return kept, superseded
+
+
+def _status_outcomes(statuses: list[dict[str, object]]) -> dict[str, tuple[str, str | None]]:
+    return {
+        str(status["operation_id"]): (str(status["status"]), status.get("error"))
+        for status in statuses
+    }
+
+
+def _superseded_statuses(
+    superseded: dict[str, tuple[dict[str, object], str]],
+    outcomes: dict[str, tuple[str, str | None]],
+) -> list[dict[str, object]]:
+    statuses = []
+    for operation_id, (message, superseded_by) in superseded.items():
+        status, error = outcomes.get(superseded_by, (OPERATION_STATUS_ERROR, "processing_failed"))
+        statuses.append(
+            build_operation_status(
+                operation_id=operation_id,
+                operation=str(message.get("operation")),
+                status=status,
+                product_id=_message_product_id(message),
+                error=error,
+            )
+        )
+    return statuses
+
+
+def _apply_operation(operation: str, message: dict[str, object]) -> int:
+    if operation == "create":
+        return _handle_create(message)
+    if operation == "update":
+        return _handle_update(message)
+    if operation == "delete":
+        return _handle_delete(message)
+    raise ValueError("unsupported_operation")
+
+
+def _pop_superseded(
+    superseded: dict[str, tuple[dict[str, object], str]],
+    superseded_by: str,
+) -> list[dict[str, object]]:
+    operation_ids = [
+        operation_id
+        for operation_id, (_, target_operation_id) in superseded.items()
+        if target_operation_id == superseded_by
+    ]
+    return [superseded.pop(operation_id)[0] for operation_id in operation_ids]
+
+
+def _apply_batch_message(
+    message: dict[str, object],
+    logger: logging.Logger,
+) -> tuple[list[tuple[str, str, int]], list[dict[str, object]]]:
+    operation = str(message.get("operation") or "")
+    operation_id = str(message.get("operation_id") or "")
+    product_id = _message_product_id(message)
+
+    try:
+        with db.session.begin_nested():
+            if operation == PRODUCT_OPERATION_BULK_CREATE:
+                bulk_applied, bulk_failed = _handle_bulk_create(message)
+            else:
+                product_id = _apply_operation(operation, message)
+    except RETRYABLE_DATABASE_ERRORS:
+        raise
+    except Exception as exc:
+        logger.exception(
+            "Worker failed operation=%s operation_id=%s product_id=%s status=error error=%s",
             operation,
             operation_id,
             product_id,
+            exc,
         )
-        return True
+        return [], [
+            build_operation_status(
+                operation_id=target_operation_id,
+                operation=target_operation,
+                status=OPERATION_STATUS_ERROR,
+                product_id=target_product_id,
+                error=_error_code(exc),
+            )
+            for target_operation, target_operation_id, target_product_id in _status_targets(
+                message
+            )
+        ]
+
+    if operation == PRODUCT_OPERATION_BULK_CREATE:
+        return bulk_applied, bulk_failed
+    return [(operation, operation_id, product_id)], []
+
+
+def _apply_batch(
+    pending: list[dict[str, object]],
+    superseded: dict[str, tuple[dict[str, object], str]],
+    logger: logging.Logger,
+) -> tuple[list[tuple[str, str, int]], list[dict[str, object]]]:
+    applied: list[tuple[str, str, int]] = []
+    failed_statuses: list[dict[str, object]] = []
+    for message in pending:
+        operation_id = str(message.get("operation_id") or "")
+        if not operation_id:
+            logger.error("Worker skipped message missing operation_id")
+            continue
+
+        message_applied, message_failed = _apply_batch_message(message, logger)
+        applied.extend(message_applied)
+        failed_statuses.extend(message_failed)
+        if message_applied or not superseded:
+            continue
+
+        replayed = _pop_superseded(superseded, operation_id)
+        if not replayed:
+            continue
+        logger.info(
+            "Worker replaying superseded operations superseded_by=%s operation_ids=%s",
+            operation_id,
+            ",".join(str(replay.get("operation_id")) for replay in replayed),
+        )
+        for replay in replayed:
+            replay_applied, replay_failed = _apply_batch_message(replay, logger)
+            applied.extend(replay_applied)
+            failed_statuses.extend(replay_failed)
+
+    return applied, failed_statuses
+
+
+def _rollback_for_retry(
+    operation_ids: list[str],
+    exc: Exception,
+    logger: logging.Logger,
+) -> None:
+    db.session.rollback()
+    logger.exception(
+        "Worker rolled back operation_ids=%s status=retry error=%s",
+        ",".join(operation_ids),
+        exc,
+    )
+
+
+def process_message(message: dict[str, object], logger: logging.Logger | None = None) -> bool:
+    active_logger = logger or LOGGER
+    operation = str(message.get("operation") or "")
+    operation_id = str(message.get("operation_id") or "")
+    product_id = _message_product_id(message)
+
+    if not operation_id:
+        active_logger.error("Worker skipped message missing operation_id")
+        return False
+
+    if operation == PRODUCT_OPERATION_BULK_CREATE:
+        return process_batch([message], logger=active_logger) > 0
+
+    try:
+        product_id = _apply_operation(operation, message)
+        db.session.flush()
+    except RETRYABLE_DATABASE_ERRORS as exc:
+        _rollback_for_retry([operation_id], exc, active_logger)
+        raise
     except Exception as exc:
         db.session.rollback()
         active_logger.exception(
@@ -106,47 +432,275 @@ def process_message(message: dict[str, object], logger: logging.Logger | None =
             product_id,
             exc,
         )
+        _record_statuses(
+            [
+                build_operation_status(
+                    operation_id=operation_id,
+                    operation=operation,
+                    status=OPERATION_STATUS_ERROR,
+                    product_id=product_id,
+                    error=_error_code(exc),
+                )
+            ],
+            active_logger,
+        )
         return False
 
+    try:
+        db.session.commit()
+    except Exception as exc:
+        _rollback_for_retry([operation_id], exc, active_logger)
+        raise
+
+    _update_products_counter(PRODUCT_COUNT_DELTAS.get(operation, 0), active_logger)
+    _invalidate_products_cache(active_logger)
+    _record_statuses(
+        [
+            build_operation_status(
+                operation_id=operation_id,
+                operation=operation,
+                status=OPERATION_STATUS_SUCCESS,
+                product_id=product_id,
+            )
+        ],
+        active_logger,
+    )
+    active_logger.info(
+        "Worker processed operation=%s operation_id=%s product_id=%s status=success",
+        operation,
+        operation_id,
+        product_id,
+    )
+    return True
 
-def process_next_message(
-    timeout: int = DEFAULT_POLL_TIMEOUT_SECONDS,
+
+def process_batch(
+    messages: list[dict[str, object]],
     logger: logging.Logger | None = None,
-) -> bool:
+    coalesce: bool = True,
+) -> int:
     active_logger = logger or LOGGER
+    if not messages:
+        return 0
+
+    started = time.perf_counter()
+    pending, superseded = _coalesce_messages(messages) if coalesce else (messages, {})
+    if superseded:
+        active_logger.info(
+            "Worker coalesced batch size=%s superseded=%s writes_saved=%s",
+            len(messages),
+            ",".join(
+                f"{operation_id}->{superseded_by}"
+                for operation_id, (_, superseded_by) in superseded.items()
+            ),
+            len(superseded),
+        )
+
     try:
-        message = pop_product_operation(timeout=timeout)
+        applied, failed_statuses = _apply_batch(pending, superseded, active_logger)
+        db.session.commit()
+    except Exception as exc:
+        _rollback_for_retry(
+            [str(message.get("operation_id") or "") for message in messages],
+            exc,
+            active_logger,
+        )
+        raise
+
+    counter_delta = sum(PRODUCT_COUNT_DELTAS.get(operation, 0) for operation, _, _ in applied)
+    _update_products_counter(counter_delta, active_logger)
+    if applied:
+        _invalidate_products_cache(active_logger)
+    statuses = failed_statuses + [
+        build_operation_status(
+            operation_id=operation_id,
+            operation=operation,
+            status=OPERATION_STATUS_SUCCESS,
+            product_id=product_id,
+        )
+        for operation, operation_id, product_id in applied
+    ]
+    superseded_statuses = _superseded_statuses(superseded, _status_outcomes(statuses))
+    _record_statuses(statuses + superseded_statuses, active_logger)
+    for operation, operation_id, product_id in applied:
+        active_logger.info(
+            "Worker processed operation=%s operation_id=%s product_id=%s status=success",
+            operation,
+            operation_id,
+            product_id,
+        )
+
+    duration_seconds = time.perf_counter() - started
+    superseded_succeeded = sum(
+        1 for status in superseded_statuses if status["status"] == OPERATION_STATUS_SUCCESS
+    )
+    active_logger.info(
+        "Worker processed batch size=%s succeeded=%s failed=%s duration_ms=%s messages_per_second=%.1f",
+        len(messages),
+        len(applied) + superseded_succeeded,
+        len(failed_statuses) + len(superseded_statuses) - superseded_succeeded,
+        int(duration_seconds * 1000),
+        len(messages) / duration_seconds if duration_seconds > 0 else float(len(messages)),
+    )
+    return len(applied) + superseded_succeeded
+
+
+def default_consumer_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _ack_reserved(
+    consumer_id: str,
+    reserved: list[ReservedOperation],
+    logger: logging.Logger,
+) -> None:
+    try:
+        ack_product_operations(consumer_id, reserved)
+    except Exception as exc:
+        logger.warning(
+            "Worker could not ack messages consumer_id=%s count=%s error=%s",
+            consumer_id,
+            len(reserved),
+            exc,
+        )
+
+
+def _poll_next(
+    consumer_id: str,
+    batch_size: int,
+    timeout: int,
+    logger: logging.Logger,
+    coalesce: bool = True,
+) -> str:
+    try:
+        reserved = reserve_product_operations(consumer_id, batch_size, timeout=timeout)
     except RedisTimeoutError:
-        active_logger.debug("Worker queue poll timed out timeout=%s", timeout)
-        return False
+        logger.debug("Worker queue poll timed out timeout=%s", timeout)
+        return POLL_EMPTY
     except Exception as exc:
-        active_logger.exception("Worker could not read from queue error=%s", exc)
-        return False
+        logger.exception("Worker could not read from queue error=%s", exc)
+        return POLL_QUEUE_ERROR
 
-    if message is None:
-        return False
-    return process_message(message, logger=active_logger)
+    if not reserved:
+        return POLL_EMPTY
+
+    messages = [item.message for item in reserved]
+    try:
+        if batch_size > 1:
+            processed = process_batch(messages, logger=logger, coalesce=coalesce) > 0
+        else:
+            processed = process_message(messages[0], logger=logger)
+    except Exception:
+        logger.warning(
+            "Worker left messages unacked for redelivery consumer_id=%s count=%s",
+            consumer_id,
+            len(reserved),
+        )
+        return POLL_DB_ERROR
+
+    _ack_reserved(consumer_id, reserved, logger)
+    return POLL_PROCESSED if processed else POLL_FAILED
+
+
+def _requeue_expired(logger: logging.Logger) -> None:
+    try:
+        requeued = requeue_expired_operations()
+    except Exception as exc:
+        logger.warning("Worker could not requeue expired messages error=%s", exc)
+        return
+
+    if requeued:
+        logger.warning("Worker requeued expired in-flight messages count=%s", requeued)
+
+
+def process_next_message(
+    timeout: int = DEFAULT_POLL_TIMEOUT_SECONDS,
+    logger: logging.Logger | None = None,
+    consumer_id: str | None = None,
+) -> bool:
+    outcome = _poll_next(consumer_id or default_consumer_id(), 1, timeout, logger or LOGGER)
+    return outcome == POLL_PROCESSED
+
+
+def process_next_batch(
+    batch_size: int,
+    timeout: int = DEFAULT_POLL_TIMEOUT_SECONDS,
+    logger: logging.Logger | None = None,
+    consumer_id: str | None = None,
+) -> bool:
+    outcome = _poll_next(
+        consumer_id or default_consumer_id(),
+        batch_size,
+        timeout,
+        logger or LOGGER,
+    )
+    return outcome == POLL_PROCESSED
+
+
+def _reconnect_backoff_seconds(attempt: int, initial_seconds: float, max_seconds: float) -> float:
+    return min(max_seconds, initial_seconds * (2 ** min(attempt, 16)))
 
 
 def run_forever(
     *,
     poll_timeout: int = DEFAULT_POLL_TIMEOUT_SECONDS,
-    idle_sleep_seconds: float = IDLE_SLEEP_SECONDS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    backoff_initial_seconds: float = RECONNECT_BACKOFF_INITIAL_SECONDS,
+    backoff_max_seconds: float = RECONNECT_BACKOFF_MAX_SECONDS,
+    reaper_interval_seconds: float = REAPER_INTERVAL_SECONDS,
+    consumer_id: str | None = None,
+    stop_requested: Callable[[], bool] | None = None,
+    coalesce: bool = True,
 ) -> None:
-    while True:
-        processed = process_next_message(timeout=poll_timeout)
-        if not processed:
-            time.sleep(idle_sleep_seconds)
+    active_consumer_id = consumer_id or default_consumer_id()
+    consecutive_errors = 0
+    next_reap_at = 0.0
+    while stop_requested is None or not stop_requested():
+        if time.monotonic() >= next_reap_at:
+            _requeue_expired(LOGGER)
+            next_reap_at = time.monotonic() + reaper_interval_seconds
 
+        outcome = _poll_next(active_consumer_id, batch_size, poll_timeout, LOGGER, coalesce)
+        if outcome not in BACKOFF_OUTCOMES:
+            consecutive_errors = 0
+            continue
 
-def main() -> None:
-    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+        backoff_seconds = _reconnect_backoff_seconds(
+            consecutive_errors,
+            backoff_initial_seconds,
+            backoff_max_seconds,
+        )
+        consecutive_errors += 1
+        LOGGER.warning(
+            "Worker backing off after %s attempt=%s sleep_seconds=%.2f",
+            outcome,
+            consecutive_errors,
+            backoff_seconds,
+        )
+        time.sleep(backoff_seconds)
+
+
+def _install_stop_handlers() -> Callable[[], bool]:
+    state = {"stop": False}
+
+    def handle_signal(signum, _frame) -> None:
+        LOGGER.info("Worker received signal=%s pid=%s, stopping", signum, os.getpid())
+        state["stop"] = True
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+    return lambda: state["stop"]
+
+
+def run_worker(batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    stop_requested = _install_stop_handlers()
     app = create_app()
     with app.app_context():
         redis_status = check_redis()
         db_status = check_database()
         LOGGER.info(
-            "Worker bootstrap redis_ok=%s db_ok=%s",
+            "Worker bootstrap pid=%s redis_ok=%s db_ok=%s",
+            os.getpid(),
             redis_status["ok"],
             db_status["ok"],
         )
@@ -155,7 +709,131 @@ def main() -> None:
         if not db_status["ok"]:
             LOGGER.warning("Worker database check error=%s", db_status.get("error"))
 
-        run_forever()
+        run_forever(
+            batch_size=batch_size,
+            stop_requested=stop_requested,
+            coalesce=_parse_bool(os.getenv("WORKER_COALESCE_ENABLED"), default=True),
+        )
+
+
+def _spawn_worker_process(index: int, batch_size: int):
+    process = multiprocessing.get_context("fork").Process(
+        target=run_worker,
+        args=(batch_size,),
+        name=f"worker-{index}",
+    )
+    process.start()
+    LOGGER.info("Supervisor started worker index=%s pid=%s", index, process.pid)
+    return process
+
+
+def supervise(
+    concurrency: int,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    stop_requested: Callable[[], bool],
+    poll_interval_seconds: float = SUPERVISOR_POLL_INTERVAL_SECONDS,
+    shutdown_timeout_seconds: float = SUPERVISOR_SHUTDOWN_TIMEOUT_SECONDS,
+    fast_exit_seconds: float = SUPERVISOR_FAST_EXIT_SECONDS,
+    backoff_initial_seconds: float = RECONNECT_BACKOFF_INITIAL_SECONDS,
+    backoff_max_seconds: float = RECONNECT_BACKOFF_MAX_SECONDS,
+) -> None:
+    processes = {index: _spawn_worker_process(index, batch_size) for index in range(concurrency)}
+    started_at = {index: time.monotonic() for index in processes}
+    fast_exits = {index: 0 for index in processes}
+    restart_at: dict[int, float] = {}
+
+    while not stop_requested():
+        for index, process in list(processes.items()):
+            if process.is_alive():
+                continue
+
+            now = time.monotonic()
+            if index not in restart_at:
+                if now - started_at[index] < fast_exit_seconds:
+                    fast_exits[index] += 1
+                else:
+                    fast_exits[index] = 0
+                backoff_seconds = (
+                    _reconnect_backoff_seconds(
+                        fast_exits[index] - 2,
+                        backoff_initial_seconds,
+                        backoff_max_seconds,
+                    )
+                    if fast_exits[index] > 1
+                    else 0.0
+                )
+                restart_at[index] = now + backoff_seconds
+                LOGGER.warning(
+                    "Supervisor worker exited index=%s pid=%s exitcode=%s fast_exits=%s, "
+                    "restarting in %.2fs",
+                    index,
+                    process.pid,
+                    process.exitcode,
+                    fast_exits[index],
+                    backoff_seconds,
+                )
+            if now < restart_at[index]:
+                continue
+
+            del restart_at[index]
+            processes[index] = _spawn_worker_process(index, batch_size)
+            started_at[index] = time.monotonic()
+        time.sleep(poll_interval_seconds)
+
+    LOGGER.info("Supervisor stopping workers count=%s", len(processes))
+    for process in processes.values():
+        if process.is_alive():
+            process.terminate()
+
+    deadline = time.monotonic() + shutdown_timeout_seconds
+    for index, process in processes.items():
+        process.join(max(deadline - time.monotonic(), 0))
+        if process.is_alive():
+            LOGGER.warning(
+                "Supervisor killing worker index=%s pid=%s after shutdown timeout",
+                index,
+                process.pid,
+            )
+            process.kill()
+            process.join()
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Products queue worker")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=_read_positive_int(os.getenv("WORKER_CONCURRENCY"), DEFAULT_CONCURRENCY),
+        help="Number of worker processes forked by the supervisor",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=_read_positive_int(os.getenv("WORKER_BATCH_SIZE"), DEFAULT_BATCH_SIZE),
+        help="Maximum number of messages drained and committed per transaction",
+    )
+    args = parser.parse_args(argv)
+    if args.concurrency <= 0:
+        parser.error("--concurrency must be a positive integer")
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be a positive integer")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+    if args.concurrency == 1:
+        run_worker(batch_size=args.batch_size)
+        return
+
+    supervise(
+        args.concurrency,
+        batch_size=args.batch_size,
+        stop_requested=_install_stop_handlers(),
+    )
 
 
 if __name__ == "__main__":
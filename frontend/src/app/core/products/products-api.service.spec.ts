@@ -1,9 +1,9 @@
-import { provideHttpClient } from '@angular/common/http';
+import { HttpEventType, provideHttpClient } from '@angular/common/http';
 import { HttpTestingController, provideHttpClientTesting } from '@angular/common/http/testing';
 import { TestBed } from '@angular/core/testing';
 
 import { ProductsApiService } from './products-api.service';
-import { ProductUpsertPayload, ProductsListQuery } from './products.types';
+import { OperationEvent, ProductUpsertPayload, ProductsListQuery } from './products.types';
 
 describe('ProductsApiService', () => {
   let service: ProductsApiService;
@@ -92,4 +92,51 @@ describe('ProductsApiService', () => {
       product_id: 8,
     });
   });
+
+  it('should call GET /api/operations/:id', () => {
+    service.getOperationStatus('op-1').subscribe((status) => {
+      expect(status.status).toBe('success');
+      expect(status.product_id).toBe(7);
+    });
+
+    const request = httpMock.expectOne('/api/operations/op-1');
+    expect(request.request.method).toBe('GET');
+    request.flush({
+      operation_id: 'op-1',
+      operation: 'create',
+      status: 'success',
+      product_id: 7,
+      error: null,
+      updated_at: '2026-01-01T00:00:00Z',
+    });
+  });
+
+  it('should stream operation events from GET /api/operations/events', () => {
+    const events: OperationEvent[] = [];
+    service.watchOperations(['op-1', 'op-2']).subscribe((event) => events.push(event));
+
+    const request = httpMock.expectOne('/api/operations/events?ids=op-1,op-2');
+    expect(request.request.method).toBe('GET');
+    request.event({
+      type: HttpEventType.DownloadProgress,
+      loaded: 0,
+      partialText:
+        'event: operation\ndata: {"operation_id": "op-1", "status": "success"}\n\n: keep',
+    });
+    expect(events).toEqual([
+      { type: 'operation', status: { operation_id: 'op-1', status: 'success' } },
+    ]);
+
+    request.flush(
+      'event: operation\ndata: {"operation_id": "op-1", "status": "success"}\n\n' +
+        ': keepalive\n\n' +
+        'event: not_found\ndata: {"operation_id": "op-2"}\n\n' +
+        'event: done\ndata: {}\n\n',
+    );
+    expect(events).toEqual([
+      { type: 'operation', status: { operation_id: 'op-1', status: 'success' } },
+      { type: 'not_found', operationId: 'op-2' },
+      { type: 'done' },
+    ]);
+  });
 });
@@ -1,9 +1,11 @@
-import { HttpClient, HttpParams } from '@angular/common/http';
+import { HttpClient, HttpEventType, HttpParams } from '@angular/common/http';
 import { Injectable, inject } from '@angular/core';
-import { Observable, timeout } from 'rxjs';
-import { map } from 'rxjs/operators';
+import { EMPTY, Observable, defer, from, timeout } from 'rxjs';
+import { map, mergeMap } from 'rxjs/operators';
 
 import {
+  OperationEvent,
+  OperationStatus,
   ProductsListQuery,
   ProductsListResponse,
   ProductUpsertPayload,
@@ -11,6 +13,7 @@ import {
 } from './products.types';
 
 const PRODUCTS_API_BASE_PATH = '/api/products';
+const OPERATIONS_API_BASE_PATH = '/api/operations';
 const PRODUCTS_REQUEST_TIMEOUT_MS = 10000;
 
 @Injectable({ providedIn: 'root' })
@@ -64,6 +67,80 @@ export class ProductsApiService {
       .pipe(timeout(PRODUCTS_REQUEST_TIMEOUT_MS));
   }
 
+  getOperationStatus(operationId: string): Observable<OperationStatus> {
+    return this.http
+      .get<OperationStatus>(`${OPERATIONS_API_BASE_PATH}/${encodeURIComponent(operationId)}`)
+      .pipe(timeout(PRODUCTS_REQUEST_TIMEOUT_MS));
+  }
+
+  watchOperations(operationIds: string[]): Observable<OperationEvent> {
+    const params = new HttpParams().set('ids', operationIds.join(','));
+
+    return defer(() => {
+      let parsedLength = 0;
+
+      return this.http
+        .get(`${OPERATIONS_API_BASE_PATH}/events`, {
+          params,
+          observe: 'events',
+          reportProgress: true,
+          responseType: 'text',
+        })
+        .pipe(
+          mergeMap((event) => {
+            let text: string | null = null;
+            if (event.type === HttpEventType.DownloadProgress) {
+              text = event.partialText ?? '';
+            } else if (event.type === HttpEventType.Response) {
+              text = event.body ?? '';
+            }
+
+            const boundary = text === null ? -1 : text.lastIndexOf('\n\n');
+            if (text === null || boundary < parsedLength) {
+              return EMPTY;
+            }
+
+            const chunk = text.slice(parsedLength, boundary);
+            parsedLength = boundary + 2;
+            return from(this.parseOperationEvents(chunk));
+          }),
+        );
+    });
+  }
+
+  private parseOperationEvents(chunk: string): OperationEvent[] {
+    const events: OperationEvent[] = [];
+
+    for (const block of chunk.split('\n\n')) {
+      let eventName: string | null = null;
+      let data: string | null = null;
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) {
+          eventName = line.slice('event: '.length);
+        } else if (line.startsWith('data: ')) {
+          data = line.slice('data: '.length);
+        }
+      }
+
+      if (eventName === null || data === null) {
+        continue;
+      }
+
+      const payload = JSON.parse(data);
+      if (eventName === 'operation') {
+        events.push({ type: 'operation', status: payload as OperationStatus });
+      } else if (eventName === 'not_found') {
+        events.push({ type: 'not_found', operationId: String(payload.operation_id) });
+      } else if (eventName === 'timeout') {
+        events.push({ type: 'timeout', pendingIds: payload.pending ?? [] });
+      } else if (eventName === 'done') {
+        events.push({ type: 'done' });
+      }
+    }
+
+    return events;
+  }
+
   private readTotalCountHeader(headerValue: string | null, fallbackCount: number): number {
     if (headerValue === null) {
       return fallbackCount;
@@ -34,6 +34,23 @@ export interface QueuedProductOperationResponse {
   product_id?: number;
 }
 
+export type OperationStatusValue = 'queued' | 'success' | 'error';
+
+export interface OperationStatus {
+  operation_id: string;
+  operation: ProductOperationType;
+  status: OperationStatusValue;
+  product_id: number | null;
+  error: string | null;
+  updated_at: string;
+}
+
+export type OperationEvent =
+  | { type: 'operation'; status: OperationStatus }
+  | { type: 'not_found'; operationId: string }
+  | { type: 'timeout'; pendingIds: string[] }
+  | { type: 'done' };
+
 export interface ProductsQueryState {
   isLoading: boolean;
   isPolling: boolean;
@@ -10,7 +10,11 @@ import { vi } from 'vitest';
 
 import { AuthService } from '../../core/auth/auth.service';
 import { ProductsApiService } from '../../core/products/products-api.service';
-import { Product, ProductsListResponse } from '../../core/products/products.types';
+import {
+  OperationStatus,
+  Product,
+  ProductsListResponse,
+} from '../../core/products/products.types';
 import { ToastService } from '../../core/ui/toast.service';
 import { ProductsPage } from './products.page';
 
@@ -20,6 +24,8 @@ describe('ProductsPage', () => {
     createProduct: vi.fn(),
     updateProduct: vi.fn(),
     deleteProduct: vi.fn(),
+    getOperationStatus: vi.fn(),
+    watchOperations: vi.fn(),
   };
 
   const authServiceMock = {
@@ -61,6 +67,18 @@ describe('ProductsPage', () => {
     limit,
   });
 
+  const buildOperationStatus = (
+    status: OperationStatus['status'],
+    error: string | null = null,
+  ): OperationStatus => ({
+    operation_id: 'op-1',
+    operation: 'create',
+    status,
+    product_id: status === 'success' ? 2 : null,
+    error,
+    updated_at: '2026-01-01T00:00:00Z',
+  });
+
   const waitForTimers = async (): Promise<void> => {
     await Promise.resolve();
     await new Promise((resolve) => setTimeout(resolve, 0));
@@ -73,7 +91,13 @@ describe('ProductsPage', () => {
     productsApiServiceMock.createProduct.mockReset();
     productsApiServiceMock.updateProduct.mockReset();
     productsApiServiceMock.deleteProduct.mockReset();
+    productsApiServiceMock.getOperationStatus.mockReset();
+    productsApiServiceMock.watchOperations.mockReset();
     productsApiServiceMock.listProducts.mockReturnValue(of(buildListResponse([], 0)));
+    productsApiServiceMock.getOperationStatus.mockReturnValue(of(buildOperationStatus('success')));
+    productsApiServiceMock.watchOperations.mockReturnValue(
+      of({ type: 'operation', status: buildOperationStatus('success') }),
+    );
 
     authServiceMock.clearSession.mockReset();
     toastMock.success.mockReset();
@@ -161,9 +185,53 @@ describe('ProductsPage', () => {
     });
 
     await waitForTimers();
+    expect(productsApiServiceMock.watchOperations).toHaveBeenCalledWith(['op-create']);
+    expect(productsApiServiceMock.getOperationStatus).not.toHaveBeenCalled();
     expect(component.totalProducts()).toBe(1);
   });
 
+  it('should show an error toast when the queued operation fails', async () => {
+    productsApiServiceMock.listProducts
+      .mockReturnValueOnce(of(buildListResponse([existingProduct], 1)))
+      .mockReturnValueOnce(of(buildListResponse([], 0)));
+    productsApiServiceMock.updateProduct.mockReturnValue(
+      of({
+        status: 'queued',
+        operation: 'update',
+        operation_id: 'op-update',
+        product_id: existingProduct.id,
+      }),
+    );
+    productsApiServiceMock.watchOperations.mockReturnValue(
+      of({
+        type: 'operation',
+        status: {
+          ...buildOperationStatus('error', 'product_not_found'),
+          operation: 'update',
+        },
+      }),
+    );
+    dialogMock.open.mockReturnValue({
+      afterClosed: () =>
+        of({
+          nome: 'Mouse Pro',
+          marca: 'ACME',
+          valor: 100,
+        }),
+    });
+
+    const fixture = TestBed.createComponent(ProductsPage);
+    fixture.detectChanges();
+    const component = fixture.componentInstance;
+
+    component.onEditProduct(existingProduct);
+
+    await waitForTimers();
+    expect(toastMock.error).toHaveBeenCalledWith('Produto nao encontrado. A lista sera atualizada.');
+    expect(productsApiServiceMock.listProducts).toHaveBeenCalledTimes(2);
+    expect(component.queryState().isPolling).toBe(false);
+  });
+
   it('should open edit modal and call updateProduct', async () => {
     productsApiServiceMock.listProducts
       .mockReturnValueOnce(of(buildListResponse([existingProduct], 1)))
@@ -242,6 +310,40 @@ describe('ProductsPage', () => {
     expect(component.totalProducts()).toBe(0);
   });
 
+  it('should fall back to status polling when the event stream fails', async () => {
+    productsApiServiceMock.listProducts
+      .mockReturnValueOnce(of(buildListResponse([], 0)))
+      .mockReturnValueOnce(of(buildListResponse([existingProduct], 1)));
+    productsApiServiceMock.createProduct.mockReturnValue(
+      of({
+        status: 'queued',
+        operation: 'create',
+        operation_id: 'op-create',
+      }),
+    );
+    productsApiServiceMock.watchOperations.mockReturnValue(
+      throwError(() => new HttpErrorResponse({ status: 0 })),
+    );
+    dialogMock.open.mockReturnValue({
+      afterClosed: () =>
+        of({
+          nome: 'Mouse',
+          marca: 'ACME',
+          valor: 100,
+        }),
+    });
+
+    const fixture = TestBed.createComponent(ProductsPage);
+    fixture.detectChanges();
+    const component = fixture.componentInstance;
+
+    component.onOpenCreateDialog();
+
+    await waitForTimers();
+    expect(productsApiServiceMock.getOperationStatus).toHaveBeenCalledWith('op-create');
+    expect(component.totalProducts()).toBe(1);
+  });
+
   it('should fetch a new page when paginator changes', () => {
     productsApiServiceMock.listProducts
       .mockReturnValueOnce(of(buildListResponse([existingProduct], 30, 0, 10)))
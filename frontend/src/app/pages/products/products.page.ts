@@ -11,10 +11,10 @@ import { finalize, switchMap, take } from 'rxjs/operators';
 import { AuthService } from '../../core/auth/auth.service';
 import { ProductsApiService } from '../../core/products/products-api.service';
 import {
+  OperationStatus,
   Product,
   ProductOperationType,
   ProductsListQuery,
-  ProductsListResponse,
   ProductUpsertPayload,
   ProductsQueryState,
 } from '../../core/products/products.types';
@@ -46,14 +46,6 @@ interface PaginationState {
   total: number;
 }
 
-interface PollExpectation {
-  operation: ProductOperationType;
-  previousTotal: number;
-  query: ProductsListQuery;
-  payload?: ProductUpsertPayload;
-  productId?: number;
-}
-
 @Component({
   selector: 'app-products-page',
   imports: [MatCardModule, MatButtonModule, MatIconModule, ProductsTableComponent],
@@ -253,7 +245,6 @@ export class ProductsPage implements OnInit, OnDestroy {
   }
 
   private createProduct(payload: ProductUpsertPayload): void {
-    const previousTotal = this.pagination().total;
     this.isSaving.set(true);
 
     this.productsApiService
@@ -263,14 +254,9 @@ export class ProductsPage implements OnInit, OnDestroy {
         finalize(() => this.isSaving.set(false)),
       )
       .subscribe({
-        next: () => {
+        next: (response) => {
           this.toast.info('Solicitacao de criacao enviada. Atualizando lista...');
-          this.startPolling({
-            operation: 'create',
-            previousTotal,
-            query: this.currentQuery(),
-            payload,
-          });
+          this.watchOperation(response.operation_id);
         },
         error: (error: unknown) => {
           this.handleProductsError(error, 'create');
@@ -279,7 +265,6 @@ export class ProductsPage implements OnInit, OnDestroy {
   }
 
   private updateProduct(productId: number, payload: ProductUpsertPayload): void {
-    const previousTotal = this.pagination().total;
     this.isSaving.set(true);
 
     this.productsApiService
@@ -289,15 +274,9 @@ export class ProductsPage implements OnInit, OnDestroy {
         finalize(() => this.isSaving.set(false)),
       )
       .subscribe({
-        next: () => {
+        next: (response) => {
           this.toast.info('Solicitacao de atualizacao enviada. Atualizando lista...');
-          this.startPolling({
-            operation: 'update',
-            previousTotal,
-            query: this.currentQuery(),
-            productId,
-            payload,
-          });
+          this.watchOperation(response.operation_id);
         },
         error: (error: unknown) => {
           this.handleProductsError(error, 'update');
@@ -306,7 +285,6 @@ export class ProductsPage implements OnInit, OnDestroy {
   }
 
   private deleteProduct(product: Product): void {
-    const previousTotal = this.pagination().total;
     this.deletingProductId.set(product.id);
 
     this.productsApiService
@@ -316,14 +294,9 @@ export class ProductsPage implements OnInit, OnDestroy {
         finalize(() => this.deletingProductId.set(null)),
       )
       .subscribe({
-        next: () => {
+        next: (response) => {
           this.toast.info('Solicitacao de exclusao enviada. Atualizando lista...');
-          this.startPolling({
-            operation: 'delete',
-            previousTotal,
-            query: this.currentQuery(),
-            productId: product.id,
-          });
+          this.watchOperation(response.operation_id);
         },
         error: (error: unknown) => {
           this.handleProductsError(error, 'delete');
@@ -331,49 +304,59 @@ export class ProductsPage implements OnInit, OnDestroy {
       });
   }
 
-  private startPolling(expectation: PollExpectation): void {
+  private watchOperation(operationId: string): void {
+    this.stopPolling();
+    this.patchQueryState({ isPolling: true, errorMessage: null });
+
+    this.pollingSubscription = this.productsApiService.watchOperations([operationId]).subscribe({
+      next: (event) => {
+        if (event.type === 'operation') {
+          this.finishOperation(event.status);
+          return;
+        }
+
+        if (event.type === 'not_found') {
+          this.stopPolling();
+          this.fetchProducts(this.currentQuery(), false);
+          return;
+        }
+
+        if (event.type === 'timeout') {
+          this.stopPolling();
+          this.fetchProducts(this.currentQuery(), false);
+          this.toast.info('Operacao em processamento. Atualize novamente em alguns segundos.');
+        }
+      },
+      error: (error: unknown) => {
+        if (error instanceof HttpErrorResponse && error.status === 401) {
+          this.stopPolling();
+          this.handleProductsError(error, 'load');
+          return;
+        }
+        this.startPolling(operationId);
+      },
+    });
+  }
+
+  private startPolling(operationId: string): void {
     this.stopPolling();
     this.patchQueryState({ isPolling: true, errorMessage: null });
 
     let attempts = 0;
     this.pollingSubscription = timer(0, POLL_INTERVAL_MS)
-      .pipe(switchMap(() => this.productsApiService.listProducts(expectation.query)))
+      .pipe(switchMap(() => this.productsApiService.getOperationStatus(operationId)))
       .subscribe({
-        next: (response) => {
+        next: (operationStatus) => {
           attempts += 1;
 
-          const normalizedOffset = this.normalizeOffset(
-            response.total,
-            response.offset,
-            response.limit,
-          );
-          if (normalizedOffset !== response.offset) {
-            expectation.query = {
-              offset: normalizedOffset,
-              limit: response.limit,
-            };
-            this.patchPagination({
-              offset: normalizedOffset,
-              limit: response.limit,
-              total: response.total,
-            });
-            return;
-          }
-
-          this.products.set(response.items);
-          this.patchPagination({
-            offset: response.offset,
-            limit: response.limit,
-            total: response.total,
-          });
-
-          if (this.isExpectationSatisfied(expectation, response)) {
-            this.stopPolling();
+          if (operationStatus.status !== 'queued') {
+            this.finishOperation(operationStatus);
             return;
           }
 
           if (attempts >= POLL_MAX_ATTEMPTS) {
             this.stopPolling();
+            this.fetchProducts(this.currentQuery(), false);
             this.toast.info(
               'Operacao em processamento. Atualize novamente em alguns segundos.',
             );
@@ -381,11 +364,27 @@ export class ProductsPage implements OnInit, OnDestroy {
         },
         error: (error: unknown) => {
           this.stopPolling();
+          if (
+            error instanceof HttpErrorResponse &&
+            error.status === 404 &&
+            this.readApiError(error) === 'operation_not_found'
+          ) {
+            this.fetchProducts(this.currentQuery(), false);
+            return;
+          }
           this.handleProductsError(error, 'load');
         },
       });
   }
 
+  private finishOperation(operationStatus: OperationStatus): void {
+    this.stopPolling();
+    if (operationStatus.status === 'error') {
+      this.showFailedOperation(operationStatus);
+    }
+    this.fetchProducts(this.currentQuery(), false);
+  }
+
   private stopPolling(): void {
     if (this.pollingSubscription) {
       this.pollingSubscription.unsubscribe();
@@ -394,30 +393,6 @@ export class ProductsPage implements OnInit, OnDestroy {
     this.patchQueryState({ isPolling: false });
   }
 
-  private isExpectationSatisfied(
-    expectation: PollExpectation,
-    response: ProductsListResponse,
-  ): boolean {
-    if (expectation.operation === 'create') {
-      return response.total > expectation.previousTotal;
-    }
-
-    if (expectation.operation === 'delete') {
-      return response.total < expectation.previousTotal;
-    }
-
-    if (expectation.productId === undefined || !expectation.payload) {
-      return false;
-    }
-
-    const currentProduct = response.items.find((product) => product.id === expectation.productId);
-    if (!currentProduct) {
-      return false;
-    }
-
-    return this.isProductMatchingPayload(currentProduct, expectation.payload);
-  }
-
   private normalizeOffset(total: number, offset: number, limit: number): number {
     if (total <= 0) {
       return 0;
@@ -430,14 +405,6 @@ export class ProductsPage implements OnInit, OnDestroy {
     return Math.floor((total - 1) / limit) * limit;
   }
 
-  private isProductMatchingPayload(product: Product, payload: ProductUpsertPayload): boolean {
-    return (
-      product.nome.trim().toLowerCase() === payload.nome.trim().toLowerCase() &&
-      product.marca.trim().toLowerCase() === payload.marca.trim().toLowerCase() &&
-      Math.abs(product.valor - payload.valor) < 0.005
-    );
-  }
-
   private currentQuery(): ProductsListQuery {
     const pagination = this.pagination();
     return {
@@ -508,6 +475,14 @@ export class ProductsPage implements OnInit, OnDestroy {
     this.toast.error(message);
   }
 
+  private showFailedOperation(operationStatus: OperationStatus): void {
+    if (operationStatus.error === 'product_not_found') {
+      this.toast.error('Produto nao encontrado. A lista sera atualizada.');
+      return;
+    }
+    this.toast.error(this.getGenericErrorMessage(operationStatus.operation));
+  }
+
   private getGenericErrorMessage(operation: ProductOperationType | 'load'): string {
     if (operation === 'create') {
       return 'Nao foi possivel salvar o produto agora.';